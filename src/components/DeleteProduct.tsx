@@ -1,10 +1,11 @@
-import { useState, useEffect } from "react";
+import { useState } from "react";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Badge } from "@/components/ui/badge";
+import { Checkbox } from "@/components/ui/checkbox";
+import { useProducts } from "@/hooks/use-products";
 import { useToast } from "@/hooks/use-toast";
-import { getProducts, deleteProduct } from "@/lib/storage";
-import { Product } from "@/types/product";
+import { deleteProduct, deleteProducts } from "@/lib/storage";
 import { Trash2 } from "lucide-react";
 import {
   AlertDialog,
@@ -19,17 +20,10 @@ import {
 } from "@/components/ui/alert-dialog";
 
 const DeleteProduct = () => {
-  const [products, setProducts] = useState<Product[]>([]);
+  const products = useProducts();
+  const [selected, setSelected] = useState<Set<string>>(new Set());
   const { toast } = useToast();
 
-  useEffect(() => {
-    loadProducts();
-  }, []);
-
-  const loadProducts = () => {
-    setProducts(getProducts());
-  };
-
   const handleDelete = (id: string, name: string) => {
     const success = deleteProduct(id);
     
@@ -38,7 +32,6 @@ const DeleteProduct = () => {
         title: "Product deleted",
         description: `${name} has been removed from inventory`,
       });
-      loadProducts();
     } else {
       toast({
         title: "Error deleting product",
@@ -48,6 +41,35 @@ const DeleteProduct = () => {
     }
   };
 
+  const selectedProducts = products.filter((p) => selected.has(p.id));
+
+  const toggle = (id: string, checked: boolean) => {
+    const next = new Set(selected);
+    if (checked) next.add(id);
+    else next.delete(id);
+    setSelected(next);
+  };
+
+  const handleDeleteSelected = () => {
+    const { succeeded, failed } = deleteProducts(selectedProducts.map((p) => p.id));
+    setSelected(new Set());
+
+    if (succeeded.length > 0) {
+      toast({
+        title: "Products deleted",
+        description:
+          `${succeeded.length} product${succeeded.length === 1 ? " has" : "s have"} been removed from inventory` +
+          (failed.length > 0 ? `, ${failed.length} not found` : ""),
+      });
+    } else {
+      toast({
+        title: "Error deleting products",
+        description: "None of the selected products was found",
+        variant: "destructive",
+      });
+    }
+  };
+
   return (
     <Card>
       <CardHeader>
@@ -59,11 +81,47 @@ const DeleteProduct = () => {
           <p className="text-center text-muted-foreground py-8">No products in inventory</p>
         ) : (
           <div className="space-y-3">
+            <div className="flex items-center justify-between px-4">
+              <label className="flex items-center gap-2 text-sm">
+                <Checkbox
+                  checked={selectedProducts.length === products.length}
+                  onCheckedChange={(checked) => setSelected(new Set(checked === true ? products.map((p) => p.id) : []))}
+                  aria-label="Select all products"
+                />
+                Select all
+              </label>
+              <AlertDialog>
+                <AlertDialogTrigger asChild>
+                  <Button variant="destructive" size="sm" disabled={selectedProducts.length === 0}>
+                    <Trash2 className="h-4 w-4" />
+                    Delete selected ({selectedProducts.length})
+                  </Button>
+                </AlertDialogTrigger>
+                <AlertDialogContent>
+                  <AlertDialogHeader>
+                    <AlertDialogTitle>Are you sure?</AlertDialogTitle>
+                    <AlertDialogDescription>
+                      This will permanently delete {selectedProducts.length} selected products from your inventory.
+                      This action cannot be undone.
+                    </AlertDialogDescription>
+                  </AlertDialogHeader>
+                  <AlertDialogFooter>
+                    <AlertDialogCancel>Cancel</AlertDialogCancel>
+                    <AlertDialogAction onClick={handleDeleteSelected}>Delete</AlertDialogAction>
+                  </AlertDialogFooter>
+                </AlertDialogContent>
+              </AlertDialog>
+            </div>
             {products.map((product) => (
               <div
                 key={product.id}
-                className="flex items-center justify-between p-4 border rounded-lg hover:bg-accent/50 transition-colors"
+                className="flex items-center justify-between gap-4 p-4 border rounded-lg hover:bg-accent/50 transition-colors"
               >
+                <Checkbox
+                  checked={selected.has(product.id)}
+                  onCheckedChange={(checked) => toggle(product.id, checked === true)}
+                  aria-label={`Select ${product.name}`}
+                />
                 <div className="flex-1">
                   <div className="flex items-center gap-2 mb-1">
                     <h3 className="font-semibold">{product.name}</h3>
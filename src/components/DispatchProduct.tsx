@@ -1,33 +1,38 @@
-import { useState, useEffect } from "react";
+import { useState } from "react";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Badge } from "@/components/ui/badge";
+import { Checkbox } from "@/components/ui/checkbox";
+import { Input } from "@/components/ui/input";
+import { useProducts } from "@/hooks/use-products";
 import { useToast } from "@/hooks/use-toast";
-import { getProducts, dispatchProduct } from "@/lib/storage";
-import { Product } from "@/types/product";
+import { dispatchProduct, dispatchProducts } from "@/lib/storage";
 import { Truck } from "lucide-react";
 
+// A positive whole number, or null for anything else (an empty field, "2.5", "abc")
+const parseUnits = (value: string): number | null => {
+  const units = /^\s*\d+\s*$/.test(value) ? parseInt(value, 10) : 0;
+  return units > 0 ? units : null;
+};
+
 const DispatchProduct = () => {
-  const [products, setProducts] = useState<Product[]>([]);
+  const products = useProducts();
+  const [selected, setSelected] = useState<Set<string>>(new Set());
+  const [units, setUnits] = useState<Record<string, string>>({});
   const { toast } = useToast();
 
-  useEffect(() => {
-    loadProducts();
-  }, []);
-
-  const loadProducts = () => {
-    setProducts(getProducts());
-  };
+  const unitsFor = (id: string) => parseUnits(units[id] ?? "1");
 
   const handleDispatch = (id: string, name: string) => {
-    const success = dispatchProduct(id);
-    
+    const count = unitsFor(id);
+    if (count === null) return;
+    const success = dispatchProduct(id, count);
+
     if (success) {
       toast({
         title: "Product dispatched",
-        description: `${name} has been marked as dispatched`,
+        description: count === 1 ? `${name} has been marked as dispatched` : `${count} units of ${name} dispatched`,
       });
-      loadProducts();
     } else {
       toast({
         title: "Cannot dispatch",
@@ -38,6 +43,44 @@ const DispatchProduct = () => {
   };
 
   const availableProducts = products.filter((p) => p.quantity > 0);
+  const selectedProducts = availableProducts.filter((p) => selected.has(p.id));
+
+  const toggle = (id: string, checked: boolean) => {
+    const next = new Set(selected);
+    if (checked) next.add(id);
+    else next.delete(id);
+    setSelected(next);
+  };
+
+  const handleDispatchSelected = () => {
+    const invalid = selectedProducts.filter((p) => unitsFor(p.id) === null);
+    if (invalid.length > 0) {
+      toast({
+        title: "Cannot dispatch",
+        description: `Enter a whole number of units for ${invalid.map((p) => p.name).join(", ")}`,
+        variant: "destructive",
+      });
+      return;
+    }
+    const orders = selectedProducts.map((p) => ({ id: p.id, units: unitsFor(p.id)! }));
+    const { succeeded, failed } = dispatchProducts(orders);
+
+    if (succeeded.length > 0) {
+      toast({
+        title: "Products dispatched",
+        description:
+          `${succeeded.length} product${succeeded.length === 1 ? "" : "s"} dispatched` +
+          (failed.length > 0 ? `, ${failed.length} without enough stock` : ""),
+      });
+      setSelected(new Set(failed));
+    } else {
+      toast({
+        title: "Cannot dispatch",
+        description: "None of the selected products has enough stock",
+        variant: "destructive",
+      });
+    }
+  };
 
   return (
     <Card>
@@ -50,38 +93,81 @@ const DispatchProduct = () => {
           <p className="text-center text-muted-foreground py-8">No products available for dispatch</p>
         ) : (
           <div className="space-y-3">
-            {availableProducts.map((product) => (
-              <div
-                key={product.id}
-                className="flex items-center justify-between p-4 border rounded-lg hover:bg-accent/50 transition-colors"
-              >
-                <div className="flex-1">
-                  <div className="flex items-center gap-2 mb-1">
-                    <h3 className="font-semibold">{product.name}</h3>
-                    <Badge variant="secondary">{product.category}</Badge>
-                    {product.dispatched && (
-                      <Badge variant="default">
-                        <Truck className="h-3 w-3 mr-1" />
-                        Dispatched
-                      </Badge>
-                    )}
+            <div className="flex items-center justify-between px-4">
+              <label className="flex items-center gap-2 text-sm">
+                <Checkbox
+                  checked={selectedProducts.length === availableProducts.length}
+                  onCheckedChange={(checked) =>
+                    setSelected(new Set(checked === true ? availableProducts.map((p) => p.id) : []))
+                  }
+                  aria-label="Select all products"
+                />
+                Select all
+              </label>
+              <Button onClick={handleDispatchSelected} disabled={selectedProducts.length === 0} size="sm">
+                <Truck className="h-4 w-4" />
+                Dispatch selected ({selectedProducts.length})
+              </Button>
+            </div>
+            {availableProducts.map((product) => {
+              const invalidUnits = unitsFor(product.id) === null;
+              return (
+                <div
+                  key={product.id}
+                  className="flex items-center justify-between gap-4 p-4 border rounded-lg hover:bg-accent/50 transition-colors"
+                >
+                  <Checkbox
+                    checked={selected.has(product.id)}
+                    onCheckedChange={(checked) => toggle(product.id, checked === true)}
+                    aria-label={`Select ${product.name}`}
+                  />
+                  <div className="flex-1">
+                    <div className="flex items-center gap-2 mb-1">
+                      <h3 className="font-semibold">{product.name}</h3>
+                      <Badge variant="secondary">{product.category}</Badge>
+                      {product.dispatched && (
+                        <Badge variant="default">
+                          <Truck className="h-3 w-3 mr-1" />
+                          Dispatched
+                        </Badge>
+                      )}
+                    </div>
+                    <p className="text-sm text-muted-foreground">{product.description}</p>
+                    <div className="flex gap-4 mt-2 text-sm">
+                      <span className="text-muted-foreground">Price: ${product.price.toFixed(2)}</span>
+                      <span className="text-muted-foreground">Available: {product.quantity}</span>
+                    </div>
                   </div>
-                  <p className="text-sm text-muted-foreground">{product.description}</p>
-                  <div className="flex gap-4 mt-2 text-sm">
-                    <span className="text-muted-foreground">Price: ${product.price.toFixed(2)}</span>
-                    <span className="text-muted-foreground">Available: {product.quantity}</span>
+                  <div className="w-20">
+                    <Input
+                      type="number"
+                      min={1}
+                      step={1}
+                      max={product.quantity}
+                      value={units[product.id] ?? "1"}
+                      onChange={(e) => setUnits({ ...units, [product.id]: e.target.value })}
+                      aria-label={`Units of ${product.name}`}
+                      aria-invalid={invalidUnits}
+                      aria-describedby={invalidUnits ? `units-error-${product.id}` : undefined}
+                      className={invalidUnits ? "border-destructive" : ""}
+                    />
+                    {invalidUnits && (
+                      <p id={`units-error-${product.id}`} className="text-xs text-destructive mt-1">
+                        Whole number from 1
+                      </p>
+                    )}
                   </div>
+                  <Button
+                    onClick={() => handleDispatch(product.id, product.name)}
+                    disabled={product.quantity === 0 || invalidUnits}
+                    size="sm"
+                  >
+                    <Truck className="h-4 w-4" />
+                    Dispatch
+                  </Button>
                 </div>
-                <Button
-                  onClick={() => handleDispatch(product.id, product.name)}
-                  disabled={product.quantity === 0}
-                  size="sm"
-                >
-                  <Truck className="h-4 w-4" />
-                  Dispatch
-                </Button>
-              </div>
-            ))}
+              );
+            })}
           </div>
         )}
       </CardContent>
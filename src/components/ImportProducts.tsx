@@ -0,0 +1,107 @@
+import { useState } from "react";
+import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
+import { Input } from "@/components/ui/input";
+import { Label } from "@/components/ui/label";
+import { Button } from "@/components/ui/button";
+import { useToast } from "@/hooks/use-toast";
+import { catalogFormat, parseCatalog } from "@/lib/catalog-import";
+import { importProducts } from "@/lib/storage";
+import { Upload } from "lucide-react";
+
+const MAX_LISTED_ERRORS = 5;
+
+// Chrome and Safari name it QuotaExceededError, older Firefox NS_ERROR_DOM_QUOTA_REACHED
+const isQuotaError = (error: unknown) =>
+  error instanceof DOMException && (error.name === "QuotaExceededError" || error.name === "NS_ERROR_DOM_QUOTA_REACHED");
+
+const ImportProducts = () => {
+  const [file, setFile] = useState<File | null>(null);
+  // Bumped to remount the file input, which cannot be cleared through `value`
+  const [inputKey, setInputKey] = useState(0);
+  const [errors, setErrors] = useState<string[]>([]);
+  const { toast } = useToast();
+
+  const handleImport = async () => {
+    if (!file) return;
+    const format = catalogFormat(file.name);
+    if (!format) {
+      toast({
+        title: "Unsupported file",
+        description: "Choose a .json or .csv file",
+        variant: "destructive",
+      });
+      return;
+    }
+
+    const { products, errors } = parseCatalog(await file.text(), format);
+    setErrors(errors);
+    if (products.length === 0) {
+      toast({
+        title: "Nothing to import",
+        description: errors[0] ?? "The file has no products",
+        variant: "destructive",
+      });
+      return;
+    }
+
+    try {
+      importProducts(products);
+      // A second click must not add the same catalog again
+      setFile(null);
+      setInputKey((key) => key + 1);
+      toast({
+        title: "Catalog imported",
+        description:
+          `${products.length} product${products.length === 1 ? "" : "s"} added to inventory` +
+          (errors.length > 0 ? `, ${errors.length} rows skipped` : ""),
+      });
+    } catch (error) {
+      toast({
+        title: "Error importing catalog",
+        description: isQuotaError(error) ? "The catalog does not fit in storage" : (error as Error).message,
+        variant: "destructive",
+      });
+    }
+  };
+
+  return (
+    <Card>
+      <CardHeader>
+        <CardTitle>Import Catalog</CardTitle>
+        <CardDescription>Add many products at once from a JSON or CSV file</CardDescription>
+      </CardHeader>
+      <CardContent className="space-y-4">
+        <div className="space-y-2">
+          <Label htmlFor="import-file">Catalog file</Label>
+          <Input
+            key={inputKey}
+            id="import-file"
+            type="file"
+            accept=".json,.csv"
+            onChange={(e) => {
+              setFile(e.target.files?.[0] ?? null);
+              setErrors([]);
+            }}
+          />
+          <p className="text-sm text-muted-foreground">
+            CSV needs a header row with name, price, quantity and category; description and dispatched are optional.
+          </p>
+        </div>
+        {errors.length > 0 && (
+          <ul className="text-sm text-destructive space-y-1" aria-label="Skipped rows">
+            {errors.slice(0, MAX_LISTED_ERRORS).map((error) => (
+              <li key={error}>{error}</li>
+            ))}
+            {errors.length > MAX_LISTED_ERRORS && <li>and {errors.length - MAX_LISTED_ERRORS} more</li>}
+          </ul>
+        )}
+        <Button type="button" onClick={handleImport} disabled={!file} className="w-full">
+          <Upload className="h-4 w-4" />
+          Import
+        </Button>
+      </CardContent>
+    </Card>
+  );
+};
+
+export default ImportProducts;
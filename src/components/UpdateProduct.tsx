@@ -1,16 +1,20 @@
-import { useState, useEffect } from "react";
+import { useState } from "react";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { Input } from "@/components/ui/input";
 import { Label } from "@/components/ui/label";
 import { Button } from "@/components/ui/button";
 import { Textarea } from "@/components/ui/textarea";
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select";
+import { useProductSearch } from "@/hooks/use-products";
 import { useToast } from "@/hooks/use-toast";
-import { getProducts, updateProduct } from "@/lib/storage";
-import { Product } from "@/types/product";
+import { updateProduct } from "@/lib/storage";
+
+// A dropdown of thousands of items is unusable; the search narrows it down instead
+const MAX_OPTIONS = 50;
 
 const UpdateProduct = () => {
-  const [products, setProducts] = useState<Product[]>([]);
+  const [search, setSearch] = useState("");
+  const { products, results } = useProductSearch({ text: search });
   const [selectedId, setSelectedId] = useState<string>("");
   const [formData, setFormData] = useState({
     name: "",
@@ -21,14 +25,6 @@ const UpdateProduct = () => {
   });
   const { toast } = useToast();
 
-  useEffect(() => {
-    loadProducts();
-  }, []);
-
-  const loadProducts = () => {
-    setProducts(getProducts());
-  };
-
   const handleSelectProduct = (productId: string) => {
     setSelectedId(productId);
     const product = products.find((p) => p.id === productId);
@@ -43,6 +39,11 @@ const UpdateProduct = () => {
     }
   };
 
+  // Keep the chosen product in the list so the trigger can still show its name
+  const selected = selectedId ? products.find((p) => p.id === selectedId) : undefined;
+  const options = results.slice(0, MAX_OPTIONS);
+  if (selected && !options.includes(selected)) options.unshift(selected);
+
   const handleSubmit = (e: React.FormEvent) => {
     e.preventDefault();
     
@@ -68,7 +69,6 @@ const UpdateProduct = () => {
         title: "Product updated successfully",
         description: `${formData.name} has been updated`,
       });
-      loadProducts();
     } else {
       toast({
         title: "Error updating product",
@@ -88,18 +88,31 @@ const UpdateProduct = () => {
         <form onSubmit={handleSubmit} className="space-y-4">
           <div className="space-y-2">
             <Label htmlFor="select-product">Select Product</Label>
+            <Input
+              id="product-search"
+              type="search"
+              value={search}
+              onChange={(e) => setSearch(e.target.value)}
+              placeholder="Search by name or description"
+              aria-label="Search products"
+            />
             <Select value={selectedId} onValueChange={handleSelectProduct}>
               <SelectTrigger>
                 <SelectValue placeholder="Choose a product" />
               </SelectTrigger>
               <SelectContent>
-                {products.map((product) => (
+                {options.map((product) => (
                   <SelectItem key={product.id} value={product.id}>
                     {product.name} - {product.category}
                   </SelectItem>
                 ))}
               </SelectContent>
             </Select>
+            {results.length > MAX_OPTIONS && (
+              <p className="text-sm text-muted-foreground">
+                Showing {MAX_OPTIONS} of {results.length} matches; refine the search to find others
+              </p>
+            )}
           </div>
 
           {selectedId && (
@@ -1,26 +1,96 @@
-import { useState, useEffect } from "react";
+import { useDeferredValue, useLayoutEffect, useMemo, useState } from "react";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from "@/components/ui/table";
 import { Badge } from "@/components/ui/badge";
-import { getProducts } from "@/lib/storage";
+import { Input } from "@/components/ui/input";
+import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select";
+import { useProductSearch } from "@/hooks/use-products";
+import { useVirtualRows } from "@/hooks/use-virtual-rows";
+import { LOW_STOCK_THRESHOLD, ProductQuery, SortKey, StockStatus } from "@/lib/product-index";
 import { Product } from "@/types/product";
-import { Package, TrendingUp, DollarSign, AlertCircle } from "lucide-react";
+import { Package, TrendingUp, DollarSign, AlertCircle, ArrowDown, ArrowUp, ArrowUpDown, Search } from "lucide-react";
 
-const ViewInventory = () => {
-  const [products, setProducts] = useState<Product[]>([]);
+const ROW_HEIGHT = 53;
+const ALL = "*";
+const STOCK_FILTERS: { value: StockStatus; label: string }[] = [
+  { value: "in-stock", label: "In stock" },
+  { value: "low-stock", label: "Low stock" },
+  { value: "out-of-stock", label: "Out of stock" },
+];
+
+type Sort = ProductQuery["sort"];
 
-  useEffect(() => {
-    loadProducts();
-  }, []);
+const summarize = (products: Product[]) => {
+  let totalValue = 0;
+  let lowStock = 0;
+  let dispatched = 0;
+  const categories = new Set<string>();
+  for (const p of products) {
+    totalValue += p.price * p.quantity;
+    if (p.quantity < LOW_STOCK_THRESHOLD) lowStock++;
+    if (p.dispatched) dispatched++;
+    categories.add(p.category);
+  }
+  return { totalValue, lowStock, dispatched, categories: [...categories].sort() };
+};
 
-  const loadProducts = () => {
-    setProducts(getProducts());
-  };
+// Clicking a column sorts ascending, then descending, then back to catalog order
+const nextSort = (sort: Sort, key: SortKey): Sort => {
+  if (sort?.key !== key) return { key, direction: "asc" };
+  return sort.direction === "asc" ? { key, direction: "desc" } : undefined;
+};
+
+interface SortableHeadProps {
+  column: SortKey;
+  label: string;
+  sort: Sort;
+  onSort: (column: SortKey) => void;
+}
+
+const SortableHead = ({ column, label, sort, onSort }: SortableHeadProps) => {
+  const direction = sort?.key === column ? sort.direction : undefined;
+  const Icon = direction === "asc" ? ArrowUp : direction === "desc" ? ArrowDown : ArrowUpDown;
+  return (
+    <TableHead aria-sort={direction === "asc" ? "ascending" : direction === "desc" ? "descending" : "none"}>
+      <button
+        type="button"
+        onClick={() => onSort(column)}
+        className="inline-flex items-center gap-1 hover:text-foreground"
+      >
+        {label}
+        <Icon className="h-3 w-3" />
+      </button>
+    </TableHead>
+  );
+};
+
+const ViewInventory = () => {
+  const [text, setText] = useState("");
+  const [category, setCategory] = useState(ALL);
+  const [stock, setStock] = useState(ALL);
+  const [sort, setSort] = useState<Sort>(undefined);
+  // Typing stays responsive; the table catches up with the latest text
+  const deferredText = useDeferredValue(text);
+  const { products, results } = useProductSearch({
+    text: deferredText,
+    category: category === ALL ? undefined : category,
+    stock: stock === ALL ? undefined : (stock as StockStatus),
+    sort,
+  });
 
   const totalProducts = products.length;
-  const totalValue = products.reduce((sum, p) => sum + (p.price * p.quantity), 0);
-  const lowStock = products.filter((p) => p.quantity < 10).length;
-  const dispatched = products.filter((p) => p.dispatched).length;
+  const { totalValue, lowStock, dispatched, categories } = useMemo(() => summarize(products), [products]);
+  const { containerRef, onScroll, scrollToTop, start, end, paddingTop, paddingBottom } = useVirtualRows({
+    count: results.length,
+    rowHeight: ROW_HEIGHT,
+  });
+
+  const handleSort = (key: SortKey) => setSort(nextSort(sort, key));
+
+  // A new result list starts at its first row, before the stale window is painted
+  useLayoutEffect(() => {
+    scrollToTop();
+  }, [scrollToTop, deferredText, category, stock, sort]);
 
   return (
     <div className="space-y-6">
@@ -72,43 +142,100 @@ const ViewInventory = () => {
           {products.length === 0 ? (
             <p className="text-center text-muted-foreground py-8">No products in inventory. Add your first product to get started.</p>
           ) : (
-            <div className="overflow-x-auto">
-              <Table>
-                <TableHeader>
-                  <TableRow>
-                    <TableHead>Name</TableHead>
-                    <TableHead>Description</TableHead>
-                    <TableHead>Price</TableHead>
-                    <TableHead>Quantity</TableHead>
-                    <TableHead>Category</TableHead>
-                    <TableHead>Status</TableHead>
-                  </TableRow>
-                </TableHeader>
-                <TableBody>
-                  {products.map((product) => (
-                    <TableRow key={product.id}>
-                      <TableCell className="font-medium">{product.name}</TableCell>
-                      <TableCell className="max-w-xs truncate">{product.description}</TableCell>
-                      <TableCell>${product.price.toFixed(2)}</TableCell>
-                      <TableCell>
-                        <span className={product.quantity < 10 ? "text-destructive font-semibold" : ""}>
-                          {product.quantity}
-                        </span>
-                      </TableCell>
-                      <TableCell>
-                        <Badge variant="secondary">{product.category}</Badge>
-                      </TableCell>
-                      <TableCell>
-                        {product.dispatched ? (
-                          <Badge variant="default">Dispatched</Badge>
-                        ) : (
-                          <Badge variant="outline">In Stock</Badge>
-                        )}
-                      </TableCell>
-                    </TableRow>
-                  ))}
-                </TableBody>
-              </Table>
+            <div className="space-y-4">
+              <div className="flex flex-col md:flex-row gap-3">
+                <div className="relative flex-1">
+                  <Search className="absolute left-3 top-3 h-4 w-4 text-muted-foreground" />
+                  <Input
+                    type="search"
+                    value={text}
+                    onChange={(e) => setText(e.target.value)}
+                    placeholder="Search by name or description"
+                    aria-label="Search products"
+                    className="pl-9"
+                  />
+                </div>
+                <Select value={category} onValueChange={setCategory}>
+                  <SelectTrigger className="md:w-48" aria-label="Filter by category">
+                    <SelectValue />
+                  </SelectTrigger>
+                  <SelectContent>
+                    <SelectItem value={ALL}>All categories</SelectItem>
+                    {categories.map((name) => (
+                      <SelectItem key={name} value={name}>
+                        {name}
+                      </SelectItem>
+                    ))}
+                  </SelectContent>
+                </Select>
+                <Select value={stock} onValueChange={setStock}>
+                  <SelectTrigger className="md:w-40" aria-label="Filter by stock">
+                    <SelectValue />
+                  </SelectTrigger>
+                  <SelectContent>
+                    <SelectItem value={ALL}>All stock</SelectItem>
+                    {STOCK_FILTERS.map(({ value, label }) => (
+                      <SelectItem key={value} value={value}>
+                        {label}
+                      </SelectItem>
+                    ))}
+                  </SelectContent>
+                </Select>
+              </div>
+              <p role="status" aria-busy={text !== deferredText} className="text-sm text-muted-foreground">
+                Showing {results.length} of {totalProducts} products
+              </p>
+              {results.length === 0 ? (
+                <p className="text-center text-muted-foreground py-8">No products match your search.</p>
+              ) : (
+                <div
+                  ref={containerRef}
+                  onScroll={onScroll}
+                  role="region"
+                  aria-label="Inventory table"
+                  tabIndex={0}
+                  className="max-h-[600px] overflow-auto"
+                >
+                  <Table>
+                    <TableHeader>
+                      <TableRow>
+                        <SortableHead column="name" label="Name" sort={sort} onSort={handleSort} />
+                        <TableHead>Description</TableHead>
+                        <SortableHead column="price" label="Price" sort={sort} onSort={handleSort} />
+                        <SortableHead column="quantity" label="Quantity" sort={sort} onSort={handleSort} />
+                        <SortableHead column="category" label="Category" sort={sort} onSort={handleSort} />
+                        <TableHead>Status</TableHead>
+                      </TableRow>
+                    </TableHeader>
+                    <TableBody>
+                      {paddingTop > 0 && <tr aria-hidden="true" style={{ height: paddingTop }} />}
+                      {results.slice(start, end).map((product) => (
+                        <TableRow key={product.id} style={{ height: ROW_HEIGHT }}>
+                          <TableCell className="font-medium whitespace-nowrap">{product.name}</TableCell>
+                          <TableCell className="max-w-xs truncate">{product.description}</TableCell>
+                          <TableCell>${product.price.toFixed(2)}</TableCell>
+                          <TableCell>
+                            <span className={product.quantity < LOW_STOCK_THRESHOLD ? "text-destructive font-semibold" : ""}>
+                              {product.quantity}
+                            </span>
+                          </TableCell>
+                          <TableCell>
+                            <Badge variant="secondary">{product.category}</Badge>
+                          </TableCell>
+                          <TableCell>
+                            {product.dispatched ? (
+                              <Badge variant="default">Dispatched</Badge>
+                            ) : (
+                              <Badge variant="outline">In Stock</Badge>
+                            )}
+                          </TableCell>
+                        </TableRow>
+                      ))}
+                      {paddingBottom > 0 && <tr aria-hidden="true" style={{ height: paddingBottom }} />}
+                    </TableBody>
+                  </Table>
+                </div>
+              )}
             </div>
           )}
         </CardContent>
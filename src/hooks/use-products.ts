@@ -0,0 +1,33 @@
+import * as React from "react";
+import { ProductQuery } from "@/lib/product-index";
+import { productStore } from "@/lib/storage";
+import { Product } from "@/types/product";
+
+/**
+ * The current catalog. Components re-render when it changes, in this tab or
+ * another one, and share one snapshot instead of each reading storage.
+ */
+export function useProducts(): Product[] {
+  return React.useSyncExternalStore(productStore.subscribe, productStore.getSnapshot);
+}
+
+/**
+ * The products matching `query`, answered from the store's search index and
+ * recomputed only when the query or the catalog changes. An empty query is
+ * the catalog itself; the index is built once the browser is idle.
+ */
+export function useProductSearch({ text, category, stock, sort }: ProductQuery) {
+  const products = useProducts();
+  const sortKey = sort?.key;
+  const direction = sort?.direction ?? "asc";
+  const results = React.useMemo(() => {
+    if (!text && !category && !stock && !sortKey) return products;
+    // The index is patched in place, so `products` only marks that it has changed
+    return productStore.index().query({ text, category, stock, sort: sortKey && { key: sortKey, direction } });
+  }, [products, text, category, stock, sortKey, direction]);
+
+  React.useEffect(() => {
+    if (typeof requestIdleCallback === "function") requestIdleCallback(() => productStore.index());
+  }, []);
+  return { products, results };
+}
@@ -0,0 +1,62 @@
+import * as React from "react";
+
+interface VirtualRowsOptions {
+  count: number;
+  rowHeight: number;
+  overscan?: number;
+  /** Height to assume before the scroll container has been measured. */
+  initialHeight?: number;
+}
+
+/**
+ * Windowing for fixed-height rows inside a scrollable container. Attach
+ * `containerRef` and `onScroll` to the container, render rows `start` to
+ * `end` (exclusive) and pad above and below with `paddingTop`/`paddingBottom`
+ * so the scrollbar still reflects the full list. Call `scrollToTop` when the
+ * rows are replaced by a different list.
+ */
+export function useVirtualRows({ count, rowHeight, overscan = 8, initialHeight = 600 }: VirtualRowsOptions) {
+  const containerRef = React.useRef<HTMLDivElement>(null);
+  const frame = React.useRef<number>();
+  const [scrollTop, setScrollTop] = React.useState(0);
+  const [height, setHeight] = React.useState(initialHeight);
+  const hasRows = count > 0;
+
+  React.useEffect(() => {
+    const container = containerRef.current;
+    if (!container) return;
+    const observer = new ResizeObserver(() => setHeight(container.clientHeight));
+    observer.observe(container);
+    setHeight(container.clientHeight);
+    return () => observer.disconnect();
+  }, [hasRows]);
+
+  React.useEffect(() => () => cancelAnimationFrame(frame.current ?? 0), []);
+
+  // Coalesce scroll events so the window moves at most once per frame
+  const onScroll = React.useCallback(() => {
+    if (frame.current) return;
+    frame.current = requestAnimationFrame(() => {
+      frame.current = undefined;
+      if (containerRef.current) setScrollTop(containerRef.current.scrollTop);
+    });
+  }, []);
+
+  const scrollToTop = React.useCallback(() => {
+    if (containerRef.current) containerRef.current.scrollTop = 0;
+    setScrollTop(0);
+  }, []);
+
+  const start = Math.max(0, Math.floor(scrollTop / rowHeight) - overscan);
+  const end = Math.min(count, Math.ceil((scrollTop + height) / rowHeight) + overscan);
+
+  return {
+    containerRef,
+    onScroll,
+    scrollToTop,
+    start,
+    end,
+    paddingTop: start * rowHeight,
+    paddingBottom: Math.max(0, (count - end) * rowHeight),
+  };
+}
@@ -0,0 +1,129 @@
+import { NewProduct } from "@/types/product";
+
+export type CatalogFormat = "json" | "csv";
+
+export interface ParsedCatalog {
+  products: NewProduct[];
+  /** One message per rejected row, e.g. `Row 4: price must be a number >= 0`. */
+  errors: string[];
+}
+
+const CSV_COLUMNS = ["name", "description", "price", "quantity", "category", "dispatched"] as const;
+const OPTIONAL_CSV_COLUMNS: readonly string[] = ["description", "dispatched"];
+
+export const catalogFormat = (fileName: string): CatalogFormat | null => {
+  const extension = fileName.toLowerCase().split(".").pop();
+  return extension === "json" || extension === "csv" ? extension : null;
+};
+
+export interface CsvRow {
+  /** Line of the file the row starts on (1-based); a quoted field may continue over later lines. */
+  line: number;
+  cells: string[];
+}
+
+/** RFC 4180 rows: quoted fields may contain commas, newlines and doubled quotes. Blank rows are dropped. */
+export const parseCsvRows = (text: string): CsvRow[] => {
+  const rows: CsvRow[] = [];
+  let row: string[] = [];
+  let field = "";
+  let quoted = false;
+  let line = 1;
+  let rowLine = 1;
+  for (let i = 0; i < text.length; i++) {
+    const char = text[i];
+    if (quoted) {
+      if (char === '"' && text[i + 1] === '"') {
+        field += '"';
+        i++;
+      } else if (char === '"') {
+        quoted = false;
+      } else {
+        field += char;
+        // A \r\n inside the field is counted at its \n
+        if (char === "\n" || (char === "\r" && text[i + 1] !== "\n")) line++;
+      }
+    } else if (char === '"') {
+      quoted = true;
+    } else if (char === ",") {
+      row.push(field);
+      field = "";
+    } else if (char === "\n" || char === "\r") {
+      if (char === "\r" && text[i + 1] === "\n") i++;
+      row.push(field);
+      rows.push({ line: rowLine, cells: row });
+      row = [];
+      field = "";
+      line++;
+      rowLine = line;
+    } else {
+      field += char;
+    }
+  }
+  if (field !== "" || row.length > 0) {
+    row.push(field);
+    rows.push({ line: rowLine, cells: row });
+  }
+  return rows.filter(({ cells }) => cells.some((cell) => cell.trim() !== ""));
+};
+
+const toProduct = (record: Record<string, unknown>): NewProduct | string => {
+  const text = (key: string) => (record[key] === undefined || record[key] === null ? "" : String(record[key]).trim());
+  const price = Number(text("price"));
+  const quantity = Number(text("quantity"));
+  const dispatched = text("dispatched").toLowerCase();
+  if (!text("name")) return "name is required";
+  if (!text("category")) return "category is required";
+  if (text("price") === "" || !Number.isFinite(price) || price < 0) return "price must be a number >= 0";
+  if (text("quantity") === "" || !Number.isInteger(quantity) || quantity < 0) {
+    return "quantity must be a whole number >= 0";
+  }
+  if (!["", "true", "false", "yes", "no", "1", "0"].includes(dispatched)) return "dispatched must be true or false";
+  return {
+    name: text("name"),
+    description: text("description"),
+    price,
+    quantity,
+    category: text("category"),
+    dispatched: ["true", "yes", "1"].includes(dispatched),
+  };
+};
+
+/**
+ * Parse an exported catalog: a JSON array of products, or CSV with a header
+ * row naming (in any order) the `CSV_COLUMNS`; `description` and
+ * `dispatched` may be left out. Ids and creation times in the file are
+ * ignored, since imported products are added as new ones.
+ */
+export const parseCatalog = (text: string, format: CatalogFormat): ParsedCatalog => {
+  let records: Record<string, unknown>[];
+  // The row number reported for each record: its position in JSON, its first line in CSV
+  let rowNumbers: number[];
+  if (format === "json") {
+    let data: unknown;
+    try {
+      data = JSON.parse(text);
+    } catch (error) {
+      return { products: [], errors: [`Invalid JSON: ${(error as Error).message}`] };
+    }
+    if (!Array.isArray(data)) return { products: [], errors: ["Expected a JSON array of products"] };
+    records = data.map((item) => (item && typeof item === "object" ? (item as Record<string, unknown>) : {}));
+    rowNumbers = records.map((_, i) => i + 1);
+  } else {
+    const [header, ...rows] = parseCsvRows(text);
+    const columns = (header?.cells ?? []).map((cell) => cell.trim().toLowerCase());
+    const missing = CSV_COLUMNS.filter((column) => !OPTIONAL_CSV_COLUMNS.includes(column) && !columns.includes(column));
+    if (missing.length > 0) return { products: [], errors: [`Missing CSV columns: ${missing.join(", ")}`] };
+    records = rows.map(({ cells }) => Object.fromEntries(columns.map((column, i) => [column, cells[i]])));
+    rowNumbers = rows.map(({ line }) => line);
+  }
+
+  const products: NewProduct[] = [];
+  const errors: string[] = [];
+  records.forEach((record, i) => {
+    const result = toProduct(record);
+    if (typeof result === "string") errors.push(`Row ${rowNumbers[i]}: ${result}`);
+    else products.push(result);
+  });
+  return { products, errors };
+};
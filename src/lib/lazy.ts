@@ -0,0 +1,38 @@
+import { lazy, type ComponentType, type LazyExoticComponent } from "react";
+
+export type PrefetchableComponent<T extends ComponentType> = LazyExoticComponent<T> & {
+  /** Start loading the component's chunk without rendering it. */
+  prefetch: () => Promise<unknown>;
+};
+
+/**
+ * `React.lazy` with a `prefetch()` that can be called ahead of the first
+ * render (on hover, focus or idle). The chunk is requested at most once; a
+ * failed request is retried on the next call.
+ */
+export function lazyWithPrefetch<T extends ComponentType>(
+  factory: () => Promise<{ default: T }>,
+): PrefetchableComponent<T> {
+  let pending: Promise<{ default: T }> | undefined;
+  const load = () => {
+    pending ??= factory().catch((error) => {
+      pending = undefined;
+      throw error;
+    });
+    return pending;
+  };
+  const component = lazy(load) as PrefetchableComponent<T>;
+  component.prefetch = () => load().catch(() => undefined);
+  return component;
+}
+
+/** Prefetch `components` once the browser is idle; returns a function that cancels it. */
+export function prefetchWhenIdle(components: { prefetch: () => Promise<unknown> }[]) {
+  const run = () => components.forEach((component) => component.prefetch());
+  if ("requestIdleCallback" in window) {
+    const handle = window.requestIdleCallback(run, { timeout: 2000 });
+    return () => window.cancelIdleCallback(handle);
+  }
+  const handle = setTimeout(run, 200);
+  return () => clearTimeout(handle);
+}
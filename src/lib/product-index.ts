@@ -0,0 +1,239 @@
+import { Product } from "@/types/product";
+
+/** Quantities below this count as low stock (highlighted in the inventory). */
+export const LOW_STOCK_THRESHOLD = 10;
+
+export type StockStatus = "in-stock" | "low-stock" | "out-of-stock";
+export type SortKey = "name" | "price" | "quantity" | "category";
+export type SortDirection = "asc" | "desc";
+
+export interface ProductQuery {
+  /** Words to find in the name or description; each must start a word of the product. */
+  text?: string;
+  category?: string;
+  stock?: StockStatus;
+  /** Catalog order when left out. */
+  sort?: { key: SortKey; direction: SortDirection };
+}
+
+// Past this many changes in one batch, rebuilding a sort order beats patching it
+const MAX_PATCHED_CHANGES = 1000;
+// More new words than this (an import, say) are merged by re-sorting instead of one insert each
+const MAX_INSERTED_TOKENS = 64;
+// Removed slots are compacted away once they outnumber the live ones (and this many)
+const MIN_COMPACTED_SLOTS = 256;
+
+const collator = new Intl.Collator(undefined, { sensitivity: "base", numeric: true });
+
+const byId = (a: Product, b: Product) => (a.id < b.id ? -1 : a.id > b.id ? 1 : 0);
+
+// Ties fall back to the id, so every product has exactly one place in an order
+const COMPARATORS: Record<SortKey, (a: Product, b: Product) => number> = {
+  name: (a, b) => collator.compare(a.name, b.name) || byId(a, b),
+  price: (a, b) => a.price - b.price || byId(a, b),
+  quantity: (a, b) => a.quantity - b.quantity || byId(a, b),
+  category: (a, b) => collator.compare(a.category, b.category) || collator.compare(a.name, b.name) || byId(a, b),
+};
+
+export const stockStatus = (product: Product): StockStatus =>
+  product.quantity === 0 ? "out-of-stock" : product.quantity < LOW_STOCK_THRESHOLD ? "low-stock" : "in-stock";
+
+export const tokenize = (text: string): string[] => text.toLowerCase().split(/[^\p{L}\p{N}]+/u).filter(Boolean);
+
+const productTokens = (product: Product) => [...new Set(tokenize(`${product.name} ${product.description}`))];
+
+/** First index in `0..length` for which `before` is false, given it is true up to some point and false after. */
+const lowerBound = (length: number, before: (index: number) => boolean) => {
+  let low = 0;
+  let high = length;
+  while (low < high) {
+    const mid = (low + high) >>> 1;
+    if (before(mid)) low = mid + 1;
+    else high = mid;
+  }
+  return low;
+};
+
+const addTo = <K>(map: Map<K, Set<number>>, key: K, slot: number) => {
+  const slots = map.get(key);
+  if (slots) slots.add(slot);
+  else map.set(key, new Set([slot]));
+};
+
+/**
+ * Inverted indexes over the catalog for the inventory search: products by
+ * word, category and stock status, plus one sorted order of the catalog per
+ * sort key, built the first time that key is used. `ProductStore` patches the
+ * index with each change, so a query never rescans every product's text.
+ *
+ * Each product has a numbered slot. Slots are handed out in catalog order, so
+ * walking them in order is walking the catalog, and a query marks matching
+ * slots in a typed array instead of intersecting sets of ids. A removed
+ * product leaves its slot empty; once empty slots outnumber live ones the
+ * index renumbers the live products, so add/delete cycles do not grow it.
+ */
+export class ProductIndex {
+  private slots: (Product | undefined)[] = [];
+  private slotOf = new Map<string, number>();
+  private tokensOf: string[][] = [];
+  private slotsByToken = new Map<string, Set<number>>();
+  // Every word ever seen, sorted so a prefix is a contiguous range; words no product uses any more map to empty sets
+  private sortedTokens: string[] = [];
+  private newTokens: string[] = [];
+  private slotsByCategory = new Map<string, Set<number>>();
+  private slotsByStock = new Map<StockStatus, Set<number>>();
+  private orders = new Map<SortKey, number[]>();
+
+  constructor(products: Product[]) {
+    products.forEach((product) => this.link(this.slots.length, product));
+  }
+
+  get size() {
+    return this.slotOf.size;
+  }
+
+  get(id: string): Product | undefined {
+    const slot = this.slotOf.get(id);
+    return slot === undefined ? undefined : this.slots[slot];
+  }
+
+  upsert(product: Product) {
+    const slot = this.slotOf.get(product.id) ?? this.slots.length;
+    const previous = this.slots[slot];
+    if (previous) {
+      this.orders.forEach((order, key) => order.splice(this.position(order, key, previous), 1));
+      this.unlink(slot, previous);
+    }
+    this.link(slot, product);
+    this.orders.forEach((order, key) => order.splice(this.position(order, key, product), 0, slot));
+  }
+
+  remove(id: string) {
+    const slot = this.slotOf.get(id);
+    const previous = slot === undefined ? undefined : this.slots[slot];
+    if (slot === undefined || !previous) return;
+    this.orders.forEach((order, key) => order.splice(this.position(order, key, previous), 1));
+    this.unlink(slot, previous);
+    this.slots[slot] = undefined;
+    this.slotOf.delete(id);
+    const empty = this.slots.length - this.slotOf.size;
+    if (empty > MIN_COMPACTED_SLOTS && empty > this.slotOf.size) this.compact();
+  }
+
+  batch(upserts: Product[], removed: string[]) {
+    const keys = upserts.length + removed.length > MAX_PATCHED_CHANGES ? [...this.orders.keys()] : [];
+    keys.forEach((key) => this.orders.delete(key));
+    upserts.forEach((product) => this.upsert(product));
+    removed.forEach((id) => this.remove(id));
+    keys.forEach((key) => this.order(key));
+  }
+
+  /** Products matching every part of `query`, in the requested order. */
+  query({ text = "", category, stock, sort }: ProductQuery): Product[] {
+    // Each filter is a union of slot sets: one set per word with the typed prefix, or a single category/stock set
+    const filters = tokenize(text).map((word) => this.slotsWithPrefix(word));
+    if (category) filters.push([this.slotsByCategory.get(category) ?? new Set()]);
+    if (stock) filters.push([this.slotsByStock.get(stock) ?? new Set()]);
+
+    // matched[slot] counts the filters passed so far; a slot only advances from the previous filter's count
+    const matched = new Uint16Array(filters.length > 0 ? this.slots.length : 0);
+    filters.forEach((sets, i) => {
+      for (const slots of sets) {
+        for (const slot of slots) if (matched[slot] === i) matched[slot] = i + 1;
+      }
+    });
+    const keep = (slot: number) => filters.length === 0 || matched[slot] === filters.length;
+
+    const results: Product[] = [];
+    if (!sort) {
+      this.slots.forEach((product, slot) => {
+        if (product && keep(slot)) results.push(product);
+      });
+      return results;
+    }
+    for (const slot of this.order(sort.key)) {
+      if (keep(slot)) results.push(this.slots[slot]!);
+    }
+    return sort.direction === "desc" ? results.reverse() : results;
+  }
+
+  private link(slot: number, product: Product) {
+    const tokens = productTokens(product);
+    this.slots[slot] = product;
+    this.slotOf.set(product.id, slot);
+    this.tokensOf[slot] = tokens;
+    for (const token of tokens) {
+      if (!this.slotsByToken.has(token)) this.newTokens.push(token);
+      addTo(this.slotsByToken, token, slot);
+    }
+    addTo(this.slotsByCategory, product.category, slot);
+    addTo(this.slotsByStock, stockStatus(product), slot);
+  }
+
+  private unlink(slot: number, product: Product) {
+    for (const token of this.tokensOf[slot]) this.slotsByToken.get(token)!.delete(slot);
+    this.tokensOf[slot] = [];
+    this.slotsByCategory.get(product.category)!.delete(slot);
+    this.slotsByStock.get(stockStatus(product))!.delete(slot);
+  }
+
+  /** Renumber the live products from 0 in catalog order, dropping empty slots and words no product uses. */
+  private compact() {
+    const renumbered = new Int32Array(this.slots.length);
+    const products: Product[] = [];
+    this.slots.forEach((product, slot) => {
+      if (product) renumbered[slot] = products.push(product) - 1;
+    });
+    const orders = this.orders;
+    this.slots = [];
+    this.slotOf = new Map();
+    this.tokensOf = [];
+    this.slotsByToken = new Map();
+    this.sortedTokens = [];
+    this.newTokens = [];
+    this.slotsByCategory = new Map();
+    this.slotsByStock = new Map();
+    products.forEach((product, slot) => this.link(slot, product));
+    // Renumbering keeps every order sorted, so there is nothing to re-sort
+    this.orders = new Map([...orders].map(([key, order]) => [key, order.map((slot) => renumbered[slot])]));
+  }
+
+  /** Where `product` belongs in `order`, a list of slots sorted by `key`. */
+  private position(order: number[], key: SortKey, product: Product) {
+    const compare = COMPARATORS[key];
+    return lowerBound(order.length, (i) => compare(this.slots[order[i]]!, product) < 0);
+  }
+
+  private order(key: SortKey) {
+    let order = this.orders.get(key);
+    if (!order) {
+      const compare = COMPARATORS[key];
+      order = [...this.slotOf.values()].sort((a, b) => compare(this.slots[a]!, this.slots[b]!));
+      this.orders.set(key, order);
+    }
+    return order;
+  }
+
+  private tokens() {
+    if (this.newTokens.length > MAX_INSERTED_TOKENS) {
+      this.sortedTokens = this.sortedTokens.concat(this.newTokens).sort();
+    } else {
+      for (const token of this.newTokens) {
+        const tokens = this.sortedTokens;
+        tokens.splice(lowerBound(tokens.length, (i) => tokens[i] < token), 0, token);
+      }
+    }
+    this.newTokens = [];
+    return this.sortedTokens;
+  }
+
+  /** The slot sets of every word starting with `prefix`. */
+  private slotsWithPrefix(prefix: string) {
+    const tokens = this.tokens();
+    const sets: Set<number>[] = [];
+    for (let i = lowerBound(tokens.length, (i) => tokens[i] < prefix); tokens[i]?.startsWith(prefix); i++) {
+      sets.push(this.slotsByToken.get(tokens[i])!);
+    }
+    return sets;
+  }
+}
@@ -0,0 +1,143 @@
+import { ProductIndex } from "@/lib/product-index";
+import { Product } from "@/types/product";
+
+export const CHANNEL_NAME = "ecommerce_products";
+
+/** One change to the catalog, as applied locally and sent to the other tabs. */
+export type ProductChange =
+  | { type: "upsert"; product: Product }
+  | { type: "remove"; id: string }
+  /** The result of a bulk operation, applied in one pass. */
+  | { type: "batch"; upserts: Product[]; removed: string[] }
+  /** Anything bigger (a new catalog, a backend switch): reload from storage. */
+  | { type: "reset" };
+
+interface StoreOptions {
+  /** Read the whole catalog; only called for the first snapshot and after a reset. */
+  load: () => Product[];
+  /** Whether other tabs see this tab's catalog (false for the in-memory backend). */
+  shared: () => boolean;
+  /** localStorage keys that belong to the catalog, for the `storage` event fallback. */
+  isCatalogKey: (key: string) => boolean;
+  /** localStorage keys whose change invalidates the whole catalog (e.g. the backend choice). */
+  isResetKey: (key: string) => boolean;
+}
+
+/**
+ * The catalog as an immutable snapshot shared by every component of a tab
+ * (see `useProducts`). Writes in this tab are applied as per-product changes
+ * and posted on a BroadcastChannel, so other tabs of the app patch their own
+ * snapshot instead of reparsing the stored catalog. Browsers without
+ * BroadcastChannel fall back to `storage` events and reload the catalog.
+ * The search index (see `index`) is patched with the same changes.
+ */
+export class ProductStore {
+  private products: Product[] | null = null;
+  private positions = new Map<string, number>();
+  private searchIndex: ProductIndex | null = null;
+  private listeners = new Set<() => void>();
+  private channel: BroadcastChannel | null = null;
+  private connected = false;
+  // A reset can arrive before the other tab's write is visible here; reload again on its storage event
+  private resetPending = false;
+
+  constructor(private options: StoreOptions) {}
+
+  subscribe = (listener: () => void) => {
+    this.connect();
+    this.listeners.add(listener);
+    return () => {
+      this.listeners.delete(listener);
+    };
+  };
+
+  getSnapshot = (): Product[] => {
+    if (!this.products) this.replace(this.options.load());
+    return this.products!;
+  };
+
+  /** The search index over the current snapshot, built on first use. */
+  index = (): ProductIndex => {
+    if (!this.searchIndex) this.searchIndex = new ProductIndex(this.getSnapshot());
+    return this.searchIndex;
+  };
+
+  /** Apply a change made in this tab and tell the other tabs about it. */
+  publish(change: ProductChange) {
+    this.connect();
+    this.apply(change);
+    if (this.options.shared()) this.channel?.postMessage(change);
+  }
+
+  private connect() {
+    if (this.connected) return;
+    this.connected = true;
+    if (typeof BroadcastChannel !== "undefined") {
+      this.channel = new BroadcastChannel(CHANNEL_NAME);
+      this.channel.onmessage = (event: MessageEvent<ProductChange>) => {
+        if (!this.options.shared()) return;
+        if (event.data.type === "reset") this.resetPending = true;
+        this.apply(event.data);
+      };
+    }
+    window.addEventListener("storage", (event) => {
+      if (event.key === null || this.options.isResetKey(event.key)) {
+        this.apply({ type: "reset" });
+      } else if (this.options.isCatalogKey(event.key) && (!this.channel || this.resetPending)) {
+        this.resetPending = false;
+        this.apply({ type: "reset" });
+      }
+    });
+  }
+
+  private replace(products: Product[]) {
+    this.products = products;
+    this.positions = new Map(products.map((product, index) => [product.id, index]));
+  }
+
+  private apply(change: ProductChange) {
+    if (change.type === "reset") {
+      this.products = null;
+      this.searchIndex = null;
+    } else if (this.products) {
+      const products = this.products;
+      if (change.type === "upsert") {
+        const index = this.positions.get(change.product.id);
+        if (index === undefined) {
+          this.positions.set(change.product.id, products.length);
+          this.products = [...products, change.product];
+        } else {
+          this.products = products.slice();
+          this.products[index] = change.product;
+        }
+        this.searchIndex?.upsert(change.product);
+      } else if (change.type === "batch") {
+        const next = products.slice();
+        for (const product of change.upserts) {
+          const index = this.positions.get(product.id);
+          if (index === undefined) {
+            this.positions.set(product.id, next.length);
+            next.push(product);
+          } else {
+            next[index] = product;
+          }
+        }
+        if (change.removed.length > 0) {
+          const removed = new Set(change.removed);
+          this.replace(next.filter((product) => !removed.has(product.id)));
+        } else {
+          this.products = next;
+        }
+        this.searchIndex?.batch(change.upserts, change.removed);
+      } else {
+        const index = this.positions.get(change.id);
+        if (index === undefined) return;
+        this.replace([...products.slice(0, index), ...products.slice(index + 1)]);
+        this.searchIndex?.remove(change.id);
+      }
+    } else {
+      return; // nothing loaded yet, so nothing to patch
+    }
+    this.listeners.forEach((listener) => listener());
+  }
+}
@@ -0,0 +1,435 @@
+import { Product } from "@/types/product";
+
+export const PRODUCTS_KEY = "ecommerce_products";
+export const BACKEND_KEY = "ecommerce_storage_backend";
+
+const META_KEY = `${PRODUCTS_KEY}:meta`;
+const CHUNK_PREFIX = `${PRODUCTS_KEY}:chunk:`;
+const ITEM_PREFIX = `${PRODUCTS_KEY}:item:`;
+const CHUNK_SIZE = 1000;
+
+export type StorageBackendName = "blob" | "keyed" | "memory";
+
+export interface ProductBackend {
+  readonly name: StorageBackendName;
+  list(): Product[];
+  replaceAll(products: Product[]): void;
+  insert(product: Product): void;
+  /** Apply `change` to one product; returns false if it is missing or `change` returns null. */
+  modify(id: string, change: (product: Product) => Product | null): boolean;
+  remove(id: string): boolean;
+  /** `insert` for many products with one read and one write of the catalog. */
+  insertMany(products: Product[]): void;
+  /** `modify` for every product in `ids` in one pass; returns the products that changed. */
+  modifyMany(ids: Iterable<string>, change: (product: Product) => Product | null): Product[];
+  /** `remove` for every product in `ids` in one pass; returns the ids that were removed. */
+  removeMany(ids: Iterable<string>): string[];
+}
+
+/** The original format: the whole catalog as one JSON array under `ecommerce_products`. */
+export const blobBackend: ProductBackend = {
+  name: "blob",
+
+  list() {
+    const data = localStorage.getItem(PRODUCTS_KEY);
+    return data ? JSON.parse(data) : [];
+  },
+
+  replaceAll(products) {
+    localStorage.setItem(PRODUCTS_KEY, JSON.stringify(products));
+  },
+
+  insert(product) {
+    const products = this.list();
+    products.push(product);
+    this.replaceAll(products);
+  },
+
+  modify(id, change) {
+    const products = this.list();
+    const index = products.findIndex((p) => p.id === id);
+    if (index === -1) return false;
+    const next = change(products[index]);
+    if (!next) return false;
+    products[index] = next;
+    this.replaceAll(products);
+    return true;
+  },
+
+  remove(id) {
+    const products = this.list();
+    const filtered = products.filter((p) => p.id !== id);
+    if (filtered.length === products.length) return false;
+    this.replaceAll(filtered);
+    return true;
+  },
+
+  insertMany(products) {
+    if (products.length === 0) return;
+    this.replaceAll([...this.list(), ...products]);
+  },
+
+  modifyMany(ids, change) {
+    const wanted = new Set(ids);
+    const products = this.list();
+    const changed: Product[] = [];
+    for (let index = 0; index < products.length; index++) {
+      if (!wanted.has(products[index].id)) continue;
+      const next = change(products[index]);
+      if (!next) continue;
+      products[index] = next;
+      changed.push(next);
+    }
+    if (changed.length > 0) this.replaceAll(products);
+    return changed;
+  },
+
+  removeMany(ids) {
+    const wanted = new Set(ids);
+    const products = this.list();
+    const removed: string[] = [];
+    const kept = products.filter((p) => {
+      if (!wanted.has(p.id)) return true;
+      removed.push(p.id);
+      return false;
+    });
+    if (removed.length > 0) this.replaceAll(kept);
+    return removed;
+  },
+};
+
+interface KeyedIndex {
+  chunks: string[][];
+  chunkOf: Map<string, number>;
+}
+
+const itemKey = (id: string) => `${ITEM_PREFIX}${id}`;
+const chunkKey = (chunk: number) => `${CHUNK_PREFIX}${chunk}`;
+
+/**
+ * One localStorage key per product plus an id index split into chunks of
+ * CHUNK_SIZE ids. Updates and dispatches rewrite a single product; adds and
+ * deletes also rewrite the one index chunk they touch.
+ */
+class KeyedBackend implements ProductBackend {
+  readonly name = "keyed";
+  private index: KeyedIndex | null = null;
+  private records = new Map<string, Product>();
+
+  constructor() {
+    // Another tab wrote to storage: drop whatever it may have made stale
+    window.addEventListener("storage", (event) => {
+      if (event.key === null || event.key === META_KEY || event.key.startsWith(CHUNK_PREFIX)) {
+        this.invalidate();
+      } else if (event.key.startsWith(ITEM_PREFIX)) {
+        this.records.delete(event.key.slice(ITEM_PREFIX.length));
+      }
+    });
+  }
+
+  invalidate() {
+    this.index = null;
+    this.records.clear();
+  }
+
+  hasData() {
+    return localStorage.getItem(META_KEY) !== null;
+  }
+
+  private loadIndex(): KeyedIndex {
+    if (this.index) return this.index;
+    const meta: { chunks: number } = JSON.parse(localStorage.getItem(META_KEY) ?? "null") ?? { chunks: 0 };
+    const chunks: string[][] = [];
+    const chunkOf = new Map<string, number>();
+    for (let chunk = 0; chunk < meta.chunks; chunk++) {
+      const ids: string[] = JSON.parse(localStorage.getItem(chunkKey(chunk)) ?? "[]");
+      ids.forEach((id) => chunkOf.set(id, chunk));
+      chunks.push(ids);
+    }
+    this.index = { chunks, chunkOf };
+    return this.index;
+  }
+
+  private read(id: string): Product | undefined {
+    const cached = this.records.get(id);
+    if (cached) return cached;
+    const data = localStorage.getItem(itemKey(id));
+    if (!data) return undefined;
+    const product: Product = JSON.parse(data);
+    this.records.set(id, product);
+    return product;
+  }
+
+  private write(product: Product) {
+    localStorage.setItem(itemKey(product.id), JSON.stringify(product));
+    this.records.set(product.id, product);
+  }
+
+  private writeChunk(index: KeyedIndex, chunk: number) {
+    localStorage.setItem(chunkKey(chunk), JSON.stringify(index.chunks[chunk]));
+  }
+
+  list() {
+    const index = this.loadIndex();
+    const products: Product[] = [];
+    for (const ids of index.chunks) {
+      for (const id of ids) {
+        const product = this.read(id);
+        if (product) products.push(product);
+      }
+    }
+    return products;
+  }
+
+  replaceAll(products: Product[]) {
+    const previous = new Map(this.ownedKeys().map((key) => [key, localStorage.getItem(key)!]));
+    const chunks: string[][] = [];
+    for (let start = 0; start < products.length; start += CHUNK_SIZE) {
+      chunks.push(products.slice(start, start + CHUNK_SIZE).map((p) => p.id));
+    }
+    const written = new Set<string>();
+    try {
+      products.forEach((product) => {
+        this.write(product);
+        written.add(itemKey(product.id));
+      });
+      chunks.forEach((ids, chunk) => {
+        localStorage.setItem(chunkKey(chunk), JSON.stringify(ids));
+        written.add(chunkKey(chunk));
+      });
+      localStorage.setItem(META_KEY, JSON.stringify({ chunks: chunks.length }));
+      written.add(META_KEY);
+    } catch (error) {
+      // Out of quota partway through: keep the previous catalog, as the blob backend does
+      this.ownedKeys().forEach((key) => {
+        if (!previous.has(key)) localStorage.removeItem(key);
+      });
+      previous.forEach((value, key) => {
+        if (written.has(key)) localStorage.setItem(key, value);
+      });
+      this.invalidate();
+      throw error;
+    }
+    // The new catalog is complete; only now drop the products and chunks it no longer lists
+    this.ownedKeys().forEach((key) => {
+      if (!written.has(key)) localStorage.removeItem(key);
+    });
+    this.invalidate();
+  }
+
+  insert(product: Product) {
+    this.insertMany([product]);
+  }
+
+  insertMany(products: Product[]) {
+    const index = this.loadIndex();
+    const lengthsBefore = index.chunks.map((ids) => ids.length);
+    const touched = new Set<number>();
+    const written: string[] = [];
+    try {
+      for (const product of products) {
+        let chunk = index.chunks.length - 1;
+        if (chunk < 0 || index.chunks[chunk].length >= CHUNK_SIZE) {
+          index.chunks.push([]);
+          chunk += 1;
+        }
+        this.write(product);
+        written.push(product.id);
+        index.chunks[chunk].push(product.id);
+        index.chunkOf.set(product.id, chunk);
+        touched.add(chunk);
+      }
+      touched.forEach((chunk) => this.writeChunk(index, chunk));
+      // The chunk count goes last: until it is written, new chunks are not part of the catalog
+      if (index.chunks.length !== lengthsBefore.length) {
+        localStorage.setItem(META_KEY, JSON.stringify({ chunks: index.chunks.length }));
+      }
+    } catch (error) {
+      // Out of quota partway through: put back the catalog as it was, leaving no stray keys behind
+      written.forEach((id) => localStorage.removeItem(itemKey(id)));
+      touched.forEach((chunk) => {
+        if (chunk >= lengthsBefore.length) localStorage.removeItem(chunkKey(chunk));
+        else localStorage.setItem(chunkKey(chunk), JSON.stringify(index.chunks[chunk].slice(0, lengthsBefore[chunk])));
+      });
+      this.invalidate();
+      throw error;
+    }
+  }
+
+  modify(id: string, change: (product: Product) => Product | null) {
+    const current = this.read(id);
+    if (!current) return false;
+    const next = change(current);
+    if (!next) return false;
+    this.write(next);
+    return true;
+  }
+
+  modifyMany(ids: Iterable<string>, change: (product: Product) => Product | null) {
+    const changed: Product[] = [];
+    for (const id of new Set(ids)) {
+      const current = this.read(id);
+      const next = current && change(current);
+      if (!next) continue;
+      this.write(next);
+      changed.push(next);
+    }
+    return changed;
+  }
+
+  remove(id: string) {
+    return this.removeMany([id]).length > 0;
+  }
+
+  removeMany(ids: Iterable<string>) {
+    const index = this.loadIndex();
+    const byChunk = new Map<number, Set<string>>();
+    for (const id of ids) {
+      const chunk = index.chunkOf.get(id);
+      if (chunk === undefined) continue;
+      if (!byChunk.has(chunk)) byChunk.set(chunk, new Set());
+      byChunk.get(chunk)!.add(id);
+    }
+    const removed: string[] = [];
+    byChunk.forEach((gone, chunk) => {
+      index.chunks[chunk] = index.chunks[chunk].filter((other) => !gone.has(other));
+      this.writeChunk(index, chunk);
+      gone.forEach((id) => {
+        index.chunkOf.delete(id);
+        localStorage.removeItem(itemKey(id));
+        this.records.delete(id);
+        removed.push(id);
+      });
+    });
+    return removed;
+  }
+
+  private ownedKeys() {
+    const owned: string[] = [];
+    for (let i = 0; i < localStorage.length; i++) {
+      const key = localStorage.key(i);
+      if (key && (key === META_KEY || key.startsWith(CHUNK_PREFIX) || key.startsWith(ITEM_PREFIX))) {
+        owned.push(key);
+      }
+    }
+    return owned;
+  }
+
+  /** Remove every key this backend owns. */
+  clear() {
+    this.ownedKeys().forEach((key) => localStorage.removeItem(key));
+    this.invalidate();
+  }
+}
+
+export const keyedBackend = new KeyedBackend();
+
+/**
+ * Keeps the catalog in page memory and never writes to localStorage, so it is
+ * not bound by the storage quota. Meant for load and performance testing:
+ * it starts from the persisted catalog and its changes are lost on reload.
+ */
+class MemoryBackend implements ProductBackend {
+  readonly name = "memory";
+  private products: Product[] = [];
+
+  list() {
+    return [...this.products];
+  }
+
+  replaceAll(products: Product[]) {
+    this.products = [...products];
+  }
+
+  insert(product: Product) {
+    this.products.push(product);
+  }
+
+  modify(id: string, change: (product: Product) => Product | null) {
+    const index = this.products.findIndex((p) => p.id === id);
+    if (index === -1) return false;
+    const next = change(this.products[index]);
+    if (!next) return false;
+    this.products[index] = next;
+    return true;
+  }
+
+  remove(id: string) {
+    const index = this.products.findIndex((p) => p.id === id);
+    if (index === -1) return false;
+    this.products.splice(index, 1);
+    return true;
+  }
+
+  insertMany(products: Product[]) {
+    this.products = this.products.concat(products);
+  }
+
+  modifyMany(ids: Iterable<string>, change: (product: Product) => Product | null) {
+    const wanted = new Set(ids);
+    const changed: Product[] = [];
+    this.products.forEach((product, index) => {
+      if (!wanted.has(product.id)) return;
+      const next = change(product);
+      if (!next) return;
+      this.products[index] = next;
+      changed.push(next);
+    });
+    return changed;
+  }
+
+  removeMany(ids: Iterable<string>) {
+    const wanted = new Set(ids);
+    const removed: string[] = [];
+    this.products = this.products.filter((p) => {
+      if (!wanted.has(p.id)) return true;
+      removed.push(p.id);
+      return false;
+    });
+    return removed;
+  }
+}
+
+export const memoryBackend = new MemoryBackend();
+
+/**
+ * Move the catalog into `target`'s format and remove the other format's keys.
+ * A legacy `ecommerce_products` blob always wins over keyed data, so catalogs
+ * written by older builds (or seeded by tests) are picked up. Returns false,
+ * leaving storage untouched, if the target format does not fit. The memory
+ * backend gets a copy of the persisted catalog and leaves storage alone.
+ */
+export const migrateTo = (target: StorageBackendName): boolean => {
+  const hasBlob = localStorage.getItem(PRODUCTS_KEY) !== null;
+  if (target === "memory") {
+    memoryBackend.replaceAll(hasBlob ? blobBackend.list() : keyedBackend.list());
+    return true;
+  }
+  try {
+    if (target === "keyed" && hasBlob) {
+      keyedBackend.replaceAll(blobBackend.list());
+      localStorage.removeItem(PRODUCTS_KEY);
+    } else if (target === "blob") {
+      if (!hasBlob && keyedBackend.hasData()) blobBackend.replaceAll(keyedBackend.list());
+      // Stale keyed data (the blob already won) would resurface on a later switch to keyed
+      keyedBackend.clear();
+    }
+    return true;
+  } catch (error) {
+    if (target === "keyed" && hasBlob) keyedBackend.clear();
+    if (target === "blob" && !hasBlob) localStorage.removeItem(PRODUCTS_KEY);
+    return false;
+  }
+};
+
+export const backends: Record<StorageBackendName, ProductBackend> = {
+  blob: blobBackend,
+  keyed: keyedBackend,
+  memory: memoryBackend,
+};
+
+/** The backend named by the runtime override, the build setting, or "blob". */
+export const configuredBackend = (): StorageBackendName => {
+  const requested = localStorage.getItem(BACKEND_KEY) ?? import.meta.env.VITE_STORAGE_BACKEND;
+  return requested === "keyed" || requested === "memory" ? requested : "blob";
+};
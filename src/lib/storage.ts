@@ -1,51 +1,152 @@
-import { Product } from "@/types/product";
+import { NewProduct, Product } from "@/types/product";
+import {
+  BACKEND_KEY,
+  PRODUCTS_KEY,
+  ProductBackend,
+  StorageBackendName,
+  backends,
+  blobBackend,
+  configuredBackend,
+  migrateTo,
+} from "@/lib/storage-backends";
+import { ProductStore } from "@/lib/product-store";
 
-const PRODUCTS_KEY = "ecommerce_products";
+export type { StorageBackendName } from "@/lib/storage-backends";
+
+let active: ProductBackend | null = null;
+
+const backend = (): ProductBackend => {
+  if (!active) {
+    const name = configuredBackend();
+    // Fall back to the blob format if the catalog cannot be migrated (e.g. quota)
+    active = name !== "blob" && migrateTo(name) ? backends[name] : blobBackend;
+    if (active === blobBackend) migrateTo("blob");
+  }
+  return active;
+};
+
+// Another tab switched (and migrated) the backend: resolve it again before the store reloads the catalog.
+// Registered at load, so it runs before the store's own `storage` listener.
+window.addEventListener("storage", (event) => {
+  if (event.key === null || event.key === BACKEND_KEY) active = null;
+});
+
+/** What the components render; every write below is published to it (and to the other tabs). */
+export const productStore = new ProductStore({
+  load: () => backend().list(),
+  shared: () => backend().name !== "memory",
+  isCatalogKey: (key) => key === PRODUCTS_KEY || key.startsWith(`${PRODUCTS_KEY}:`),
+  isResetKey: (key) => key === BACKEND_KEY,
+});
+
+// Apply `change` through the backend and publish the product it produced
+const modify = (id: string, change: (product: Product) => Product | null): boolean => {
+  let changed = null as Product | null;
+  const success = backend().modify(id, (product) => (changed = change(product)));
+  if (success && changed) productStore.publish({ type: "upsert", product: changed });
+  return success;
+};
+
+let lastId = 0;
+
+// Date.now() alone repeats within a millisecond; keep ids unique and increasing
+const nextId = (): string => {
+  lastId = Math.max(lastId + 1, Date.now());
+  return lastId.toString();
+};
+
+export const getStorageBackend = (): StorageBackendName => backend().name;
+
+export const setStorageBackend = (name: StorageBackendName): boolean => {
+  if (!migrateTo(name)) return false;
+  localStorage.setItem(BACKEND_KEY, name);
+  active = backends[name];
+  productStore.publish({ type: "reset" });
+  return true;
+};
 
 export const getProducts = (): Product[] => {
-  const data = localStorage.getItem(PRODUCTS_KEY);
-  return data ? JSON.parse(data) : [];
+  return backend().list();
 };
 
 export const saveProducts = (products: Product[]): void => {
-  localStorage.setItem(PRODUCTS_KEY, JSON.stringify(products));
-};
-
-export const addProduct = (product: Omit<Product, "id" | "createdAt">): Product => {
-  const products = getProducts();
-  const newProduct: Product = {
-    ...product,
-    id: Date.now().toString(),
-    createdAt: new Date().toISOString(),
-  };
-  products.push(newProduct);
-  saveProducts(products);
+  backend().replaceAll(products);
+  productStore.publish({ type: "reset" });
+};
+
+export interface DispatchOrder {
+  id: string;
+  units: number;
+}
+
+/** Which products a bulk operation changed and which it had to skip. */
+export interface BulkResult {
+  succeeded: string[];
+  failed: string[];
+}
+
+const bulkResult = (requested: Iterable<string>, succeeded: string[]): BulkResult => {
+  const done = new Set(succeeded);
+  return { succeeded, failed: [...new Set(requested)].filter((id) => !done.has(id)) };
+};
+
+const withId = (product: NewProduct): Product => ({
+  ...product,
+  id: nextId(),
+  createdAt: new Date().toISOString(),
+});
+
+export const addProduct = (product: NewProduct): Product => {
+  const newProduct = withId(product);
+  backend().insert(newProduct);
+  productStore.publish({ type: "upsert", product: newProduct });
   return newProduct;
 };
 
 export const updateProduct = (id: string, updates: Partial<Product>): boolean => {
-  const products = getProducts();
-  const index = products.findIndex((p) => p.id === id);
-  if (index === -1) return false;
-  products[index] = { ...products[index], ...updates };
-  saveProducts(products);
-  return true;
+  return modify(id, (product) => ({ ...product, ...updates, id: product.id }));
 };
 
 export const deleteProduct = (id: string): boolean => {
-  const products = getProducts();
-  const filtered = products.filter((p) => p.id !== id);
-  if (filtered.length === products.length) return false;
-  saveProducts(filtered);
+  if (!backend().remove(id)) return false;
+  productStore.publish({ type: "remove", id });
   return true;
 };
 
-export const dispatchProduct = (id: string): boolean => {
-  const products = getProducts();
-  const product = products.find((p) => p.id === id);
-  if (!product || product.quantity <= 0) return false;
-  product.dispatched = true;
-  product.quantity -= 1;
-  saveProducts(products);
-  return true;
+// Take `units` out of stock, or refuse (null) if there are not enough
+const dispatchUnits = (product: Product, units: number): Product | null =>
+  !Number.isInteger(units) || units < 1 || product.quantity < units
+    ? null
+    : { ...product, dispatched: true, quantity: product.quantity - units };
+
+export const dispatchProduct = (id: string, units = 1): boolean => {
+  return modify(id, (product) => dispatchUnits(product, units));
+};
+
+/**
+ * Dispatch many orders with one read and one write of the catalog. Orders
+ * for the same product are added up; a product without enough stock for all
+ * of its orders is left unchanged and reported as failed.
+ */
+export const dispatchProducts = (orders: DispatchOrder[]): BulkResult => {
+  const units = new Map<string, number>();
+  orders.forEach(({ id, units: count }) => units.set(id, (units.get(id) ?? 0) + count));
+  const changed = backend().modifyMany(units.keys(), (product) => dispatchUnits(product, units.get(product.id)!));
+  if (changed.length > 0) productStore.publish({ type: "batch", upserts: changed, removed: [] });
+  return bulkResult(units.keys(), changed.map((product) => product.id));
+};
+
+/** Delete every product in `ids` with one read and one write of the catalog. */
+export const deleteProducts = (ids: string[]): BulkResult => {
+  const removed = backend().removeMany(ids);
+  if (removed.length > 0) productStore.publish({ type: "batch", upserts: [], removed });
+  return bulkResult(ids, removed);
+};
+
+/** Add every product (e.g. from `parseCatalog`) with one read and one write of the catalog. */
+export const importProducts = (products: NewProduct[]): Product[] => {
+  const added = products.map(withId);
+  backend().insertMany(added);
+  if (added.length > 0) productStore.publish({ type: "batch", upserts: added, removed: [] });
+  return added;
 };
@@ -1,5 +1,11 @@
 import { createRoot } from "react-dom/client";
 import App from "./App.tsx";
+import * as storage from "./lib/storage";
 import "./index.css";
 
+// Let the Selenium benchmarks call the storage layer directly (dev server or VITE_E2E_HOOKS=true builds)
+if (import.meta.env.DEV || import.meta.env.VITE_E2E_HOOKS === "true") {
+  window.__ecommerceStorage = storage;
+}
+
 createRoot(document.getElementById("root")!).render(<App />);
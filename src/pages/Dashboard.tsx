@@ -1,13 +1,24 @@
-import { useEffect } from "react";
+import { Suspense, useEffect } from "react";
 import { useNavigate } from "react-router-dom";
 import { Tabs, TabsContent, TabsList, TabsTrigger } from "@/components/ui/tabs";
 import { Button } from "@/components/ui/button";
 import { LogOut, ShoppingBag } from "lucide-react";
-import AddProduct from "@/components/AddProduct";
-import UpdateProduct from "@/components/UpdateProduct";
-import DeleteProduct from "@/components/DeleteProduct";
-import DispatchProduct from "@/components/DispatchProduct";
 import ViewInventory from "@/components/ViewInventory";
+import { lazyWithPrefetch, prefetchWhenIdle } from "@/lib/lazy";
+
+// Inventory is the default tab and ships with the page; the other tabs are
+// separate chunks, fetched when the browser is idle or a tab is hovered
+const AddProduct = lazyWithPrefetch(() => import("@/components/AddProduct"));
+const UpdateProduct = lazyWithPrefetch(() => import("@/components/UpdateProduct"));
+const DeleteProduct = lazyWithPrefetch(() => import("@/components/DeleteProduct"));
+const DispatchProduct = lazyWithPrefetch(() => import("@/components/DispatchProduct"));
+
+const lazyTabs = [
+  { value: "add", label: "Add Product", Component: AddProduct },
+  { value: "update", label: "Update", Component: UpdateProduct },
+  { value: "delete", label: "Delete", Component: DeleteProduct },
+  { value: "dispatch", label: "Dispatch", Component: DispatchProduct },
+];
 
 const Dashboard = () => {
   const navigate = useNavigate();
@@ -19,6 +30,8 @@ const Dashboard = () => {
     }
   }, [navigate]);
 
+  useEffect(() => prefetchWhenIdle(lazyTabs.map((tab) => tab.Component)), []);
+
   const handleLogout = () => {
     localStorage.removeItem("isAuthenticated");
     navigate("/");
@@ -45,31 +58,30 @@ const Dashboard = () => {
         <Tabs defaultValue="inventory" className="space-y-6">
           <TabsList className="grid w-full grid-cols-5">
             <TabsTrigger value="inventory">Inventory</TabsTrigger>
-            <TabsTrigger value="add">Add Product</TabsTrigger>
-            <TabsTrigger value="update">Update</TabsTrigger>
-            <TabsTrigger value="delete">Delete</TabsTrigger>
-            <TabsTrigger value="dispatch">Dispatch</TabsTrigger>
+            {lazyTabs.map(({ value, label, Component }) => (
+              <TabsTrigger
+                key={value}
+                value={value}
+                onPointerEnter={Component.prefetch}
+                onFocus={Component.prefetch}
+              >
+                {label}
+              </TabsTrigger>
+            ))}
           </TabsList>
 
           <TabsContent value="inventory">
             <ViewInventory />
           </TabsContent>
 
-          <TabsContent value="add">
-            <AddProduct />
-          </TabsContent>
-
-          <TabsContent value="update">
-            <UpdateProduct />
-          </TabsContent>
-
-          <TabsContent value="delete">
-            <DeleteProduct />
-          </TabsContent>
-
-          <TabsContent value="dispatch">
-            <DispatchProduct />
-          </TabsContent>
+          {lazyTabs.map(({ value, Component }) => (
+            <TabsContent key={value} value={value}>
+              {/* No fallback: the panel stays empty until the tab has content */}
+              <Suspense fallback={null}>
+                <Component />
+              </Suspense>
+            </TabsContent>
+          ))}
         </Tabs>
       </main>
     </div>
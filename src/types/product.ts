@@ -8,3 +8,6 @@ export interface Product {
   dispatched: boolean;
   createdAt: string;
 }
+
+/** A product as entered or imported, before storage assigns its id and creation time. */
+export type NewProduct = Omit<Product, "id" | "createdAt">;
@@ -1 +1,5 @@
 /// <reference types="vite/client" />
+
+interface Window {
+  __ecommerceStorage?: typeof import("./lib/storage");
+}
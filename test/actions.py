@@ -0,0 +1,241 @@
+"""Completion-aware UI actions for the admin test suite.
+
+Rather than sleeping a fixed amount after every interaction, these helpers
+return as soon as the app signals that the interaction has finished: the
+target tab panel mounting, a toast from ``useToast`` appearing, or the
+``ecommerce_products`` key in localStorage changing. Each wait runs inside
+the page, so it costs one WebDriver round-trip however long it takes, and
+element waits go through ``self.wait`` (a ``dom_wait.DomWait``).
+
+Each helper is recorded as a step span by ``timing.py``.
+"""
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+
+import dom_wait as EC
+import timing
+from timing import timed_step
+
+PRODUCTS_KEY = "ecommerce_products"
+WAIT_TIMEOUT = 10
+
+TOAST_SELECTOR = "li[role='status'][data-state='open']"
+SUBMIT_BUTTON = "//button[@type='submit'][normalize-space()='{label}']"
+TAB_BUTTON = "//button[@role='tab'][normalize-space()='{name}']"
+PANEL_BUTTON = "//div[@role='tabpanel'][@data-state='active']//button[normalize-space()='{label}']"
+# A button in the card of the product named `name` (Dispatch, Delete and the like)
+ROW_BUTTON = ("//div[@role='tabpanel'][@data-state='active']//h3[normalize-space()='{name}']"
+              "/ancestor::div[.//button][1]//button[normalize-space()='{label}']")
+COMBOBOX = "//button[@role='combobox']"
+FORM_FIELDS = ("name", "category", "description", "price", "quantity")
+
+# Polls a predicate inside the page and resolves with its first truthy result,
+# or with null once the deadline passes.
+_WAIT_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const check = new Function("args", arguments[0]);
+const args = arguments[1];
+const deadline = performance.now() + arguments[2];
+(function poll() {
+  let result = null;
+  try { result = check(args); } catch (e) { result = null; }
+  if (result) return done(result);
+  if (performance.now() > deadline) return done(null);
+  setTimeout(poll, 10);
+})();
+"""
+
+# Everything stored under the products key, in the blob or keyed backend format
+_PRODUCTS_STATE = """
+const productsState = (key) => Object.keys(localStorage)
+  .filter((k) => k === key || k.startsWith(key + ":"))
+  .sort()
+  .map((k) => k + "=" + localStorage.getItem(k))
+  .join("\\n");
+"""
+
+# Marks the toasts currently on screen as seen and returns the stored products,
+# so a later wait can tell a fresh signal from a stale one.
+_MARK_SCRIPT = _PRODUCTS_STATE + """
+document.querySelectorAll(arguments[0]).forEach((t) => { t.dataset.seen = "1"; });
+return productsState(arguments[1]);
+"""
+
+_STORAGE_CHANGED = _PRODUCTS_STATE + """
+return productsState(args.key) !== args.before;
+"""
+
+# Sets every field the way React expects from a user: the native value setter
+# (so React's value tracker sees a change) followed by a bubbling input event.
+# The product forms update state with ``{...formData, field}``, so the script
+# yields after each field to let React re-render before the next one.
+_FILL_SCRIPT = """
+const [fields, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const deadline = performance.now() + timeoutMs;
+const pause = () => new Promise((resolve) => setTimeout(resolve, 0));
+(async () => {
+  const ids = Object.keys(fields);
+  let elements = ids.map((id) => document.getElementById(id));
+  while (elements.some((el) => !el)) {
+    if (performance.now() > deadline) return done({missing: ids.filter((id, i) => !elements[i])});
+    await pause();
+    elements = ids.map((id) => document.getElementById(id));
+  }
+  for (const [i, el] of elements.entries()) {
+    const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), "value").set;
+    el.focus();
+    setter.call(el, fields[ids[i]]);
+    el.dispatchEvent(new Event("input", {bubbles: true}));
+    await pause();
+  }
+  done({values: Object.fromEntries(ids.map((id) => [id, document.getElementById(id).value]))});
+})();
+"""
+
+_NEW_TOAST = """
+return Array.from(document.querySelectorAll(args.toast)).find((t) => !t.dataset.seen) || null;
+"""
+
+_PANEL_MOUNTED = """
+const tab = args.tab;
+if (tab.getAttribute("aria-selected") !== "true") return null;
+const panel = document.getElementById(tab.getAttribute("aria-controls"));
+return panel && panel.dataset.state === "active" && panel.childElementCount > 0 ? panel : null;
+"""
+
+# Types into the active panel's search box, if it has one, so a picker that
+# only lists the first matches (Update Product) lists the wanted product
+_SEARCH_SCRIPT = """
+const input = document.querySelector("[role='tabpanel'][data-state='active'] input[type='search']");
+if (!input) return false;
+Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set.call(input, arguments[0]);
+input.dispatchEvent(new Event("input", {bubbles: true}));
+return true;
+"""
+
+_LISTBOX_OPEN = """
+const options = document.querySelectorAll("[role='listbox'] [role='option']");
+return options.length > 0 ? Array.from(options) : null;
+"""
+
+_LISTBOX_CLOSED = """
+return document.querySelector("[role='listbox']") ? null : true;
+"""
+
+_DIALOG_CLOSED = """
+return document.querySelector("[role='alertdialog']") ? null : true;
+"""
+
+
+class AdminActions:
+    """Mixin for test cases that drive the admin panel through ``self.driver``"""
+
+    def wait_in_page(self, predicate, timeout=WAIT_TIMEOUT, **args):
+        """Block until ``predicate`` (a JS function body) returns a truthy value"""
+        with timing.category("wait"):
+            result = self.driver.execute_async_script(_WAIT_SCRIPT, predicate, args, timeout * 1000)
+        if result is None:
+            raise TimeoutException(f"Page condition not met within {timeout}s")
+        return result
+
+    def mark_signals(self):
+        """Remember current toasts and storage so the next wait sees only new signals"""
+        return self.driver.execute_script(_MARK_SCRIPT, TOAST_SELECTOR, PRODUCTS_KEY)
+
+    def wait_for_products_change(self, before, timeout=WAIT_TIMEOUT):
+        """Wait until the stored products differ from ``before`` (as returned by ``mark_signals``)"""
+        return self.wait_in_page(_STORAGE_CHANGED, timeout, key=PRODUCTS_KEY, before=before)
+
+    @timed_step()
+    def wait_for_toast(self, timeout=WAIT_TIMEOUT):
+        """Wait for a toast that was not on screen at the last ``mark_signals``"""
+        return self.wait_in_page(_NEW_TOAST, timeout, toast=TOAST_SELECTOR)
+
+    @timed_step()
+    def click_tab(self, name):
+        """Activate a Dashboard tab and return its panel once the content is mounted"""
+        tab = self.wait.until(EC.element_to_be_clickable((By.XPATH, TAB_BUTTON.format(name=name))))
+        tab.click()
+        return self.wait_in_page(_PANEL_MOUNTED, tab=tab)
+
+    @timed_step()
+    def choose_option(self, text=None, index=1):
+        """Open the combobox and pick the option containing ``text`` (or the ``index``-th one)
+
+        With ``text``, the panel's search box (if any) is filled in first, so
+        the option is listed however large the catalog is.
+        """
+        if text is not None:
+            self.driver.execute_script(_SEARCH_SCRIPT, text)
+        combobox = self.wait.until(EC.element_to_be_clickable((By.XPATH, COMBOBOX)))
+        combobox.click()
+        options = self.wait_in_page(_LISTBOX_OPEN)
+        if text is None:
+            option = options[index - 1]
+        else:
+            option = next((o for o in options if text in o.text), None)
+            if option is None:
+                raise TimeoutException(f"No option containing {text!r}")
+        label = option.text
+        option.click()
+        self.wait_in_page(_LISTBOX_CLOSED)
+        return label
+
+    @timed_step()
+    def fill_form(self, clear=False, typing=False, **fields):
+        """Set ``fields`` (any of ``FORM_FIELDS``, by element id) in the open product form
+
+        By default every field is replaced in a single script call. Pass
+        ``typing=True`` to type real keystrokes instead, one field at a time;
+        typed text is appended unless ``clear`` is set.
+        """
+        unknown = [field for field in fields if field not in FORM_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown form field {unknown[0]!r}")
+        if typing:
+            for field, value in fields.items():
+                element = self.wait.until(EC.presence_of_element_located((By.ID, field)))
+                if clear:
+                    element.clear()
+                element.send_keys(str(value))
+            return
+        expected = {field: str(value) for field, value in fields.items()}
+        result = self.driver.execute_async_script(_FILL_SCRIPT, expected, WAIT_TIMEOUT * 1000)
+        if "missing" in result:
+            raise TimeoutException(f"Form fields not found: {', '.join(result['missing'])}")
+        rejected = {field: value for field, value in result["values"].items() if value != expected[field]}
+        if rejected:
+            raise AssertionError(f"The form did not accept {rejected} (expected {expected})")
+
+    @timed_step()
+    def submit_form(self, label):
+        """Click the submit button labelled ``label`` and wait for the app to react"""
+        button = self.driver.find_element(By.XPATH, SUBMIT_BUTTON.format(label=label))
+        self.mark_signals()
+        button.click()
+        return self.wait_for_toast()
+
+    @timed_step()
+    def click_and_wait(self, element):
+        """Click a button that reports its outcome with a toast and wait for that toast"""
+        self.mark_signals()
+        element.click()
+        return self.wait_for_toast()
+
+    @timed_step()
+    def confirm_dialog(self, action="Delete"):
+        """Press ``action`` in the open alert dialog and wait for it to close"""
+        button = self.wait.until(
+            EC.element_to_be_clickable((By.XPATH, f"//*[@role='alertdialog']//button[normalize-space()='{action}']"))
+        )
+        self.mark_signals()
+        button.click()
+        self.wait_in_page(_DIALOG_CLOSED)
+        if action != "Cancel":
+            return self.wait_for_toast()
+        return None
+
+    def panel_button(self, label):
+        """Locator for a button inside the active tab panel (not the tab itself)"""
+        return (By.XPATH, PANEL_BUTTON.format(label=label))
@@ -0,0 +1,192 @@
+"""Startup benchmark: first load of ``/dashboard`` from a cold and a warm cache.
+
+Run it against a production build, not the dev server (which serves
+unbundled modules and says nothing about chunk sizes)::
+
+    npm run build && npm run preview -- --port 4173
+    python bench_startup.py --url http://localhost:4173
+
+Every load is timed inside the page from navigation start:
+
+- ``ttfb_ms``, ``dcl_ms``, ``load_ms``: Navigation Timing
+- ``fcp_ms``: first contentful paint
+- ``inventory_ms``: until the Inventory tab panel has content
+- ``initial_js_bytes`` / ``initial_js_files``: JavaScript fetched before
+  ``inventory_ms`` (encoded size), i.e. what the first view had to load
+- ``js_transfer_bytes``: JavaScript bytes that came over the network
+  (0 when everything was served from the HTTP cache)
+
+``cold`` loads run with the HTTP cache disabled; ``warm`` loads run after a
+priming load with the cache enabled. The report gives a distribution per
+metric and mode, and ``--output`` defaults to ``reports/bench_startup.json``
+so runs can be compared over time.
+
+Usage:
+    python bench_startup.py --url http://localhost:4173
+    python bench_startup.py --url http://localhost:4173 --runs 20 --modes cold
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+from selenium.webdriver.common.by import By
+
+import dom_wait as EC
+from browser import base_url, create_driver
+from dom_wait import DomWait
+from fixtures import AUTH_KEY
+from timing import REPORTS_DIR
+from vitals import distribution, install_collector, set_cache_disabled, uninstall_collector
+
+DEFAULT_RUNS = 5
+MODES = ("cold", "warm")
+METRICS = ("ttfb_ms", "dcl_ms", "load_ms", "fcp_ms", "inventory_ms", "initial_js_bytes", "initial_js_files",
+           "js_transfer_bytes")
+READY_SELECTOR = "[role='tabpanel'][data-state='active'] > *"
+
+# Installed with Page.addScriptToEvaluateOnNewDocument so it sees the first render
+_READY_WATCHER = """
+(() => {
+  const selector = %s;
+  const record = () => {
+    if (window.__adminStartupReady || !document.querySelector(selector)) return false;
+    window.__adminStartupReady = performance.now();
+    return true;
+  };
+  const observer = new MutationObserver(() => { if (record()) observer.disconnect(); });
+  observer.observe(document, {subtree: true, childList: true});
+})();
+""" % json.dumps(READY_SELECTOR)
+
+_READ_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const read = () => {
+  const nav = performance.getEntriesByType("navigation")[0];
+  if (!nav || !nav.loadEventEnd) return setTimeout(read, 50);
+  const ready = window.__adminStartupReady || performance.now();
+  const scripts = performance.getEntriesByType("resource")
+    .filter((entry) => entry.initiatorType === "script" || /\\.m?js(\\?|$)/.test(entry.name));
+  const initial = scripts.filter((entry) => entry.startTime <= ready);
+  const paint = performance.getEntriesByName("first-contentful-paint")[0];
+  done({
+    ttfb_ms: nav.responseStart,
+    dcl_ms: nav.domContentLoadedEventEnd,
+    load_ms: nav.loadEventEnd,
+    fcp_ms: paint ? paint.startTime : null,
+    inventory_ms: ready,
+    ready_observed: !!window.__adminStartupReady,
+    initial_js_bytes: initial.reduce((sum, entry) => sum + entry.encodedBodySize, 0),
+    initial_js_files: initial.length,
+    js_transfer_bytes: scripts.reduce((sum, entry) => sum + entry.transferSize, 0),
+    scripts: initial.map((entry) => new URL(entry.name).pathname),
+    dev_server: !!document.querySelector("script[src*='/@vite/client']"),
+  });
+};
+read();
+"""
+
+
+def clear_http_cache(driver):
+    driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+
+
+def install_ready_watcher(driver):
+    """Install the readiness watcher; without CDP ``inventory_ms`` falls back to when the read ran"""
+    watcher = install_collector(driver, _READY_WATCHER)
+    if watcher is None:
+        print("  (no CDP: inventory_ms is only an upper bound)")
+    return watcher
+
+
+def measure_load(driver, origin, timeout=30):
+    """Open ``/dashboard`` once and return its startup sample"""
+    driver.get(f"{origin}/dashboard")
+    DomWait(driver, timeout).until(EC.presence_of_element_located((By.CSS_SELECTOR, READY_SELECTOR)))
+    return driver.execute_async_script(_READ_SCRIPT)
+
+
+def run_mode(driver, origin, mode, runs):
+    """``runs`` samples of one cache mode"""
+    cold = mode == "cold"
+    if not set_cache_disabled(driver, cold) and cold:
+        raise RuntimeError("Cold loads need a Chromium driver (CDP Network domain)")
+    if not cold:
+        measure_load(driver, origin)  # prime the cache
+    samples = []
+    for _ in range(runs):
+        if cold:
+            clear_http_cache(driver)
+        samples.append(measure_load(driver, origin))
+    set_cache_disabled(driver, False)
+    return samples
+
+
+def run_benchmark(origin, runs=DEFAULT_RUNS, modes=MODES):
+    driver = create_driver()
+    driver.set_script_timeout(60)
+    try:
+        driver.get(origin)
+        driver.execute_script("localStorage.setItem(arguments[0], 'true')", AUTH_KEY)
+        watcher = install_ready_watcher(driver)
+        report = {
+            "benchmark": "startup",
+            "url": f"{origin}/dashboard",
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "user_agent": driver.execute_script("return navigator.userAgent"),
+            "host": platform.node(),
+            "runs": runs,
+            "modes": {},
+        }
+        try:
+            for mode in modes:
+                samples = run_mode(driver, origin, mode, runs)
+                report["modes"][mode] = {
+                    "summary": {metric: distribution([s[metric] for s in samples]) for metric in METRICS},
+                    "initial_scripts": samples[-1]["scripts"],
+                    "samples": samples,
+                }
+            report["dev_server"] = any(s["dev_server"] for m in report["modes"].values() for s in m["samples"])
+        finally:
+            uninstall_collector(driver, watcher)
+            driver.execute_script("localStorage.removeItem(arguments[0])", AUTH_KEY)
+        return report
+    finally:
+        driver.quit()
+
+
+def print_report(report):
+    for mode, data in report["modes"].items():
+        print(f"  {mode}, {report['runs']} loads of {report['url']}:")
+        for metric, stats in data["summary"].items():
+            if stats["samples"]:
+                print(f"    {metric:<18} p50={stats['p50']:.1f} p95={stats['p95']:.1f} max={stats['max']:.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=base_url(), help="origin serving the production build")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--output", default=os.path.join(REPORTS_DIR, "bench_startup.json"))
+    args = parser.parse_args(argv)
+
+    modes = args.modes.split(",")
+    unknown = [mode for mode in modes if mode not in MODES]
+    if unknown:
+        parser.error(f"unknown mode {unknown[0]!r}; choose from {', '.join(MODES)}")
+    report = run_benchmark(args.url.rstrip("/"), args.runs, modes)
+    if report["dev_server"]:
+        print("Warning: this is the Vite dev server; build and serve dist/ for meaningful numbers")
+    print_report(report)
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
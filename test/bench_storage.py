@@ -0,0 +1,255 @@
+"""CRUD latency benchmark for src/lib/storage.ts versus catalog size.
+
+With the default ``blob`` backend every storage call parses and
+re-serializes the whole catalog, so each operation is O(n); the ``keyed``
+backend stores one key per product and the ``memory`` backend does not
+persist at all, which shows the cost of the storage layer itself. This
+benchmark measures how that plays out for the selected backend: for each
+catalog size it seeds a generated catalog, then calls ``getProducts``,
+``updateProduct``, ``dispatchProduct``, ``addProduct`` and ``deleteProduct``
+in the page (through the ``window.__ecommerceStorage`` hook from main.tsx)
+and reports p50/p95/p99 latency and throughput as JSON.
+
+It then compares the bulk APIs with their one-at-a-time equivalents on the
+same catalog: ``--batch`` orders through ``dispatchProduct`` versus one
+``dispatchProducts`` call, ``addProduct`` versus ``importProducts`` and
+``deleteProduct`` versus ``deleteProducts``.
+
+Adds are undone by the deletes, so every operation runs against a catalog
+of the nominal size. Sizes the browser cannot store are reported as skipped.
+
+Usage:
+    python bench_storage.py
+    python bench_storage.py --sizes 100,1000,10000 --iterations 2000 --output /tmp/storage.json
+    python bench_storage.py --backend keyed --output reports/bench_storage_keyed.json
+    python bench_storage.py --sizes 10000 --batch 2000
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+from selenium.webdriver.common.by import By
+
+import dom_wait as EC
+from actions import PRODUCTS_KEY
+from browser import base_url, create_driver
+from dom_wait import DomWait
+from datasets import generate_catalog
+from seeding import BACKEND_KEY, BACKENDS, SeedError, clear_catalog, seed_catalog, seed_memory_catalog, set_backend
+from timing import REPORTS_DIR
+
+DEFAULT_SIZES = (100, 1_000, 10_000, 100_000)
+DEFAULT_ITERATIONS = 1_000
+DEFAULT_BUDGET_SECONDS = 60  # per operation and size; large catalogs stop early
+OPERATIONS = ("getProducts", "updateProduct", "dispatchProduct", "addProduct", "deleteProduct")
+DEFAULT_BATCH = 500  # a day's orders
+BULK_OPERATIONS = ("dispatch", "import", "delete")
+
+_RUN_SCRIPT = """
+const [operation, ids, iterations, budgetMs, addedIds] = arguments;
+const storage = window.__ecommerceStorage;
+const samples = [];
+const created = [];
+const started = performance.now();
+for (let i = 0; i < iterations && performance.now() - started < budgetMs; i++) {
+  const id = ids[(i * 7919) % ids.length];
+  const t0 = performance.now();
+  switch (operation) {
+    case "getProducts": storage.getProducts(); break;
+    case "updateProduct": storage.updateProduct(id, {price: i + 0.5}); break;
+    case "dispatchProduct": storage.dispatchProduct(id); break;
+    case "addProduct":
+      created.push(storage.addProduct({name: "Bench " + i, description: "benchmark", price: 1,
+                                       quantity: 100, category: "Bench", dispatched: false}).id);
+      break;
+    case "deleteProduct": storage.deleteProduct(addedIds[i]); break;
+  }
+  samples.push(performance.now() - t0);
+}
+return {samples, created};
+"""
+
+# Times ``batch`` single calls (within the budget) against one bulk call for
+# each of dispatch, import and delete; adds are deleted again at the end
+_BULK_SCRIPT = """
+const [ids, batch, budgetMs] = arguments;
+const storage = window.__ecommerceStorage;
+const time = (fn) => {
+  const t0 = performance.now();
+  fn();
+  return performance.now() - t0;
+};
+const singles = (count, fn) => {
+  const started = performance.now();
+  let done = 0;
+  while (done < count && performance.now() - started < budgetMs) fn(done++);
+  return {done, ms: performance.now() - started};
+};
+const newProduct = (i) => ({name: "Bulk " + i, description: "benchmark", price: 1, quantity: 100,
+                            category: "Bench", dispatched: false});
+const orders = Array.from({length: batch}, (_, i) => ({id: ids[(i * 7919) % ids.length], units: 1}));
+const result = {};
+result.dispatch = {single: singles(batch, (i) => storage.dispatchProduct(orders[i].id)),
+                   bulk_ms: time(() => storage.dispatchProducts(orders))};
+const created = [];
+let imported = [];
+result.import = {single: singles(batch, (i) => created.push(storage.addProduct(newProduct(i)).id)),
+                 bulk_ms: time(() => { imported = storage.importProducts(orders.map((_, i) => newProduct(i))); })};
+result.delete = {single: singles(created.length, (i) => storage.deleteProduct(created[i])),
+                 bulk_ms: time(() => storage.deleteProducts(imported.map((p) => p.id)))};
+storage.deleteProducts(created.slice(result.delete.single.done));
+return result;
+"""
+
+
+def run_bulk(driver, ids, batch=DEFAULT_BATCH, budget_seconds=DEFAULT_BUDGET_SECONDS):
+    """Time ``batch`` single calls against one bulk call per operation in the open app
+
+    ``ids`` are products of the stored catalog to dispatch. Returns
+    ``compare_bulk`` of the run; the catalog is back to its size afterwards.
+    """
+    run = driver.execute_script(_BULK_SCRIPT, ids, batch, budget_seconds * 1000)
+    return compare_bulk(run, batch)
+
+
+def compare_bulk(run, batch):
+    """Per-operation single vs bulk timings from ``_BULK_SCRIPT``; single calls are scaled to the batch"""
+    comparison = {}
+    for operation in BULK_OPERATIONS:
+        single, bulk_ms = run[operation]["single"], run[operation]["bulk_ms"]
+        per_op = single["ms"] / single["done"] if single["done"] else None
+        comparison[operation] = {
+            "single_calls": single["done"],
+            "single_ms_per_call": per_op,
+            "bulk_ms": bulk_ms,
+            "speedup": per_op * batch / bulk_ms if per_op and bulk_ms else None,
+        }
+    return comparison
+
+
+def percentile(sorted_samples, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_samples:
+        return None
+    rank = max(0, min(len(sorted_samples) - 1, round(fraction * len(sorted_samples)) - 1))
+    return sorted_samples[rank]
+
+
+def summarize(samples):
+    """Latency distribution (milliseconds) and throughput for one operation"""
+    ordered = sorted(samples)
+    total = sum(ordered)
+    return {
+        "iterations": len(ordered),
+        "min_ms": ordered[0] if ordered else None,
+        "p50_ms": percentile(ordered, 0.50),
+        "p95_ms": percentile(ordered, 0.95),
+        "p99_ms": percentile(ordered, 0.99),
+        "max_ms": ordered[-1] if ordered else None,
+        "mean_ms": total / len(ordered) if ordered else None,
+        "ops_per_second": len(ordered) / (total / 1000) if total else None,
+    }
+
+
+def open_app(driver):
+    """Load the app and wait until the storage hook is available"""
+    driver.get(base_url())
+    DomWait(driver, 30).until(EC.presence_of_element_located((By.CSS_SELECTOR, "#root > *")))
+    if not driver.execute_script("return !!window.__ecommerceStorage"):
+        raise RuntimeError("window.__ecommerceStorage is missing; run the dev server or build with VITE_E2E_HOOKS=true")
+
+
+def bench_size(driver, size, iterations, budget_seconds, seed, backend="blob", batch=DEFAULT_BATCH):
+    """Seed a catalog of ``size`` products and time every operation against it"""
+    catalog = generate_catalog(size, seed=seed, low_stock_ratio=0)
+    clear_catalog(driver)
+    try:
+        if backend == "memory":
+            open_app(driver)
+            stats = seed_memory_catalog(driver, catalog, validate=False)
+        else:
+            stats = seed_catalog(driver, catalog, validate=False)
+            # The app picks its backend (and migrates the seeded blob) when the page loads
+            open_app(driver)
+    except SeedError as error:
+        return {"size": size, "skipped": str(error)}
+    ids = [product["id"] for product in catalog]
+    active = driver.execute_script("return window.__ecommerceStorage.getStorageBackend()")
+    if active != backend:
+        return {"size": size, "skipped": f"catalog does not fit the {backend} backend"}
+
+    result = {"size": size, "chars": stats["chars"], "operations": {}}
+    added = []
+    for operation in OPERATIONS:
+        count = len(added) if operation == "deleteProduct" else iterations
+        run = driver.execute_script(_RUN_SCRIPT, operation, ids, count, budget_seconds * 1000, added)
+        added.extend(run["created"])
+        summary = result["operations"][operation] = summarize(run["samples"])
+        if summary["iterations"]:
+            print(f"  {size:>7} {operation:<16} p50={summary['p50_ms']:.3f}ms p99={summary['p99_ms']:.3f}ms")
+
+    result["bulk"] = run_bulk(driver, ids, batch, budget_seconds)
+    for operation, entry in result["bulk"].items():
+        if entry["speedup"]:
+            print(f"  {size:>7} bulk {operation:<11} {entry['bulk_ms']:.1f}ms for {batch} "
+                  f"({entry['speedup']:.0f}x faster than single calls)")
+    result["final_size"] = driver.execute_script("return window.__ecommerceStorage.getProducts().length")
+    return result
+
+
+def run_benchmark(sizes, iterations, budget_seconds, seed=0, backend="blob", batch=DEFAULT_BATCH):
+    """Benchmark every size against ``backend`` and return the report dict"""
+    driver = create_driver()
+    driver.set_script_timeout(budget_seconds * max(len(OPERATIONS), len(BULK_OPERATIONS)) + 60)
+    try:
+        open_app(driver)
+        snapshot = driver.execute_script("return localStorage.getItem(arguments[0])", PRODUCTS_KEY)
+        set_backend(driver, backend)
+        report = {
+            "benchmark": "storage_crud",
+            "backend": backend,
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "user_agent": driver.execute_script("return navigator.userAgent"),
+            "host": platform.node(),
+            "iterations": iterations,
+            "batch": batch,
+            "budget_seconds": budget_seconds,
+            "results": [],
+        }
+        for size in sizes:
+            report["results"].append(bench_size(driver, size, iterations, budget_seconds, seed, backend, batch))
+        clear_catalog(driver)
+        driver.execute_script(
+            "localStorage.removeItem(arguments[2]);"
+            "if (arguments[1] !== null) localStorage.setItem(arguments[0], arguments[1])",
+            PRODUCTS_KEY, snapshot, BACKEND_KEY)
+        return report
+    finally:
+        driver.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_SECONDS, help="seconds per operation and size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--backend", choices=BACKENDS, default="blob")
+    parser.add_argument("--batch", type=int, default=DEFAULT_BATCH, help="orders/products per bulk call")
+    parser.add_argument("--output", default=os.path.join(REPORTS_DIR, "bench_storage.json"))
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    report = run_benchmark(sizes, args.iterations, args.budget, args.seed, args.backend, args.batch)
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""WebDriver construction shared by the test suite and the parallel runner.
+
+Settings come from the environment so that ``runner.py`` can hand each worker
+its own configuration without touching the test classes:
+
+- ``ADMIN_TEST_BASE_URL``: origin of the app under test
+- ``ADMIN_TEST_HEADLESS``: run Chrome headless when set to ``1``
+- ``ADMIN_TEST_VIEWPORT``: window size as ``width,height`` (default 1920,1080)
+- ``ADMIN_TEST_PROFILE_DIR``: Chrome user-data directory for this process
+- ``ADMIN_TEST_PROFILE_TEMPLATE``: a pre-warmed user-data directory (see
+  ``prepare_profile_template``); every browser starts from a copy of it
+
+Every browser in a process talks to one chromedriver service, started with
+the first browser and stopped at exit, so later test classes and tools only
+pay for the browser itself. Each start is recorded in ``STARTUPS``.
+
+Usage (compare cold and warm starts):
+    python browser.py --runs 5
+"""
+import argparse
+import atexit
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.common.driver_finder import DriverFinder
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+
+DEFAULT_BASE_URL = "http://localhost:8080"  # Adjust port if different
+DEFAULT_VIEWPORT = "1920,1080"
+# Chrome refuses to start on a profile that still has another instance's locks
+PROFILE_LOCKS = ("Singleton*", "lockfile", "*.lock")
+
+STARTUPS = []
+_service = None
+_browser_path = None
+
+
+def base_url():
+    """Origin of the app under test"""
+    return os.environ.get("ADMIN_TEST_BASE_URL", DEFAULT_BASE_URL).rstrip("/")
+
+
+def env_flag(name):
+    """True when the environment variable ``name`` is set to a truthy value"""
+    return os.environ.get(name, "").lower() in ("1", "true", "yes")
+
+
+class SharedServiceChrome(RemoteWebDriver):
+    """A Chrome session on the shared chromedriver; ``quit`` leaves the service running"""
+
+    def __init__(self, options, profile_copy=None):
+        service = shared_service(options)
+        if _browser_path:
+            options.binary_location = _browser_path
+        executor = ChromiumRemoteConnection(remote_server_addr=service.service_url, vendor_prefix="goog",
+                                            browser_name="chrome", keep_alive=True)
+        self._profile_copy = profile_copy
+        super().__init__(command_executor=executor, options=options)
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        """Same as ``webdriver.Chrome.execute_cdp_cmd``"""
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+    def quit(self):
+        try:
+            super().quit()
+        finally:
+            if self._profile_copy:
+                shutil.rmtree(self._profile_copy, ignore_errors=True)
+
+
+def shared_service(options):
+    """The process-wide chromedriver service, started on first use"""
+    global _service, _browser_path
+    if _service is None or not _service.is_connectable():
+        service = Service()
+        finder = DriverFinder(service, options)
+        service.path = service.env_path() or finder.get_driver_path()
+        _browser_path = finder.get_browser_path()
+        service.start()
+        atexit.register(service.stop)
+        _service = service
+    return _service
+
+
+def stop_shared_service():
+    global _service
+    if _service is not None:
+        _service.stop()
+        _service = None
+
+
+def copy_profile(template, destination=None):
+    """Copy a profile template into ``destination`` (a new temp dir if None) and return the path"""
+    destination = destination or tempfile.mkdtemp(prefix="admin-test-profile-")
+    shutil.copytree(template, destination, ignore=shutil.ignore_patterns(*PROFILE_LOCKS), dirs_exist_ok=True)
+    return destination
+
+
+def chrome_options(profile_dir=None, headless=None):
+    options = webdriver.ChromeOptions()
+    if headless if headless is not None else env_flag("ADMIN_TEST_HEADLESS"):
+        options.add_argument("--headless=new")
+    # A fixed viewport keeps layouts (and the virtualized Inventory) the same on every machine
+    options.add_argument(f"--window-size={os.environ.get('ADMIN_TEST_VIEWPORT', DEFAULT_VIEWPORT)}")
+    options.add_argument("--no-first-run")
+    options.add_argument("--no-default-browser-check")
+    if profile_dir:
+        # A private profile gives each worker its own localStorage
+        options.add_argument(f"--user-data-dir={profile_dir}")
+    return options
+
+
+def create_driver():
+    """Start a browser configured from the environment"""
+    started = time.perf_counter()
+    reused = _service is not None and _service.is_connectable()
+    profile_dir = os.environ.get("ADMIN_TEST_PROFILE_DIR")
+    template = os.environ.get("ADMIN_TEST_PROFILE_TEMPLATE")
+    warm = bool(template) and os.path.isdir(template)
+    profile_copy = None
+    if warm:
+        if profile_dir:
+            copy_profile(template, profile_dir)
+        else:
+            profile_dir = profile_copy = copy_profile(template)
+    # Change to webdriver.Firefox() if using Firefox
+    driver = SharedServiceChrome(chrome_options(profile_dir), profile_copy)
+    STARTUPS.append({
+        "seconds": time.perf_counter() - started,
+        "profile": "template" if warm else "dir" if profile_dir else "fresh",
+        "service": "reused" if reused else "started",
+    })
+    return driver
+
+
+def prepare_profile_template(path, url=None):
+    """Warm a new profile at ``path`` by starting Chrome on it once (and loading ``url``)
+
+    The page's HTTP cache is kept but its localStorage is cleared, so copies
+    start without a session or catalog.
+    """
+    os.makedirs(path, exist_ok=True)
+    driver = SharedServiceChrome(chrome_options(path, headless=True))
+    try:
+        driver.get(url or "about:blank")
+        if url:
+            driver.execute_script("localStorage.clear()")
+    finally:
+        driver.quit()
+    return path
+
+
+def startup_summary(startups=None):
+    """Median browser start time per (profile, service) combination"""
+    groups = {}
+    for entry in STARTUPS if startups is None else startups:
+        groups.setdefault(f"{entry['profile']} profile, {entry['service']} service", []).append(entry["seconds"])
+    return {label: {"starts": len(times), "median": statistics.median(times), "max": max(times)}
+            for label, times in groups.items()}
+
+
+def print_startups(startups=None):
+    for label, stats in startup_summary(startups).items():
+        print(f"Browser startup ({label}): median {stats['median']:.2f}s over {stats['starts']} starts")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--template", help="profile template to use (prepared in a temp dir if omitted)")
+    args = parser.parse_args(argv)
+
+    template = args.template or tempfile.mkdtemp(prefix="admin-test-template-")
+    if not os.listdir(template):
+        prepare_profile_template(template, base_url())
+    os.environ.pop("ADMIN_TEST_PROFILE_DIR", None)
+    try:
+        # Cold: empty profile and a new chromedriver for every browser
+        os.environ.pop("ADMIN_TEST_PROFILE_TEMPLATE", None)
+        for _ in range(args.runs):
+            stop_shared_service()
+            create_driver().quit()
+        # Warm: a copy of the template on the already running chromedriver
+        os.environ["ADMIN_TEST_PROFILE_TEMPLATE"] = template
+        for _ in range(args.runs):
+            create_driver().quit()
+    finally:
+        stop_shared_service()
+        if not args.template:
+            shutil.rmtree(template, ignore_errors=True)
+    print_startups()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
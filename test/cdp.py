@@ -0,0 +1,507 @@
+"""Asyncio browser backend over the Chrome DevTools Protocol.
+
+The Selenium client is synchronous and runs one chromedriver session per
+browser, so simulating many admins at once needs a thread or process per
+browser. This backend drives one headless Chrome from one event loop over a
+single DevTools WebSocket, and gives every simulated admin its own browser
+context (separate cookies and localStorage, like a separate profile) with
+only the cost of a tab.
+
+It covers the operations ``test.py`` uses, with Selenium's locators (``By``)
+and exceptions::
+
+    async with await Browser.launch() as browser:
+        context = await browser.new_context()
+        page = await context.new_page()
+        await page.goto("http://localhost:8080/")
+        field = await page.wait_for((By.CSS_SELECTOR, "input[type='text']"))
+        await field.type("vivekjadhav")
+        await (await page.find((By.XPATH, "//button[@type='submit']"))).click()
+        count = await page.execute_script("return arguments[0] + 1", 41)
+
+Only the standard library is used: ``WebSocket`` is a minimal RFC 6455
+client (text frames, fragmentation, ping/pong, close) over asyncio streams.
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import shutil
+import struct
+import subprocess
+import tempfile
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import JavascriptException, NoSuchElementException, TimeoutException
+
+DEFAULT_TIMEOUT = 30
+DEFAULT_VIEWPORT = "1920,1080"
+CHROME_NAMES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+_WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_OP_CONTINUATION, _OP_TEXT, _OP_BINARY, _OP_CLOSE, _OP_PING, _OP_PONG = 0x0, 0x1, 0x2, 0x8, 0x9, 0xA
+
+# Resolves a Selenium locator to one element or to a list of them
+_FIND_FUNCTION = """
+const find = (by, value, all) => {
+  if (by === "xpath") {
+    const found = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const nodes = Array.from({length: found.snapshotLength}, (_, i) => found.snapshotItem(i));
+    return all ? nodes : nodes[0] || null;
+  }
+  if (by === "id") value = "[id='" + CSS.escape(value) + "']";
+  else if (by === "name") value = "[name='" + CSS.escape(value) + "']";
+  else if (by === "class name") value = "." + CSS.escape(value);
+  return all ? Array.from(document.querySelectorAll(value)) : document.querySelector(value);
+};
+"""
+
+_FIND_ALL = "function (by, value) {" + _FIND_FUNCTION + "return find(by, value, true); }"
+
+_WAIT_FOR = "function (by, value, visible, timeoutMs) {" + _FIND_FUNCTION + """
+  const check = () => {
+    const el = find(by, value, false);
+    if (!el) return null;
+    if (visible && (el.getClientRects().length === 0 || getComputedStyle(el).visibility === "hidden")) return null;
+    return el;
+  };
+  return new Promise((resolve) => {
+    const first = check();
+    if (first) return resolve(first);
+    const done = (el) => { observer.disconnect(); clearInterval(fallback); clearTimeout(deadline); resolve(el); };
+    const recheck = () => { const el = check(); if (el) done(el); };
+    const observer = new MutationObserver(recheck);
+    observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    const fallback = setInterval(recheck, 100);
+    const deadline = setTimeout(() => done(null), timeoutMs);
+  });
+}
+"""
+
+_POLL_SCRIPT = """
+const [body, args, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const predicate = new Function(body);
+const check = () => { try { return predicate.apply(null, args); } catch (e) { return null; } };
+const deadline = performance.now() + timeoutMs;
+const poll = () => {
+  const value = check();
+  if (value) return done(value);
+  if (performance.now() > deadline) return done(null);
+  setTimeout(poll, 20);
+};
+poll();
+"""
+
+
+class CDPError(Exception):
+    """The browser rejected a DevTools command"""
+
+
+class ConnectionClosed(CDPError):
+    """The DevTools WebSocket was closed"""
+
+
+def _apply_mask(data, mask):
+    if not data:
+        return b""
+    repeated = (mask * (len(data) // 4 + 1))[:len(data)]
+    return (int.from_bytes(data, "big") ^ int.from_bytes(repeated, "big")).to_bytes(len(data), "big")
+
+
+def encode_frame(opcode, payload, mask=None):
+    """One final, masked client frame (clients must mask everything they send)"""
+    mask = mask or os.urandom(4)
+    header = bytearray([0x80 | opcode])
+    length = len(payload)
+    if length < 126:
+        header.append(0x80 | length)
+    elif length < 1 << 16:
+        header.append(0x80 | 126)
+        header += struct.pack("!H", length)
+    else:
+        header.append(0x80 | 127)
+        header += struct.pack("!Q", length)
+    return bytes(header) + mask + _apply_mask(payload, mask)
+
+
+async def read_frame(reader):
+    """``(fin, opcode, payload)`` of the next frame on ``reader``"""
+    first, second = await reader.readexactly(2)
+    length = second & 0x7F
+    if length == 126:
+        length = struct.unpack("!H", await reader.readexactly(2))[0]
+    elif length == 127:
+        length = struct.unpack("!Q", await reader.readexactly(8))[0]
+    mask = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(length)
+    return bool(first & 0x80), first & 0x0F, _apply_mask(payload, mask) if mask else payload
+
+
+class WebSocket:
+    """Minimal WebSocket client for the DevTools endpoint"""
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._send_lock = asyncio.Lock()
+
+    @classmethod
+    async def connect(cls, url, timeout=DEFAULT_TIMEOUT):
+        parts = urlsplit(url)
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(parts.hostname, parts.port or 80), timeout)
+        key = base64.b64encode(os.urandom(16)).decode()
+        writer.write((f"GET {parts.path or '/'} HTTP/1.1\r\nHost: {parts.netloc}\r\nUpgrade: websocket\r\n"
+                      f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n").encode())
+        await writer.drain()
+        head = (await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout)).decode("latin-1")
+        status, *lines = head.split("\r\n")
+        headers = {k.strip().lower(): v.strip() for k, _, v in (line.partition(":") for line in lines if line)}
+        expected = base64.b64encode(hashlib.sha1((key + _WS_GUID).encode()).digest()).decode()
+        if " 101 " not in f"{status} " or headers.get("sec-websocket-accept") != expected:
+            writer.close()
+            raise CDPError(f"WebSocket handshake with {url} failed: {status}")
+        return cls(reader, writer)
+
+    async def send(self, text):
+        async with self._send_lock:
+            self._writer.write(encode_frame(_OP_TEXT, text.encode()))
+            await self._writer.drain()
+
+    async def recv(self):
+        """The next text message; answers pings and raises ``ConnectionClosed`` on close"""
+        message = b""
+        while True:
+            try:
+                fin, opcode, payload = await read_frame(self._reader)
+            except asyncio.IncompleteReadError as error:
+                raise ConnectionClosed("DevTools connection lost") from error
+            if opcode == _OP_PING:
+                async with self._send_lock:
+                    self._writer.write(encode_frame(_OP_PONG, payload))
+                    await self._writer.drain()
+            elif opcode == _OP_CLOSE:
+                raise ConnectionClosed("DevTools connection closed by the browser")
+            elif opcode in (_OP_TEXT, _OP_BINARY, _OP_CONTINUATION):
+                message += payload
+                if fin:
+                    return message.decode()
+
+    async def close(self):
+        try:
+            async with self._send_lock:
+                self._writer.write(encode_frame(_OP_CLOSE, struct.pack("!H", 1000)))
+                await self._writer.drain()
+        except (ConnectionError, RuntimeError):
+            pass
+        self._writer.close()
+
+
+class CDPConnection:
+    """Commands and events of every session, multiplexed over one WebSocket (flat sessions)"""
+
+    def __init__(self, socket):
+        self._socket = socket
+        self._next_id = 0
+        self._pending = {}
+        self._waiters = []
+        self._reader = asyncio.get_running_loop().create_task(self._read_loop())
+
+    async def send(self, method, params=None, session_id=None, timeout=DEFAULT_TIMEOUT):
+        self._next_id += 1
+        message = {"id": self._next_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[self._next_id] = future
+        try:
+            await self._socket.send(json.dumps(message))
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutException(f"{method} got no answer within {timeout}s") from None
+        finally:
+            self._pending.pop(message["id"], None)
+
+    def expect(self, method, session_id=None, predicate=None):
+        """A future for the next ``method`` event; create it before triggering the event"""
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((method, session_id, predicate, future))
+        return future
+
+    async def _read_loop(self):
+        try:
+            while True:
+                message = json.loads(await self._socket.recv())
+                if "id" in message:
+                    future = self._pending.get(message["id"])
+                    if future is None or future.done():
+                        continue
+                    if "error" in message:
+                        future.set_exception(CDPError(message["error"].get("message", message["error"])))
+                    else:
+                        future.set_result(message.get("result", {}))
+                    continue
+                waiting = []
+                for waiter in self._waiters:
+                    method, session_id, predicate, future = waiter
+                    if future.done():
+                        continue
+                    if (method == message.get("method") and session_id == message.get("sessionId")
+                            and (predicate is None or predicate(message.get("params", {})))):
+                        future.set_result(message.get("params", {}))
+                    else:
+                        waiting.append(waiter)
+                self._waiters = waiting
+        except (ConnectionClosed, ConnectionError) as error:
+            for future in list(self._pending.values()) + [waiter[3] for waiter in self._waiters]:
+                if not future.done():
+                    future.set_exception(ConnectionClosed(str(error)))
+
+    async def close(self):
+        self._reader.cancel()
+        await self._socket.close()
+
+
+class Element:
+    """A node in a page, held by its remote object id"""
+
+    def __init__(self, page, object_id):
+        self.page = page
+        self.object_id = object_id
+
+    async def call(self, declaration, *args):
+        """Call the JS function ``declaration`` with ``this`` bound to the element; returns its value"""
+        return await self.page.call_function(declaration, self, *args)
+
+    async def text(self):
+        return await self.call("function () { return this.innerText; }")
+
+    async def get_attribute(self, name):
+        return await self.call("function (name) { return this.getAttribute(name); }", name)
+
+    async def is_displayed(self):
+        return await self.call("function () { return this.getClientRects().length > 0; }")
+
+    async def click(self):
+        """A trusted mouse click at the element's centre, as a user (and WebDriver) would click"""
+        x, y = await self.call("""function () {
+          this.scrollIntoView({block: "center", inline: "center"});
+          const rect = this.getBoundingClientRect();
+          return [rect.left + rect.width / 2, rect.top + rect.height / 2];
+        }""")
+        for event in ("mouseMoved", "mousePressed", "mouseReleased"):
+            await self.page.send("Input.dispatchMouseEvent", {"type": event, "x": x, "y": y, "button": "left",
+                                                              "buttons": 1 if event == "mousePressed" else 0,
+                                                              "clickCount": 1})
+
+    async def type(self, text, clear=False):
+        """Focus the element and insert ``text`` (replacing the current value when ``clear``)"""
+        await self.call("function (clear) { this.focus(); if (clear && this.select) this.select(); }", clear)
+        if clear and not text:
+            for event in ("keyDown", "keyUp"):
+                await self.page.send("Input.dispatchKeyEvent", {"type": event, "key": "Backspace",
+                                                                "code": "Backspace", "windowsVirtualKeyCode": 8})
+        if text:
+            await self.page.send("Input.insertText", {"text": str(text)})
+
+
+class Page:
+    """One tab, attached as a flat session on the browser connection"""
+
+    def __init__(self, connection, target_id, session_id):
+        self.connection = connection
+        self.target_id = target_id
+        self.session_id = session_id
+
+    async def send(self, method, params=None, timeout=DEFAULT_TIMEOUT):
+        return await self.connection.send(method, params, self.session_id, timeout)
+
+    async def goto(self, url, timeout=DEFAULT_TIMEOUT):
+        """Navigate and wait for the load event"""
+        loaded = self.connection.expect("Page.loadEventFired", self.session_id)
+        result = await self.send("Page.navigate", {"url": url}, timeout)
+        if result.get("errorText"):
+            loaded.cancel()
+            raise CDPError(f"Navigation to {url} failed: {result['errorText']}")
+        try:
+            await asyncio.wait_for(loaded, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutException(f"{url} did not load within {timeout}s") from None
+
+    async def url(self):
+        return await self.execute_script("return location.href")
+
+    def _unwrap(self, response):
+        if "exceptionDetails" in response:
+            details = response["exceptionDetails"]
+            raise JavascriptException(details.get("exception", {}).get("description") or details.get("text"))
+        return response["result"]
+
+    async def call_function(self, declaration, this=None, *args, by_value=True, timeout=DEFAULT_TIMEOUT):
+        """Call a JS function in the page with ``args`` (JSON values or ``Element``s); awaits promises"""
+        this = this or next((arg for arg in args if isinstance(arg, Element)), None)
+        if this is None:
+            # Plain values can be inlined, which saves holding a handle to the global object
+            response = await self.send("Runtime.evaluate", {
+                "expression": f"({declaration}).apply(globalThis, {json.dumps(list(args))})",
+                "returnByValue": by_value, "awaitPromise": True,
+            }, timeout)
+        else:
+            arguments = [{"objectId": arg.object_id} if isinstance(arg, Element) else {"value": arg} for arg in args]
+            response = await self.send("Runtime.callFunctionOn", {
+                "functionDeclaration": declaration, "objectId": this.object_id, "arguments": arguments,
+                "returnByValue": by_value, "awaitPromise": True,
+            }, timeout)
+        result = self._unwrap(response)
+        return result.get("value") if by_value else result
+
+    async def execute_script(self, script, *args):
+        """Run a WebDriver-style script body (using ``arguments`` and ``return``) and return its JSON value"""
+        return await self.call_function(f"function () {{ {script}\n}}", None, *args)
+
+    async def execute_async_script(self, script, *args, timeout=DEFAULT_TIMEOUT):
+        """Like Selenium's: the script calls ``arguments[arguments.length - 1]`` with its result"""
+        declaration = ("function (...args) { return new Promise((done) => { "
+                       f"(function () {{ {script}\n}}).apply(this, [...args, done]); }}); }}")
+        try:
+            return await asyncio.wait_for(self.call_function(declaration, None, *args, timeout=timeout), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutException(f"Async script did not finish within {timeout}s") from None
+
+    async def _elements(self, result):
+        if result.get("subtype") == "node":
+            return [Element(self, result["objectId"])]
+        if result.get("subtype") != "array":
+            return []
+        properties = await self.send("Runtime.getProperties", {"objectId": result["objectId"], "ownProperties": True})
+        return [Element(self, prop["value"]["objectId"]) for prop in properties["result"]
+                if prop["name"].isdigit() and prop.get("value", {}).get("subtype") == "node"]
+
+    async def find_all(self, locator):
+        by, value = locator
+        result = await self.call_function(_FIND_ALL, None, by, value, by_value=False)
+        return await self._elements(result)
+
+    async def find(self, locator):
+        elements = await self.find_all(locator)
+        if not elements:
+            raise NoSuchElementException(f"No element matches {locator!r}")
+        return elements[0]
+
+    async def wait_for(self, locator, timeout=DEFAULT_TIMEOUT, visible=True):
+        """Wait in the page until ``locator`` matches (a visible element, by default) and return it"""
+        by, value = locator
+        result = await self.call_function(_WAIT_FOR, None, by, value, visible, timeout * 1000, by_value=False,
+                                          timeout=timeout + 5)
+        elements = await self._elements(result)
+        if not elements:
+            raise TimeoutException(f"{locator!r} not found within {timeout}s")
+        return elements[0]
+
+    async def wait_for_function(self, body, *args, timeout=DEFAULT_TIMEOUT):
+        """Wait until the JS function body ``body`` (given ``arguments``) returns a truthy value"""
+        value = await self.execute_async_script(_POLL_SCRIPT, body, list(args), timeout * 1000, timeout=timeout + 5)
+        if not value:
+            raise TimeoutException(f"Page condition not met within {timeout}s")
+        return value
+
+    async def close(self):
+        await self.connection.send("Target.closeTarget", {"targetId": self.target_id})
+
+
+class Context:
+    """An isolated browser context: its own cookies, cache and localStorage"""
+
+    def __init__(self, connection, context_id):
+        self.connection = connection
+        self.context_id = context_id
+
+    async def new_page(self, url="about:blank"):
+        target = await self.connection.send("Target.createTarget", {"url": url, "browserContextId": self.context_id})
+        attached = await self.connection.send("Target.attachToTarget", {"targetId": target["targetId"],
+                                                                        "flatten": True})
+        page = Page(self.connection, target["targetId"], attached["sessionId"])
+        await page.send("Page.enable")
+        return page
+
+    async def close(self):
+        await self.connection.send("Target.disposeBrowserContext", {"browserContextId": self.context_id})
+
+
+def find_chrome():
+    """Path of a Chrome/Chromium executable: ``ADMIN_TEST_CHROME``, ``PATH`` or Selenium Manager"""
+    configured = os.environ.get("ADMIN_TEST_CHROME")
+    if configured:
+        return configured
+    for name in CHROME_NAMES:
+        path = shutil.which(name)
+        if path:
+            return path
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.common.driver_finder import DriverFinder
+    path = DriverFinder(Service(), webdriver.ChromeOptions()).get_browser_path()
+    if not path:
+        raise FileNotFoundError("Chrome not found; set ADMIN_TEST_CHROME to its executable")
+    return path
+
+
+class Browser:
+    """A headless Chrome launched for (and owned by) this process"""
+
+    def __init__(self, connection, process=None, profile_dir=None):
+        self.connection = connection
+        self.process = process
+        self.profile_dir = profile_dir
+
+    @classmethod
+    async def launch(cls, executable=None, headless=True, timeout=DEFAULT_TIMEOUT, args=()):
+        profile_dir = tempfile.mkdtemp(prefix="admin-test-cdp-")
+        command = [executable or find_chrome(), "--remote-debugging-port=0", f"--user-data-dir={profile_dir}",
+                   "--no-first-run", "--no-default-browser-check", f"--window-size={DEFAULT_VIEWPORT}", *args]
+        if headless:
+            command.append("--headless=new")
+        process = await asyncio.create_subprocess_exec(*command, "about:blank", stdout=subprocess.DEVNULL,
+                                                       stderr=subprocess.DEVNULL)
+        # Chrome writes the port it picked, and the browser endpoint path, to this file
+        port_file = os.path.join(profile_dir, "DevToolsActivePort")
+        deadline = asyncio.get_running_loop().time() + timeout
+        lines = []
+        while len(lines) < 2:
+            if process.returncode is not None or asyncio.get_running_loop().time() > deadline:
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+                shutil.rmtree(profile_dir, ignore_errors=True)
+                raise CDPError(f"Chrome did not start: {command[0]}")
+            if os.path.exists(port_file):
+                with open(port_file) as handle:
+                    lines = handle.read().split()
+            await asyncio.sleep(0.05)
+        socket = await WebSocket.connect(f"ws://127.0.0.1:{lines[0]}{lines[1]}", timeout)
+        return cls(CDPConnection(socket), process, profile_dir)
+
+    async def new_context(self):
+        result = await self.connection.send("Target.createBrowserContext", {"disposeOnDetach": True})
+        return Context(self.connection, result["browserContextId"])
+
+    async def close(self):
+        try:
+            await self.connection.send("Browser.close", timeout=5)
+        except (CDPError, TimeoutException):
+            pass
+        await self.connection.close()
+        if self.process is not None:
+            try:
+                await asyncio.wait_for(self.process.wait(), 10)
+            except asyncio.TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+        if self.profile_dir:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
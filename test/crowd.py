@@ -0,0 +1,130 @@
+"""Concurrent-admin scenarios on the asyncio CDP backend (``cdp.py``).
+
+Every simulated admin gets its own browser context in one headless Chrome,
+all driven from one event loop: it logs in through the form, opens Add
+Product, adds a product of its own and reads back what its localStorage
+holds. Contexts do not share storage, so each admin must end up with
+exactly one product, its own.
+
+Usage:
+    python crowd.py --admins 24
+    python crowd.py --admins 50 --output reports/crowd.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+from selenium.webdriver.common.by import By
+
+from actions import PRODUCTS_KEY, SUBMIT_BUTTON, TAB_BUTTON, TOAST_SELECTOR
+from bench_storage import percentile
+from browser import base_url
+from cdp import Browser
+from seeding import READ_CATALOG_SCRIPT
+from timing import REPORTS_DIR
+
+DEFAULT_ADMINS = 12
+
+_NEW_TOAST = """
+const [selector, title] = arguments;
+return Array.from(document.querySelectorAll(selector)).some((t) => t.textContent.includes(title));
+"""
+
+
+async def login(page, origin, username="vivekjadhav", password="vivek123"):
+    await page.goto(f"{origin}/")
+    await (await page.wait_for((By.ID, "username"))).type(username)
+    await (await page.find((By.ID, "password"))).type(password)
+    await (await page.find((By.CSS_SELECTOR, "button[type='submit']"))).click()
+    await page.wait_for((By.CSS_SELECTOR, "[role='tabpanel'] > *"))
+
+
+async def add_product(page, name, **fields):
+    """Add ``name`` through the Add Product tab and wait for the success toast"""
+    await (await page.wait_for((By.XPATH, TAB_BUTTON.format(name="Add Product")))).click()
+    values = dict(name=name, category="Crowd", description="Added by a concurrent admin", price="10",
+                  quantity="5", **fields)
+    for field, value in values.items():
+        await (await page.wait_for((By.ID, field))).type(value, clear=True)
+    await (await page.find((By.XPATH, SUBMIT_BUTTON.format(label="Add Product")))).click()
+    await page.wait_for_function(_NEW_TOAST, TOAST_SELECTOR, "Product added")
+
+
+async def admin_session(browser, origin, index):
+    """One simulated admin in its own context; returns its timings and stored products"""
+    started = time.perf_counter()
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
+        opened = time.perf_counter()
+        await login(page, origin)
+        logged_in = time.perf_counter()
+        name = f"Crowd Product {index}"
+        await add_product(page, name)
+        stored = json.loads(await page.execute_script(READ_CATALOG_SCRIPT, PRODUCTS_KEY) or "[]")
+        return {
+            "admin": index,
+            "product": name,
+            "stored": [product["name"] for product in stored],
+            "open_seconds": opened - started,
+            "login_seconds": logged_in - opened,
+            "add_seconds": time.perf_counter() - logged_in,
+            "seconds": time.perf_counter() - started,
+        }
+    finally:
+        await context.close()
+
+
+async def run_concurrent_admins(origin, admins=DEFAULT_ADMINS):
+    """Run ``admins`` sessions at once in one browser and return the report dict"""
+    started = time.perf_counter()
+    async with await Browser.launch() as browser:
+        launched = time.perf_counter()
+        results = await asyncio.gather(*(admin_session(browser, origin, i) for i in range(admins)),
+                                       return_exceptions=True)
+    sessions = [r for r in results if not isinstance(r, BaseException)]
+    return {
+        "report": "crowd",
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "url": origin,
+        "admins": admins,
+        "launch_seconds": launched - started,
+        "seconds": time.perf_counter() - started,
+        "sessions": sessions,
+        "errors": [f"admin {i}: {r!r}" for i, r in enumerate(results) if isinstance(r, BaseException)],
+    }
+
+
+def print_report(report):
+    sessions = report["sessions"]
+    print(f"  {len(sessions)}/{report['admins']} admins finished in {report['seconds']:.1f}s "
+          f"(browser launch {report['launch_seconds']:.1f}s)")
+    if sessions:
+        for key in ("open_seconds", "login_seconds", "add_seconds"):
+            values = sorted(s[key] for s in sessions)
+            print(f"    {key:<14} median {percentile(values, 0.50):.2f}s  max {values[-1]:.2f}s")
+    for error in report["errors"]:
+        print(f"    {error}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--admins", type=int, default=DEFAULT_ADMINS)
+    parser.add_argument("--url", default=base_url())
+    parser.add_argument("--output", default=os.path.join(REPORTS_DIR, "crowd.json"))
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run_concurrent_admins(args.url.rstrip("/"), args.admins))
+    print_report(report)
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Report written to {args.output}")
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
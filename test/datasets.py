@@ -0,0 +1,179 @@
+"""Deterministic synthetic product catalogs for the admin test suite.
+
+Catalogs are built a batch at a time, one column per field, and each batch
+draws from its own ``random.Random`` seeded from ``(seed, batch index)``, so
+the same arguments always produce the same products. The category mix,
+dispatched ratio and low-stock ratio (quantity below 10, the threshold
+``ViewInventory`` highlights) are controlled exactly per batch.
+
+Besides count-based profiles there are size-targeted ones that pad the
+catalog to an exact serialized length of the ``ecommerce_products`` value.
+The quota profiles are relative to the largest value the browser accepts,
+which ``probe_quota`` measures in the page, so ``quota_under`` fits and
+``quota_over`` makes ``saveProducts`` in ``src/lib/storage.ts`` throw.
+
+``matching_products`` applies the inventory search to a generated catalog,
+so tests know what the app should show for a query.
+"""
+import datetime
+import random
+import re
+
+from actions import PRODUCTS_KEY
+from seeding import serialize_catalog
+
+DEFAULT_CATEGORIES = {"Electronics": 0.3, "Clothing": 0.25, "Home": 0.2, "Books": 0.15, "Toys": 0.1}
+DEFAULT_BATCH_SIZE = 5_000
+LOW_STOCK_THRESHOLD = 10
+QUOTA_MARGIN = 64  # characters either side of the quota, smaller than one product
+
+BASE_ID = 1_700_000_000_000  # ids look like the Date.now() strings addProduct creates
+BASE_TIME = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+_ADJECTIVES = ["Classic", "Compact", "Deluxe", "Eco", "Essential", "Premium", "Pro", "Smart", "Ultra", "Vintage"]
+_NOUNS = ["Backpack", "Blender", "Camera", "Chair", "Headphones", "Jacket", "Kettle", "Lamp", "Novel", "Puzzle",
+          "Sneakers", "Speaker", "Watch", "Wallet", "Yoga Mat"]
+_FILLER = ("durable lightweight reliable stylish everyday practical modern portable comfortable versatile "
+           "quality design finish material warranty").split()
+
+COUNT_PROFILES = {
+    "tiny": 10,
+    "small": 1_000,
+    "medium": 10_000,
+    "large": 100_000,
+    "huge": 300_000,
+}
+
+_PROBE_SCRIPT = """
+const [key, upper] = arguments;
+const saved = localStorage.getItem(key);
+localStorage.removeItem(key);
+let low = 0, high = upper;
+while (low < high) {
+  const mid = Math.ceil((low + high) / 2);
+  try {
+    localStorage.setItem(key, "x".repeat(mid));
+    low = mid;
+  } catch (e) {
+    high = mid - 1;
+  }
+}
+localStorage.removeItem(key);
+if (saved !== null) localStorage.setItem(key, saved);
+return low;
+"""
+
+
+def _exact_flags(rng, n, ratio):
+    """``n`` booleans of which exactly ``round(n * ratio)`` are True, shuffled"""
+    hits = round(n * ratio)
+    flags = [True] * hits + [False] * (n - hits)
+    rng.shuffle(flags)
+    return flags
+
+
+def _description(rng, length):
+    words = rng.choices(_FILLER, k=length // 6 + 2)
+    return " ".join(words)[:length].rstrip().capitalize()
+
+
+def generate_batch(start, n, seed=0, categories=None, dispatched_ratio=0.1, low_stock_ratio=0.15,
+                   description_length=60, batch_index=0):
+    """Build products ``start`` .. ``start + n - 1`` column by column"""
+    rng = random.Random(f"{seed}:{batch_index}")
+    categories = categories or DEFAULT_CATEGORIES
+    positions = range(start, start + n)
+
+    ids = [str(BASE_ID + i) for i in positions]
+    names = [f"{a} {b} {i}" for a, b, i in zip(rng.choices(_ADJECTIVES, k=n), rng.choices(_NOUNS, k=n), positions)]
+    descriptions = [_description(rng, description_length) for _ in positions]
+    prices = [round(rng.uniform(1, 2000), 2) for _ in positions]
+    quantities = [rng.randrange(0, LOW_STOCK_THRESHOLD) if low else rng.randrange(LOW_STOCK_THRESHOLD, 1000)
+                  for low in _exact_flags(rng, n, low_stock_ratio)]
+    category_column = rng.choices(list(categories), weights=list(categories.values()), k=n)
+    dispatched = _exact_flags(rng, n, dispatched_ratio)
+    created = [(BASE_TIME + datetime.timedelta(minutes=i)).strftime("%Y-%m-%dT%H:%M:%S.000Z") for i in positions]
+
+    return [
+        {"id": i, "name": nm, "description": d, "price": p, "quantity": q, "category": c,
+         "dispatched": ds, "createdAt": ts}
+        for i, nm, d, p, q, c, ds, ts in zip(ids, names, descriptions, prices, quantities, category_column,
+                                             dispatched, created)
+    ]
+
+
+def iter_catalog(count, batch_size=DEFAULT_BATCH_SIZE, **options):
+    """Yield the catalog in lists of at most ``batch_size`` products"""
+    for batch_index, start in enumerate(range(0, count, batch_size)):
+        yield generate_batch(start, min(batch_size, count - start), batch_index=batch_index, **options)
+
+
+def generate_catalog(count, batch_size=DEFAULT_BATCH_SIZE, **options):
+    """Return ``count`` products; see ``generate_batch`` for the options"""
+    products = []
+    for batch in iter_catalog(count, batch_size, **options):
+        products.extend(batch)
+    return products
+
+
+def serialized_size(products):
+    """Length of the ``ecommerce_products`` value ``saveProducts`` would write"""
+    return len(serialize_catalog(products))
+
+
+def generate_for_size(target_chars, **options):
+    """Return a catalog whose serialized value is exactly ``target_chars`` long"""
+    sample = generate_catalog(100, **options)
+    per_product = (serialized_size(sample) - 2) / len(sample) + 1  # +1 for the separating comma
+    # Overshoot the estimate slightly, then trim back to the target
+    count = max(1, int((target_chars - 2) / per_product * 1.02) + 1)
+    products = generate_catalog(count, **options)
+    size = serialized_size(products)
+    while size > target_chars and len(products) > 1:
+        size -= len(serialize_catalog(products.pop())) + 1
+    shortfall = target_chars - size
+    if shortfall < 0:
+        raise ValueError(f"A single product is larger than {target_chars} characters")
+    # Absorb the remainder in the last description so the size is exact
+    products[-1] = dict(products[-1], description=products[-1]["description"] + "." * shortfall)
+    return products
+
+
+def search_words(text):
+    """Lowercase words of ``text`` as the inventory search splits them (letters and digits)"""
+    return re.findall(r"[^\W_]+", text.lower())
+
+
+def matching_products(products, text):
+    """Products the inventory search shows for ``text``: each word starts a word of the name or description"""
+    words = search_words(text)
+    matches = []
+    for p in products:
+        own = search_words(f"{p['name']} {p['description']}")
+        if all(any(token.startswith(word) for token in own) for word in words):
+            matches.append(p)
+    return matches
+
+
+def probe_quota(driver, upper=16 * 1024 * 1024):
+    """Largest value length the browser accepts for the products key right now"""
+    return driver.execute_script(_PROBE_SCRIPT, PRODUCTS_KEY, upper)
+
+
+def quota_profiles(max_value_chars, margin=QUOTA_MARGIN):
+    """Size targets around a measured quota, as ``{profile: target_chars}``"""
+    return {
+        "quota_half": max_value_chars // 2,
+        "quota_under": max_value_chars - margin,
+        "quota_exact": max_value_chars,
+        "quota_over": max_value_chars + margin,
+    }
+
+
+def profile_catalog(name, seed=0, max_value_chars=None, **options):
+    """Build the catalog for a named profile from ``COUNT_PROFILES`` or ``quota_profiles``"""
+    if name in COUNT_PROFILES:
+        return generate_catalog(COUNT_PROFILES[name], seed=seed, **options)
+    if max_value_chars is None:
+        raise ValueError(f"Profile {name!r} needs max_value_chars (see probe_quota)")
+    return generate_for_size(quota_profiles(max_value_chars)[name], seed=seed, **options)
@@ -0,0 +1,224 @@
+"""Push-based waits for the admin test suite.
+
+``WebDriverWait`` re-checks its condition with a new WebDriver round-trip
+every 500 ms, so each wait overshoots by up to half a second. ``DomWait``
+instead installs a MutationObserver in the page and blocks in a single
+``execute_async_script`` call until the condition holds or the timeout
+passes, resolving as soon as the DOM changes in a way that satisfies it.
+
+The conditions keep the call shape of ``expected_conditions``, so switching a
+module over is an import change::
+
+    import dom_wait as EC
+    wait = DomWait(driver, 10)
+    wait.until(EC.element_to_be_clickable((By.ID, "name")))
+
+Each condition is also a plain callable taking the driver, so it still works
+with ``WebDriverWait``; ``DomWait`` falls back to polling for any callable
+it does not know.
+"""
+import time
+
+from selenium.common.exceptions import JavascriptException, StaleElementReferenceException, TimeoutException
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions
+from selenium.webdriver.support.ui import WebDriverWait
+
+import timing
+
+# Some changes (computed visibility, URL) do not always come with a mutation,
+# so the watcher also re-checks on a slow timer.
+FALLBACK_INTERVAL_MS = 100
+POLL_FREQUENCY = 0.05  # seconds, for conditions that can only be polled
+# Every ``By`` strategy; `find` in the script below handles each of them
+LOCATOR_STRATEGIES = ("id", "xpath", "link text", "partial link text", "name", "tag name", "class name",
+                      "css selector")
+
+_WATCH_SCRIPT = """
+const [condition, timeoutMs, fallbackMs, negate] = arguments;
+const done = arguments[arguments.length - 1];
+
+const find = (by, value, all) => {
+  switch (by) {
+    case "id": return all ? Array.from(document.querySelectorAll("[id='" + CSS.escape(value) + "']"))
+                          : document.getElementById(value);
+    case "xpath": {
+      if (!all) return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+      const found = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+      return Array.from({length: found.snapshotLength}, (_, i) => found.snapshotItem(i));
+    }
+    case "link text":
+    case "partial link text": {
+      const links = Array.from(document.querySelectorAll("a")).filter((a) => by === "link text"
+        ? a.innerText.trim() === value : a.innerText.includes(value));
+      return all ? links : links[0] || null;
+    }
+    case "name": value = "[name='" + CSS.escape(value) + "']"; break;
+    case "tag name": break;
+    case "class name": value = "." + CSS.escape(value); break;
+  }
+  return all ? Array.from(document.querySelectorAll(value)) : document.querySelector(value);
+};
+const visible = (el) => {
+  if (!el || !el.isConnected || el.getClientRects().length === 0) return false;
+  const style = getComputedStyle(el);
+  return style.visibility !== "hidden" && style.display !== "none" && style.opacity !== "0";
+};
+const target = () => condition.element || find(condition.by, condition.value, false);
+
+const checks = {
+  presence: () => target(),
+  presence_all: () => { const els = find(condition.by, condition.value, true); return els.length ? els : null; },
+  visibility: () => { const el = target(); return visible(el) ? el : null; },
+  invisibility: () => { const el = target(); return el && visible(el) ? null : (el || true); },
+  clickable: () => { const el = target(); return visible(el) && !el.disabled ? el : null; },
+  text: () => { const el = target(); return el && el.textContent.includes(condition.text) ? true : null; },
+  url_contains: () => location.href.includes(condition.text) ? true : null,
+  url_to_be: () => location.href === condition.text ? true : null,
+  staleness: () => condition.element.isConnected ? null : true,
+};
+const check = () => {
+  let result = null;
+  try { result = checks[condition.kind]() || null; } catch (e) { result = null; }
+  if (negate) return result ? null : true;
+  return result;
+};
+
+const first = check();
+if (first) return done(first);
+let finished = false;
+const finish = (value) => {
+  if (finished) return;
+  finished = true;
+  observer.disconnect();
+  clearInterval(fallback);
+  clearTimeout(deadline);
+  done(value);
+};
+const recheck = () => { const result = check(); if (result) finish(result); };
+const observer = new MutationObserver(recheck);
+observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+const fallback = setInterval(recheck, fallbackMs);
+const deadline = setTimeout(() => finish(null), timeoutMs);
+"""
+
+
+class DomCondition:
+    """A condition ``DomWait`` can evaluate in the page; callable like an ``expected_conditions`` one"""
+
+    def __init__(self, kind, fallback, locator=None, element=None, text=None):
+        if locator and locator[0] not in LOCATOR_STRATEGIES:
+            raise ValueError(f"unsupported locator strategy {locator[0]!r}; use one of the By constants")
+        self.kind = kind
+        self.fallback = fallback
+        self.locator = locator
+        self.element = element
+        self.text = text
+
+    def __call__(self, driver):
+        return self.fallback(driver)
+
+    def script_argument(self):
+        by, value = self.locator if self.locator else (None, None)
+        return {"kind": self.kind, "by": by, "value": value, "element": self.element, "text": self.text}
+
+    def __repr__(self):
+        return f"{self.kind}({self.locator or self.element!r})"
+
+
+def _target(mark):
+    """Split the ``mark`` argument of ``expected_conditions`` into (locator, element)"""
+    if isinstance(mark, WebElement):
+        return None, mark
+    return tuple(mark), None
+
+
+def presence_of_element_located(locator):
+    return DomCondition("presence", expected_conditions.presence_of_element_located(locator), locator=locator)
+
+
+def presence_of_all_elements_located(locator):
+    return DomCondition("presence_all", expected_conditions.presence_of_all_elements_located(locator),
+                        locator=locator)
+
+
+def visibility_of_element_located(locator):
+    return DomCondition("visibility", expected_conditions.visibility_of_element_located(locator), locator=locator)
+
+
+def invisibility_of_element_located(locator):
+    locator, element = _target(locator)
+    return DomCondition("invisibility", expected_conditions.invisibility_of_element_located(locator or element),
+                        locator=locator, element=element)
+
+
+def element_to_be_clickable(mark):
+    locator, element = _target(mark)
+    return DomCondition("clickable", expected_conditions.element_to_be_clickable(mark),
+                        locator=locator, element=element)
+
+
+def text_to_be_present_in_element(locator, text):
+    return DomCondition("text", expected_conditions.text_to_be_present_in_element(locator, text),
+                        locator=locator, text=text)
+
+
+def url_contains(url):
+    return DomCondition("url_contains", expected_conditions.url_contains(url), text=url)
+
+
+def url_to_be(url):
+    return DomCondition("url_to_be", expected_conditions.url_to_be(url), text=url)
+
+
+def staleness_of(element):
+    return DomCondition("staleness", expected_conditions.staleness_of(element), element=element)
+
+
+class DomWait:
+    """Drop-in for ``WebDriverWait`` that waits in the page instead of polling"""
+
+    def __init__(self, driver, timeout, fallback_interval_ms=FALLBACK_INTERVAL_MS):
+        self._driver = driver
+        self._timeout = float(timeout)
+        self._fallback_ms = fallback_interval_ms
+
+    def until(self, method, message=""):
+        """Wait until ``method`` holds and return its value, like ``WebDriverWait.until``"""
+        with timing.category("wait"):
+            return self._wait(method, message, negate=False)
+
+    def until_not(self, method, message=""):
+        """Wait until ``method`` no longer holds"""
+        with timing.category("wait"):
+            return self._wait(method, message, negate=True)
+
+    def _wait(self, method, message, negate):
+        if not isinstance(method, DomCondition):
+            polling = WebDriverWait(self._driver, self._timeout, poll_frequency=POLL_FREQUENCY)
+            return polling.until_not(method, message) if negate else polling.until(method, message)
+
+        deadline = time.monotonic() + self._timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                result = self._driver.execute_async_script(
+                    _WATCH_SCRIPT, method.script_argument(), remaining * 1000, self._fallback_ms, negate)
+            except JavascriptException as error:
+                # The document was replaced mid-wait (navigation); watch the new one
+                if "unloaded" in str(error):
+                    continue
+                raise
+            except StaleElementReferenceException:
+                if method.kind == "staleness" and not negate:
+                    return True
+                raise
+            except TimeoutException:
+                # The driver's script timeout is shorter than this wait
+                break
+            if result is None:
+                break
+            return True if negate else result
+        raise TimeoutException(message or f"{method!r} not met within {self._timeout:g}s")
@@ -0,0 +1,96 @@
+"""Hermetic localStorage fixtures for the admin test suite.
+
+Every test starts from the same state no matter which tests ran before it or
+in which order: the full localStorage contents are snapshotted in ``setUp``
+and restored in ``tearDown``, and in between the suite keys are reset and the
+catalog the test declared with ``@with_catalog`` is written in one step.
+
+Set ``ADMIN_TEST_STORAGE_BACKEND=keyed`` to run the whole suite against the
+keyed storage backend instead of the default blob backend.
+"""
+import os
+
+from actions import PRODUCTS_KEY
+from timing import timed_step
+from seeding import BACKEND_KEY, DEFAULT_CHUNK_SIZE, read_catalog, seed_catalog, serialize_catalog
+
+AUTH_KEY = "isAuthenticated"
+SUITE_KEYS = (PRODUCTS_KEY, AUTH_KEY, BACKEND_KEY)
+FIXTURE_CREATED_AT = "2024-01-01T00:00:00.000Z"
+
+_SNAPSHOT_SCRIPT = """
+const state = {};
+for (let i = 0; i < localStorage.length; i++) {
+  const key = localStorage.key(i);
+  state[key] = localStorage.getItem(key);
+}
+return state;
+"""
+
+_RESTORE_SCRIPT = """
+localStorage.clear();
+for (const [key, value] of Object.entries(arguments[0])) localStorage.setItem(key, value);
+"""
+
+_RESET_SCRIPT = """
+const [keys, productsKey, catalog, backend, backendKey] = arguments;
+Object.keys(localStorage)
+  .filter((key) => keys.includes(key) || key.startsWith(productsKey + ":"))
+  .forEach((key) => localStorage.removeItem(key));
+if (backend) localStorage.setItem(backendKey, backend);
+if (catalog !== null) localStorage.setItem(productsKey, catalog);
+"""
+
+
+def product(name, category="General", description=None, price=100.0, quantity=10, dispatched=False, id=None):
+    """Build a product dict in the ``Product`` shape from ``src/types/product.ts``"""
+    return {
+        "id": id or f"fixture-{name.lower().replace(' ', '-')}",
+        "name": name,
+        "description": description if description is not None else f"{name} description",
+        "price": float(price),
+        "quantity": int(quantity),
+        "category": category,
+        "dispatched": dispatched,
+        "createdAt": FIXTURE_CREATED_AT,
+    }
+
+
+def with_catalog(*products):
+    """Declare the catalog a test needs; it is injected before the test runs"""
+    def decorate(test_method):
+        test_method.catalog = list(products)
+        return test_method
+    return decorate
+
+
+class StorageFixtures:
+    """Mixin that isolates each test's localStorage; requires ``self.driver`` on the app origin"""
+
+    def snapshot_storage(self):
+        """Return every localStorage key/value pair"""
+        return self.driver.execute_script(_SNAPSHOT_SCRIPT)
+
+    def restore_storage(self, snapshot):
+        """Replace localStorage with a previous ``snapshot_storage`` result"""
+        self.driver.execute_script(_RESTORE_SCRIPT, snapshot)
+
+    @timed_step()
+    def reset_storage(self, catalog=None):
+        """Drop the suite keys and write ``catalog`` (a list of products) if given"""
+        payload = serialize_catalog(catalog) if catalog is not None else None
+        backend = os.environ.get("ADMIN_TEST_STORAGE_BACKEND")
+        if payload is not None and len(payload) > DEFAULT_CHUNK_SIZE:
+            # Too big for one script argument; let the seeding API stream it
+            self.driver.execute_script(_RESET_SCRIPT, list(SUITE_KEYS), PRODUCTS_KEY, None, backend, BACKEND_KEY)
+            seed_catalog(self.driver, catalog, validate=False)
+            return
+        self.driver.execute_script(_RESET_SCRIPT, list(SUITE_KEYS), PRODUCTS_KEY, payload, backend, BACKEND_KEY)
+
+    def stored_products(self):
+        """Products currently persisted under the products key"""
+        return read_catalog(self.driver)
+
+    def declared_catalog(self):
+        """Catalog attached to the running test method by ``@with_catalog``"""
+        return getattr(getattr(self, self._testMethodName), "catalog", None)
@@ -0,0 +1,191 @@
+"""Interaction-latency budgets for the admin test suite.
+
+Interactions are timed inside the page with the Performance API: a
+``performance.mark`` right before the interaction is triggered and a
+``performance.measure`` once the app has visibly finished it and painted,
+so WebDriver round-trips are not part of the number:
+
+- tab switch: until the new Dashboard tab panel has mounted its content
+- submit: until the AddProduct/UpdateProduct toast appears
+- confirm: until the DeleteProduct alert dialog has closed and its toast appears
+
+The median of several samples is compared against its entry in
+``perf_baseline.json`` (committed next to this file), and fails when it is
+slower than that baseline by more than the tolerance. The committed file
+has no entries yet, so until a baseline is recorded on the reference
+machine the medians are only printed and nothing is gated:
+
+    (unset)                  fail on regressions; interactions without a baseline are only printed
+    ADMIN_TEST_PERF=assert   fail on regressions and on interactions without a baseline
+    ADMIN_TEST_PERF=record   write every measured interaction to reports/perf_baseline.json
+
+Recording never touches the committed file. Baselines are machine-specific,
+so record them on the machine that runs the comparison (e.g. the CI runner),
+then copy ``reports/perf_baseline.json`` over ``perf_baseline.json`` and
+commit it. Parallel workers recording at once take turns through a lock file.
+"""
+import json
+import os
+import statistics
+import tempfile
+import time
+
+from selenium.common.exceptions import TimeoutException
+
+from actions import TOAST_SELECTOR, WAIT_TIMEOUT
+from timing import REPORTS_DIR
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "perf_baseline.json")
+RECORD_PATH = os.path.join(REPORTS_DIR, "perf_baseline.json")
+DEFAULT_TOLERANCE_PERCENT = 25
+DEFAULT_SAMPLES = 5
+TAB_SWITCH_SAMPLES = 15  # tab switches are short, so their median needs more samples
+LOCK_TIMEOUT = 30
+
+_MEASURE_SCRIPT = """
+const [kind, label, toastSelector, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const byText = (selector) => Array.from(document.querySelectorAll(selector)).find((el) => el.textContent.trim() === label);
+const freshToast = () => Array.from(document.querySelectorAll(toastSelector)).find((t) => !t.dataset.seen);
+document.querySelectorAll(toastSelector).forEach((t) => { t.dataset.seen = "1"; });
+
+const target = byText({tab: "button[role='tab']", submit: "button[type='submit']",
+                       confirm: "[role='alertdialog'] button"}[kind]);
+if (!target) return done({error: "no " + kind + " control labelled " + label});
+let trigger = () => target.click();
+let finished;
+if (kind === "tab") {
+  // Radix tabs activate on mousedown rather than click
+  trigger = () => target.dispatchEvent(new MouseEvent("mousedown", {bubbles: true, button: 0}));
+  finished = () => {
+    const panel = document.getElementById(target.getAttribute("aria-controls"));
+    return panel && panel.dataset.state === "active" && panel.childElementCount > 0;
+  };
+} else if (kind === "submit") {
+  finished = freshToast;
+} else {
+  finished = () => !document.querySelector("[role='alertdialog']") && freshToast();
+}
+
+const name = "admin-perf:" + kind + ":" + label;
+performance.clearMarks(name);
+performance.clearMeasures(name);
+performance.mark(name);
+trigger();
+const deadline = performance.now() + timeoutMs;
+const poll = () => {
+  if (performance.now() > deadline) return done({error: kind + " " + label + " did not finish"});
+  if (!finished()) return requestAnimationFrame(poll);
+  // One more frame so the measurement includes the paint
+  requestAnimationFrame(() => done({ms: performance.measure(name, name).duration}));
+};
+poll();
+"""
+
+
+def perf_mode():
+    """``"assert"``, ``"record"`` or ``None`` (measure only)"""
+    mode = os.environ.get("ADMIN_TEST_PERF", "").strip().lower()
+    return mode if mode in ("assert", "record") else None
+
+
+def load_baseline(path=BASELINE_PATH):
+    if not os.path.exists(path):
+        return {"tolerance_percent": DEFAULT_TOLERANCE_PERCENT, "interactions": {}}
+    with open(path) as handle:
+        return json.load(handle)
+
+
+def save_baseline(baseline, path=RECORD_PATH):
+    """Write ``baseline`` atomically, so a reader never sees half a file"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(handle, "w") as out:
+        json.dump(baseline, out, indent=2, sort_keys=True)
+        out.write("\n")
+    os.replace(temp_path, path)
+
+
+def record_entry(name, median_ms, samples, path=RECORD_PATH, timeout=LOCK_TIMEOUT):
+    """Add one interaction to the recorded baseline at ``path``
+
+    The read-modify-write happens under ``<path>.lock`` (created exclusively),
+    so ``runner.py`` workers recording at the same time keep each other's
+    entries.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    lock = path + ".lock"
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            break
+        except FileExistsError:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"{lock} is still held; remove it if no run is recording")
+            time.sleep(0.05)
+    try:
+        baseline = load_baseline(path)
+        baseline.setdefault("interactions", {})[name] = {"median_ms": round(median_ms, 2), "samples": samples}
+        save_baseline(baseline, path)
+    finally:
+        os.remove(lock)
+
+
+def compare(name, samples, baseline, tolerance_percent=None):
+    """Compare the median of ``samples`` (ms) with ``baseline``; returns a result dict
+
+    ``status`` is ``"new"`` when there is no baseline entry yet, otherwise
+    ``"ok"`` or ``"regressed"``.
+    """
+    median = statistics.median(samples)
+    tolerance = tolerance_percent if tolerance_percent is not None else baseline.get(
+        "tolerance_percent", DEFAULT_TOLERANCE_PERCENT)
+    entry = baseline.get("interactions", {}).get(name)
+    result = {"name": name, "median_ms": median, "samples": len(samples), "tolerance_percent": tolerance}
+    if entry is None:
+        result["status"] = "new"
+        return result
+    limit = entry["median_ms"] * (1 + tolerance / 100)
+    result.update(baseline_ms=entry["median_ms"], limit_ms=limit,
+                  status="regressed" if median > limit else "ok")
+    return result
+
+
+class InteractionTiming:
+    """Mixin for test cases that time Dashboard interactions through ``self.driver``"""
+
+    def measure_interaction(self, kind, label):
+        """Trigger one interaction in the page and return how long it took (ms)"""
+        result = self.driver.execute_async_script(_MEASURE_SCRIPT, kind, label, TOAST_SELECTOR, WAIT_TIMEOUT * 1000)
+        if "error" in result:
+            raise TimeoutException(result["error"])
+        return result["ms"]
+
+    def measure_tab_switch(self, name):
+        return self.measure_interaction("tab", name)
+
+    def measure_submit(self, label):
+        return self.measure_interaction("submit", label)
+
+    def measure_confirm(self, action="Delete"):
+        return self.measure_interaction("confirm", action)
+
+    def assert_latency_budget(self, name, samples):
+        """Check ``samples`` against the committed baseline, or record them (see the module docstring)"""
+        mode = perf_mode()
+        baseline = load_baseline()
+        tolerance = os.environ.get("ADMIN_TEST_PERF_TOLERANCE")
+        result = compare(name, samples, baseline, float(tolerance) if tolerance else None)
+        print(f"  → {name}: median {result['median_ms']:.1f}ms over {len(samples)} samples"
+              + (f" (baseline {result['baseline_ms']:.1f}ms)" if "baseline_ms" in result else ""))
+        if mode == "record":
+            record_entry(name, result["median_ms"], len(samples))
+        elif mode == "assert" and result["status"] == "new":
+            self.fail(f"{name} has no entry in {os.path.basename(BASELINE_PATH)}; record one with "
+                      f"ADMIN_TEST_PERF=record and copy test/reports/perf_baseline.json over it")
+        elif result["status"] == "regressed":
+            self.fail(f"{name} regressed: median {result['median_ms']:.1f}ms is over "
+                      f"{result['limit_ms']:.1f}ms ({result['tolerance_percent']:g}% above the "
+                      f"{result['baseline_ms']:.1f}ms baseline)")
+        return result
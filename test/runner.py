@@ -0,0 +1,200 @@
+"""Run the Selenium suite across a pool of isolated browser sessions.
+
+Each worker is a separate process with its own headless Chrome and a fresh
+profile directory (optionally a copy of a warm profile template), so the
+``ecommerce_products`` and ``isAuthenticated`` localStorage keys never leak
+between workers. By default the workers pull tests from one shared queue,
+longest first by their recorded durations (see ``scheduler.py``), so they all
+finish at about the same time. Results are merged and printed once every
+worker has finished, and the workers' timing spans are written to one timing
+report (see ``timing.py``).
+
+Usage:
+    python runner.py                      # one worker per CPU core
+    python runner.py --workers 4
+    python runner.py --schedule lpt       # static longest-first shards from timing history
+    python runner.py --workers 2 EcommerceAdminTest.test_06_add_product_complete
+    python runner.py --dist ../dist       # each worker serves the build on its own port
+    python runner.py --profile-template ~/.cache/admin-test-profile
+"""
+import argparse
+import contextlib
+import importlib.util
+import io
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+import browser
+import scheduler
+import timing
+
+SCHEDULES = ("queue", "lpt", "round-robin")
+SUITE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test.py")
+
+
+def load_suite_module():
+    """Import test.py under a name that cannot clash with the stdlib ``test`` package"""
+    suite_dir = os.path.dirname(SUITE_PATH)
+    if suite_dir not in sys.path:
+        sys.path.insert(0, suite_dir)
+    spec = importlib.util.spec_from_file_location("admin_suite", SUITE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def iter_test_names(suite):
+    """Yield ``Class.test_name`` ids for every test in ``suite``"""
+    for item in suite:
+        if isinstance(item, unittest.TestSuite):
+            yield from iter_test_names(item)
+        else:
+            yield f"{type(item).__name__}.{item._testMethodName}"
+
+
+def collect_test_names(selected=None):
+    """All test ids in the suite, or just ``selected`` if given"""
+    if selected:
+        return list(selected)
+    module = load_suite_module()
+    return list(iter_test_names(unittest.defaultTestLoader.loadTestsFromModule(module)))
+
+
+def split_round_robin(names, workers):
+    """Deal tests out to ``workers`` shards, keeping suite order within each shard"""
+    shards = [[] for _ in range(workers)]
+    for index, name in enumerate(names):
+        shards[index % workers].append(name)
+    return [shard for shard in shards if shard]
+
+
+def run_shard(job):
+    """Worker entry point: run one shard (a list of names, or a shared work queue) in a private headless browser"""
+    worker, work, base_url = job
+    profile_dir = tempfile.mkdtemp(prefix=f"admin-test-worker{worker}-")
+    os.environ["ADMIN_TEST_HEADLESS"] = "1"
+    os.environ["ADMIN_TEST_PROFILE_DIR"] = profile_dir
+    if base_url:
+        os.environ["ADMIN_TEST_BASE_URL"] = base_url
+
+    output = io.StringIO()
+    timing.REPORT.clear()
+    browser.STARTUPS.clear()
+    started = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(output):
+            module = load_suite_module()
+            if isinstance(work, list):
+                suite = unittest.defaultTestLoader.loadTestsFromNames(work, module)
+            else:
+                suite = scheduler.QueueSuite(work, module)
+            result = unittest.TextTestRunner(stream=output, verbosity=2).run(suite)
+    finally:
+        # Pool workers exit without running atexit handlers
+        browser.stop_shared_service()
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+    return {
+        "worker": worker,
+        "tests_run": result.testsRun,
+        "failures": [(test.id(), trace) for test, trace in result.failures],
+        "errors": [(test.id(), trace) for test, trace in result.errors],
+        "skipped": [(test.id(), reason) for test, reason in result.skipped],
+        "duration": time.perf_counter() - started,
+        "output": output.getvalue(),
+        "timing": timing.REPORT.records,
+        "startups": browser.STARTUPS,
+    }
+
+
+def print_merged(results, elapsed):
+    """Print every worker's output followed by one combined summary"""
+    results = sorted(results, key=lambda r: r["worker"])
+    for result in results:
+        print("=" * 70)
+        print(f"WORKER {result['worker']} ({result['tests_run']} tests, {result['duration']:.1f}s)")
+        print("=" * 70)
+        print(result["output"])
+
+    failures = [f for r in results for f in r["failures"]]
+    errors = [e for r in results for e in r["errors"]]
+    skipped = sum(len(r["skipped"]) for r in results)
+    tests_run = sum(r["tests_run"] for r in results)
+
+    for label, entries in (("FAIL", failures), ("ERROR", errors)):
+        for test_id, trace in entries:
+            print("=" * 70)
+            print(f"{label}: {test_id}")
+            print("-" * 70)
+            print(trace)
+
+    busy = sum(r["duration"] for r in results)
+    print("-" * 70)
+    print(f"Ran {tests_run} tests in {elapsed:.1f}s across {len(results)} workers "
+          f"(worker time {busy:.1f}s, speedup {busy / elapsed if elapsed else 0:.1f}x)")
+    if failures or errors:
+        print(f"FAILED (failures={len(failures)}, errors={len(errors)}, skipped={skipped})")
+        return False
+    print(f"OK (skipped={skipped})" if skipped else "OK")
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("tests", nargs="*", help="test ids such as EcommerceAdminTest.test_01_login_valid_credentials")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--base-url", default=os.environ.get("ADMIN_TEST_BASE_URL"))
+    parser.add_argument("--schedule", choices=SCHEDULES, default="queue",
+                        help="queue: workers pull longest-first from one queue; lpt: static longest-first "
+                             "packing; round-robin: deal tests out in suite order")
+    parser.add_argument("--dist", help="serve this production build from every worker (see server.py)")
+    parser.add_argument("--profile-template", help="warm Chrome profile every worker starts from "
+                                                   "(created on first use)")
+    args = parser.parse_args(argv)
+    if args.dist:
+        os.environ["ADMIN_TEST_DIST"] = os.path.abspath(args.dist)
+    if args.profile_template:
+        template = os.path.abspath(args.profile_template)
+        if not os.path.isdir(template) or not os.listdir(template):
+            print(f"Preparing profile template {template}...")
+            browser.prepare_profile_template(template, args.base_url or browser.base_url())
+            browser.stop_shared_service()
+        os.environ["ADMIN_TEST_PROFILE_TEMPLATE"] = template
+
+    names = collect_test_names(args.tests)
+    workers = max(1, min(args.workers, len(names)))
+    durations = scheduler.load_durations()
+    print(f"Running {len(names)} tests on {workers} workers ({args.schedule} schedule, "
+          f"{sum(name in durations for name in names)} with recorded durations)...")
+
+    started = time.perf_counter()
+    context = multiprocessing.get_context("spawn")
+    with context.Manager() as manager, context.Pool(workers) as pool:
+        if args.schedule == "queue":
+            work_queue = manager.Queue()
+            scheduler.fill_queue(work_queue, names, durations)
+            jobs = [(worker, work_queue, args.base_url) for worker in range(workers)]
+        else:
+            if args.schedule == "lpt":
+                shards, loads = scheduler.lpt_shards(names, durations, workers)
+                print("Estimated shard times: " + ", ".join(f"{load:.0f}s" for load in loads))
+            else:
+                shards = split_round_robin(names, workers)
+            jobs = [(worker, shard, args.base_url) for worker, shard in enumerate(shards)]
+        results = list(pool.imap_unordered(run_shard, jobs))
+    elapsed = time.perf_counter() - started
+    passed = print_merged(results, elapsed)
+    records = [record for result in results for record in result["timing"]]
+    timing.print_summary(records)
+    browser.print_startups([startup for result in results for startup in result["startups"]])
+    print(f"Timing report written to {timing.write_reports(records, elapsed=elapsed)}")
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""Duration-aware test scheduling for ``runner.py``.
+
+Every run appends per-test durations to ``reports/timing-history.jsonl``
+(see ``timing.py``). The scheduler estimates each test's duration as its
+median over the last few runs; tests with no history get the median of the
+ones that have it. Two ways of using the estimates:
+
+- ``lpt_shards``: static longest-processing-time-first bin packing. Tests
+  are taken longest first and each goes to the least loaded worker.
+- ``QueueSuite``: a shared work queue, filled longest first, that every
+  worker pulls from until it is empty. Workers that draw short tests simply
+  take more of them, so estimates that are off still balance out.
+"""
+import heapq
+import json
+import os
+import queue
+import statistics
+import unittest
+
+import timing
+
+HISTORY_WINDOW = 10  # runs
+DEFAULT_SECONDS = 5.0  # estimate when there is no history at all
+
+
+def history_path():
+    """The history file ``timing.write_reports`` appends to"""
+    report = os.environ.get("ADMIN_TEST_TIMING_REPORT") or timing.DEFAULT_REPORT
+    return os.path.join(os.path.dirname(os.path.abspath(report)), timing.HISTORY_FILE)
+
+
+def short_id(test_id):
+    """``Class.test_name`` for a full test id such as ``admin_suite.EcommerceAdminTest.test_01_login``"""
+    return ".".join(test_id.rsplit(".", 2)[-2:])
+
+
+def load_durations(path=None, window=HISTORY_WINDOW):
+    """Median duration (seconds) per ``Class.test_name`` over the last ``window`` runs"""
+    path = path or history_path()
+    if not os.path.exists(path):
+        return {}
+    with open(path) as handle:
+        runs = [json.loads(line) for line in handle if line.strip()]
+    samples = {}
+    for run in runs[-window:]:
+        for test_id, seconds in run.get("tests", {}).items():
+            samples.setdefault(short_id(test_id), []).append(seconds)
+    return {name: statistics.median(values) for name, values in samples.items()}
+
+
+def estimate(names, durations):
+    """Estimated seconds for every name; unknown tests get the median known duration"""
+    fallback = statistics.median(durations.values()) if durations else DEFAULT_SECONDS
+    return {name: durations.get(name, fallback) for name in names}
+
+
+def longest_first(names, durations):
+    """``names`` sorted by estimated duration, longest first (suite order breaks ties)"""
+    estimates = estimate(names, durations)
+    return sorted(names, key=lambda name: -estimates[name])
+
+
+def lpt_shards(names, durations, workers):
+    """Pack tests into ``workers`` shards, longest first onto the least loaded shard
+
+    Returns ``(shards, loads)`` where ``loads`` are the estimated seconds per shard.
+    """
+    estimates = estimate(names, durations)
+    heap = [(0.0, worker) for worker in range(max(1, min(workers, len(names))))]
+    shards = [[] for _ in heap]
+    loads = [0.0 for _ in heap]
+    for name in longest_first(names, durations):
+        load, worker = heapq.heappop(heap)
+        shards[worker].append(name)
+        loads[worker] = load + estimates[name]
+        heapq.heappush(heap, (loads[worker], worker))
+    return shards, loads
+
+
+def fill_queue(work_queue, names, durations):
+    """Put ``names`` on ``work_queue`` longest first"""
+    for name in longest_first(names, durations):
+        work_queue.put(name)
+
+
+class QueueSuite(unittest.TestSuite):
+    """A suite whose tests are pulled from a shared queue while it runs
+
+    Tests are loaded one at a time as the run reaches them, so several
+    workers can drain the same queue. ``TestSuite.run`` keeps a class fixture
+    (``setUpClass``, e.g. the browser) alive while consecutive tests share the
+    class, so pulling tests one by one does not restart the browser.
+    """
+
+    def __init__(self, work_queue, module, loader=None):
+        super().__init__()
+        self._queue = work_queue
+        self._module = module
+        self._loader = loader or unittest.defaultTestLoader
+        self.taken = []
+
+    def __iter__(self):
+        while True:
+            try:
+                name = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            self.taken.append(name)
+            yield from self._loader.loadTestsFromName(name, self._module)
+
+    def countTestCases(self):
+        return len(self.taken)
+
+    def _removeTestAtIndex(self, index):
+        pass  # tests are never stored, so there is nothing to release
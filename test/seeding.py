@@ -0,0 +1,176 @@
+"""Bulk catalog seeding for the admin test suite.
+
+Writes a whole catalog straight into the ``ecommerce_products`` key in the
+``Product`` shape from ``src/types/product.ts`` without touching the Add
+Product form. Catalogs that serialize to less than ``chunk_size`` characters
+go over in a single browser round-trip; larger ones are streamed in chunks
+into a page-side buffer and committed with one ``setItem`` at the end, which
+keeps each WebDriver payload small.
+
+The blob is the format of the default storage backend. When the app runs
+with the ``keyed`` backend it migrates the blob into per-product keys the
+next time a page loads, so seeding works the same way for both backends;
+``read_catalog`` understands either format. The ``memory`` backend never
+persists anything, so catalogs too big for the quota are loaded into the
+running page with ``seed_memory_catalog`` instead.
+"""
+import json
+import time
+
+from actions import PRODUCTS_KEY
+
+BACKEND_KEY = "ecommerce_storage_backend"
+BACKENDS = ("blob", "keyed", "memory")
+PERSISTENT_BACKENDS = ("blob", "keyed")
+PRODUCT_FIELDS = ("id", "name", "description", "price", "quantity", "category", "dispatched", "createdAt")
+DEFAULT_CHUNK_SIZE = 1_000_000  # characters of JSON per round-trip
+
+_WRITE_SCRIPT = """
+try {
+  localStorage.setItem(arguments[0], arguments[1]);
+  return null;
+} catch (e) {
+  return e.name + ": " + e.message;
+}
+"""
+
+_APPEND_SCRIPT = """
+window.__seedBuffer = (arguments[0] ? [] : window.__seedBuffer || []);
+window.__seedBuffer.push(arguments[1]);
+"""
+
+_COMMIT_SCRIPT = """
+const payload = (window.__seedBuffer || []).join("");
+delete window.__seedBuffer;
+try {
+  localStorage.setItem(arguments[0], payload);
+  return null;
+} catch (e) {
+  return e.name + ": " + e.message;
+}
+"""
+
+_LOAD_MEMORY_SCRIPT = """
+const storage = window.__ecommerceStorage;
+const payload = (window.__seedBuffer || []).join("");
+delete window.__seedBuffer;
+if (!storage) return "window.__ecommerceStorage is missing";
+if (storage.getStorageBackend() !== "memory") return "the app is not using the memory backend";
+storage.saveProducts(JSON.parse(payload));
+return null;
+"""
+
+
+class SeedError(Exception):
+    """The browser refused to store the catalog (usually QuotaExceededError)"""
+
+
+def serialize_catalog(products):
+    """Serialize ``products`` exactly as ``saveProducts`` in storage.ts would"""
+    return json.dumps(products, separators=(",", ":"), ensure_ascii=False)
+
+
+def validate_product(item):
+    """Raise ``ValueError`` if ``item`` does not match the Product shape"""
+    missing = [field for field in PRODUCT_FIELDS if field not in item]
+    if missing:
+        raise ValueError(f"Product {item.get('id')!r} is missing {', '.join(missing)}")
+
+
+def seed_catalog(driver, products, chunk_size=DEFAULT_CHUNK_SIZE, validate=True):
+    """Replace the stored catalog with ``products`` and return seeding stats
+
+    ``driver`` must already be on the app origin. The page keeps the catalog it
+    loaded in memory (``src/lib/product-store.ts``), so reload afterwards to
+    see the new data.
+    """
+    if validate:
+        for item in products:
+            validate_product(item)
+    payload = serialize_catalog(products)
+    started = time.perf_counter()
+    if len(payload) <= chunk_size:
+        error = driver.execute_script(_WRITE_SCRIPT, PRODUCTS_KEY, payload)
+        round_trips = 1
+    else:
+        chunks = [payload[i:i + chunk_size] for i in range(0, len(payload), chunk_size)]
+        for index, chunk in enumerate(chunks):
+            driver.execute_script(_APPEND_SCRIPT, index == 0, chunk)
+        error = driver.execute_script(_COMMIT_SCRIPT, PRODUCTS_KEY)
+        round_trips = len(chunks) + 1
+    if error:
+        raise SeedError(f"Could not seed {len(products)} products ({len(payload)} chars): {error}")
+    return {
+        "products": len(products),
+        "chars": len(payload),
+        "round_trips": round_trips,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def seed_memory_catalog(driver, products, chunk_size=DEFAULT_CHUNK_SIZE, validate=True):
+    """Load ``products`` into the running page's memory backend and return seeding stats
+
+    The app must already be using the ``memory`` backend (see ``set_backend``)
+    and expose ``window.__ecommerceStorage``. Nothing reaches localStorage, so
+    the catalog is gone after the next page load.
+    """
+    if validate:
+        for item in products:
+            validate_product(item)
+    payload = serialize_catalog(products)
+    started = time.perf_counter()
+    chunks = [payload[i:i + chunk_size] for i in range(0, len(payload), chunk_size)]
+    for index, chunk in enumerate(chunks):
+        driver.execute_script(_APPEND_SCRIPT, index == 0, chunk)
+    error = driver.execute_script(_LOAD_MEMORY_SCRIPT)
+    if error:
+        raise SeedError(f"Could not load {len(products)} products into memory: {error}")
+    return {
+        "products": len(products),
+        "chars": len(payload),
+        "round_trips": len(chunks) + 1,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+READ_CATALOG_SCRIPT = """
+const key = arguments[0];
+const blob = localStorage.getItem(key);
+if (blob !== null) return blob;
+const meta = JSON.parse(localStorage.getItem(key + ":meta") || "null");
+if (!meta) return null;
+const products = [];
+for (let chunk = 0; chunk < meta.chunks; chunk++) {
+  for (const id of JSON.parse(localStorage.getItem(key + ":chunk:" + chunk) || "[]")) {
+    const item = localStorage.getItem(key + ":item:" + id);
+    if (item !== null) products.push(JSON.parse(item));
+  }
+}
+return JSON.stringify(products);
+"""
+
+_CLEAR_SCRIPT = """
+const key = arguments[0];
+Object.keys(localStorage)
+  .filter((k) => k === key || k.startsWith(key + ":"))
+  .forEach((k) => localStorage.removeItem(k));
+"""
+
+
+def read_catalog(driver):
+    """Return the products currently stored in the browser, in either backend's format"""
+    data = driver.execute_script(READ_CATALOG_SCRIPT, PRODUCTS_KEY)
+    return json.loads(data) if data else []
+
+
+def clear_catalog(driver):
+    """Remove the stored catalog entirely, including any keyed-backend records"""
+    driver.execute_script(_CLEAR_SCRIPT, PRODUCTS_KEY)
+
+
+def set_backend(driver, name):
+    """Select the storage backend the app uses from the next page load on"""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown storage backend {name!r}")
+    driver.execute_script("localStorage.setItem(arguments[0], arguments[1])", BACKEND_KEY, name)
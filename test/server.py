@@ -0,0 +1,190 @@
+"""In-process static server for a production build of the app.
+
+The Vite dev server transforms and serves every module separately, so page
+loads are slower and noisier than in production. ``StaticServer`` serves a
+pre-built ``dist/`` folder instead, from a thread in the test process:
+
+- on a free port picked by the OS, so every worker gets its own origin
+- gzip for text assets when the browser accepts it (compressed once, kept in memory)
+- ``Cache-Control: public, max-age=31536000, immutable`` for the
+  content-hashed files under ``/assets/``; ``no-cache`` plus an ``ETag`` for
+  everything else, answered with ``304`` when unchanged
+- ``index.html`` for any other path without a file, as the SPA routes expect
+
+Build with the storage hook enabled so the seeding helpers and benchmarks work::
+
+    VITE_E2E_HOOKS=true npm run build
+
+The suite uses it when ``ADMIN_TEST_DIST`` is set (to the build directory,
+or ``1`` for ``../dist``) and ``ADMIN_TEST_BASE_URL`` is not. On its own::
+
+    python server.py --dist ../dist --port 4173
+"""
+import argparse
+import gzip
+import hashlib
+import mimetypes
+import os
+import posixpath
+import sys
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+DEFAULT_DIST = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dist")
+IMMUTABLE_PREFIX = "/assets/"
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml",
+                      "application/manifest+json")
+MIN_COMPRESS_BYTES = 1024
+
+
+class _Asset:
+    """One file's bytes, validators and (lazily) gzipped bytes"""
+
+    def __init__(self, path, mtime):
+        with open(path, "rb") as handle:
+            self.body = handle.read()
+        self.mtime = mtime
+        self.content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        if self.content_type == "text/javascript":
+            self.content_type = "application/javascript"
+        self.etag = '"%s"' % hashlib.sha1(self.body).hexdigest()[:16]
+        self.compressible = (len(self.body) >= MIN_COMPRESS_BYTES
+                             and self.content_type.startswith(COMPRESSIBLE_TYPES))
+        self._gzipped = None
+
+    def gzipped(self):
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, compresslevel=6, mtime=0)
+        return self._gzipped
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "AdminTestStatic/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._serve(head=False)
+
+    def do_HEAD(self):
+        self._serve(head=True)
+
+    def _serve(self, head):
+        path = posixpath.normpath(unquote(urlsplit(self.path).path))
+        asset = self.server.asset(path)
+        if asset is None and not posixpath.splitext(path)[1]:
+            path = "/index.html"  # client-side route
+            asset = self.server.asset(path)
+        if asset is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        cache = ("public, max-age=31536000, immutable" if path.startswith(IMMUTABLE_PREFIX) else "no-cache")
+        if self.headers.get("If-None-Match") == asset.etag:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", asset.etag)
+            self.send_header("Cache-Control", cache)
+            self.end_headers()
+            return
+
+        body = asset.body
+        use_gzip = asset.compressible and "gzip" in self.headers.get("Accept-Encoding", "")
+        if use_gzip:
+            body = asset.gzipped()
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", asset.content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", cache)
+        self.send_header("ETag", asset.etag)
+        if asset.compressible:
+            self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class StaticServer(ThreadingHTTPServer):
+    """Threaded server for a built ``dist/`` directory; ``start()`` runs it in the background"""
+
+    daemon_threads = True
+
+    def __init__(self, root=DEFAULT_DIST, host="127.0.0.1", port=0, verbose=False):
+        self.root = os.path.abspath(root)
+        if not os.path.isfile(os.path.join(self.root, "index.html")):
+            raise FileNotFoundError(f"No build in {self.root}; run `VITE_E2E_HOOKS=true npm run build` first")
+        self.verbose = verbose
+        self._assets = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        super().__init__((host, port), _Handler)
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def asset(self, path):
+        """The file for a URL path, or None; cached until the file changes"""
+        full = os.path.join(self.root, path.lstrip("/"))
+        if not full.startswith(self.root + os.sep) or not os.path.isfile(full):
+            return None
+        mtime = os.path.getmtime(full)
+        with self._lock:
+            asset = self._assets.get(full)
+            if asset is None or asset.mtime != mtime:
+                asset = self._assets[full] = _Asset(full, mtime)
+            return asset
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="admin-static-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def serve_dist_if_configured():
+    """Start a server for ``ADMIN_TEST_DIST`` unless an explicit ``ADMIN_TEST_BASE_URL`` is set"""
+    dist = os.environ.get("ADMIN_TEST_DIST", "").strip()
+    if not dist or os.environ.get("ADMIN_TEST_BASE_URL"):
+        return None
+    return StaticServer(DEFAULT_DIST if dist.lower() in ("1", "true", "yes") else dist).start()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dist", default=DEFAULT_DIST)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="0 picks a free port")
+    args = parser.parse_args(argv)
+
+    server = StaticServer(args.dist, args.host, args.port, verbose=True)
+    print(f"Serving {server.root} at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
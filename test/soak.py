@@ -0,0 +1,267 @@
+"""Soak mode: look for memory that keeps growing as the Dashboard is used.
+
+One soak cycle is several rounds of switching through every Dashboard tab
+(done inside the page, so thousands of switches stay fast) followed by one
+add → update → dispatch → delete round trip of a throwaway product through
+the real forms. The catalog is the same size at the end of every cycle, so
+nothing the app legitimately needs should grow with the cycle count.
+
+Every few cycles the heap is garbage-collected and sampled:
+
+- ``heap_bytes``: JS heap in use (CDP ``Performance.getMetrics``, or
+  ``performance.memory`` outside Chromium)
+- ``nodes`` / ``listeners`` / ``documents``: CDP ``Memory.getDOMCounters``
+- ``detached_nodes``: DOM nodes still alive but no longer in the document
+  (``nodes`` minus the nodes reachable from ``document``)
+
+A least-squares line is fitted to each metric against the cycle number, and
+a metric is flagged as growing when its slope is over the per-cycle budget
+in ``GROWTH_BUDGETS`` and the line explains the samples well (r² of at least
+``MIN_R2``), so one-off jumps and GC noise do not count as leaks. A typical
+catch is a component that keeps stale ``getProducts()`` arrays or listeners
+alive across remounts.
+
+Usage:
+    python soak.py
+    python soak.py --cycles 2000 --sample-every 50 --output reports/soak-long.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+
+import dom_wait as EC
+from actions import ROW_BUTTON, WAIT_TIMEOUT, AdminActions
+from browser import base_url, create_driver
+from dom_wait import DomWait
+from fixtures import AUTH_KEY
+from timing import REPORTS_DIR, timed_step
+
+DEFAULT_CYCLES = 500
+DEFAULT_SAMPLE_EVERY = 25
+TAB_ROUNDS = 2
+TABS = ("Inventory", "Add Product", "Update", "Delete", "Dispatch")
+SOAK_PRODUCT = "Soak Product"
+# Allowed growth per cycle, after a forced GC
+GROWTH_BUDGETS = {"heap_bytes": 4096, "detached_nodes": 1, "listeners": 0.5, "documents": 0.01}
+MIN_R2 = 0.6
+WARMUP_SAMPLES = 2  # JIT, caches and the first toasts settle during these
+
+_SWITCH_TABS_SCRIPT = """
+const [tabs, rounds, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const byName = {};
+document.querySelectorAll("button[role='tab']").forEach((tab) => { byName[tab.textContent.trim()] = tab; });
+const missing = tabs.filter((name) => !byName[name]);
+if (missing.length) return done({error: "no tab labelled " + missing.join(", ")});
+const order = [];
+for (let i = 0; i < rounds; i++) order.push(...tabs.slice(1), tabs[0]);
+let index = 0;
+const next = () => {
+  if (index === order.length) return done({switches: order.length});
+  const tab = byName[order[index++]];
+  // Radix tabs activate on mousedown rather than click
+  tab.dispatchEvent(new MouseEvent("mousedown", {bubbles: true, button: 0}));
+  const deadline = performance.now() + timeoutMs;
+  const mounted = () => {
+    const panel = document.getElementById(tab.getAttribute("aria-controls"));
+    if (panel && panel.dataset.state === "active" && panel.childElementCount > 0) return requestAnimationFrame(next);
+    if (performance.now() > deadline) return done({error: tab.textContent.trim() + " did not mount"});
+    requestAnimationFrame(mounted);
+  };
+  mounted();
+};
+next();
+"""
+
+_PAGE_COUNTERS_SCRIPT = """
+const walker = document.createTreeWalker(document, NodeFilter.SHOW_ALL);
+let attached = 1;
+while (walker.nextNode()) attached++;
+return {attached, heap: performance.memory ? performance.memory.usedJSHeapSize : null};
+"""
+
+
+def soak_cycles():
+    """Cycles requested through ``ADMIN_TEST_SOAK`` (a number, or any other value for the default)"""
+    value = os.environ.get("ADMIN_TEST_SOAK", "").strip().lower()
+    if value in ("", "0", "false", "no"):
+        return None
+    return int(value) if value.isdigit() else DEFAULT_CYCLES
+
+
+def collect_garbage(driver):
+    """Force a full GC so samples measure retained memory (Chromium only)"""
+    try:
+        driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+        return True
+    except (AttributeError, WebDriverException):
+        return False
+
+
+def sample_memory(driver, cycle):
+    """One memory sample, taken after a forced GC where the browser allows it"""
+    collected = collect_garbage(driver)
+    page = driver.execute_script(_PAGE_COUNTERS_SCRIPT)
+    sample = {"cycle": cycle, "gc": collected, "heap_bytes": page["heap"], "attached_nodes": page["attached"],
+              "nodes": None, "detached_nodes": None, "listeners": None, "documents": None}
+    try:
+        driver.execute_cdp_cmd("Performance.enable", {})
+        metrics = {m["name"]: m["value"] for m in driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]}
+        counters = driver.execute_cdp_cmd("Memory.getDOMCounters", {})
+    except (AttributeError, WebDriverException):
+        return sample
+    sample.update(heap_bytes=metrics.get("JSHeapUsedSize", sample["heap_bytes"]), nodes=counters["nodes"],
+                  detached_nodes=max(0, counters["nodes"] - page["attached"]),
+                  listeners=counters["jsEventListeners"], documents=counters["documents"])
+    return sample
+
+
+def fit_trend(xs, ys):
+    """Least-squares line through (``xs``, ``ys``): ``{"slope", "intercept", "r2"}``"""
+    n = len(xs)
+    if n < 2:
+        raise ValueError("A trend needs at least two samples")
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    syy = sum((y - mean_y) ** 2 for y in ys)
+    slope = sxy / sxx if sxx else 0.0
+    intercept = mean_y - slope * mean_x
+    if syy == 0:
+        r2 = 1.0
+    else:
+        r2 = 1 - sum((y - (intercept + slope * x)) ** 2 for x, y in zip(xs, ys)) / syy
+    return {"slope": slope, "intercept": intercept, "r2": r2}
+
+
+def detect_growth(samples, budgets=GROWTH_BUDGETS, min_r2=MIN_R2, warmup=WARMUP_SAMPLES):
+    """Fit every budgeted metric against the cycle number and flag the ones that keep growing
+
+    Returns ``{metric: {"slope", "intercept", "r2", "budget", "growth", "growing"}}``
+    for each metric with at least three samples after ``warmup``; ``growth``
+    is the fitted change over the sampled cycles.
+    """
+    results = {}
+    for metric, budget in budgets.items():
+        points = [(s["cycle"], s[metric]) for s in samples[warmup:] if s.get(metric) is not None]
+        if len(points) < 3:
+            continue
+        xs, ys = zip(*points)
+        trend = fit_trend(xs, ys)
+        trend.update(budget=budget, growth=trend["slope"] * (xs[-1] - xs[0]),
+                     growing=trend["slope"] > budget and trend["r2"] >= min_r2)
+        results[metric] = trend
+    return results
+
+
+class SoakCycles:
+    """Mixin for test cases with ``AdminActions`` that soak the Dashboard; the session must be logged in"""
+
+    def switch_tabs(self, rounds=TAB_ROUNDS, tabs=TABS):
+        """Switch through ``tabs`` ``rounds`` times inside the page; returns the number of switches"""
+        result = self.driver.execute_async_script(_SWITCH_TABS_SCRIPT, list(tabs), rounds, WAIT_TIMEOUT * 1000)
+        if "error" in result:
+            raise TimeoutException(result["error"])
+        return result["switches"]
+
+    def row_button(self, name, label):
+        return self.wait.until(EC.element_to_be_clickable((By.XPATH, ROW_BUTTON.format(name=name, label=label))))
+
+    @timed_step()
+    def crud_cycle(self, name=SOAK_PRODUCT):
+        """Add, update, dispatch and delete one product through the forms"""
+        self.click_tab("Add Product")
+        self.fill_form(name=name, category="Soak", description="Soak cycle product", price="10", quantity="5")
+        self.submit_form("Add Product")
+        self.click_tab("Update")
+        self.choose_option(text=name)
+        self.fill_form(quantity="6")
+        self.submit_form("Update Product")
+        self.click_tab("Dispatch")
+        self.click_and_wait(self.row_button(name, "Dispatch"))
+        self.click_tab("Delete")
+        self.row_button(name, "Delete").click()
+        self.confirm_dialog("Delete")
+
+    def run_soak(self, cycles=DEFAULT_CYCLES, sample_every=DEFAULT_SAMPLE_EVERY, tab_rounds=TAB_ROUNDS, log=None):
+        """Run ``cycles`` soak cycles, sampling memory every ``sample_every``; returns the report dict"""
+        started = time.perf_counter()
+        switches = 0
+        samples = [sample_memory(self.driver, 0)]
+        for cycle in range(1, cycles + 1):
+            switches += self.switch_tabs(tab_rounds)
+            self.crud_cycle()
+            if cycle % sample_every == 0 or cycle == cycles:
+                samples.append(sample_memory(self.driver, cycle))
+                if log:
+                    log(samples[-1])
+        return {
+            "report": "soak",
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "cycles": cycles,
+            "tab_switches": switches,
+            "crud_cycles": cycles,
+            "seconds": time.perf_counter() - started,
+            "samples": samples,
+            "trends": detect_growth(samples),
+        }
+
+
+def print_report(report):
+    print(f"  {report['cycles']} cycles, {report['tab_switches']} tab switches in {report['seconds']:.0f}s")
+    for metric, trend in report["trends"].items():
+        flag = " GROWING" if trend["growing"] else ""
+        print(f"    {metric:<15} {trend['slope']:+.2f}/cycle (budget {trend['budget']:g}, "
+              f"r² {trend['r2']:.2f}, {trend['growth']:+.0f} overall){flag}")
+
+
+def write_report(report, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as handle:
+        json.dump(report, handle, indent=2)
+    return path
+
+
+class _Session(AdminActions, SoakCycles):
+    def __init__(self, driver):
+        self.driver = driver
+        self.wait = DomWait(driver, WAIT_TIMEOUT)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cycles", type=int, default=DEFAULT_CYCLES)
+    parser.add_argument("--sample-every", type=int, default=DEFAULT_SAMPLE_EVERY)
+    parser.add_argument("--tab-rounds", type=int, default=TAB_ROUNDS, help="tab rounds per cycle")
+    parser.add_argument("--output", default=os.path.join(REPORTS_DIR, "soak.json"))
+    args = parser.parse_args(argv)
+
+    driver = create_driver()
+    driver.set_script_timeout(WAIT_TIMEOUT + 5)
+    try:
+        driver.get(base_url())
+        snapshot = driver.execute_script("return localStorage.getItem(arguments[0])", AUTH_KEY)
+        driver.execute_script("localStorage.setItem(arguments[0], 'true')", AUTH_KEY)
+        driver.get(f"{base_url()}/dashboard")
+        session = _Session(driver)
+        session.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "[role='tabpanel'] > *")))
+        report = session.run_soak(args.cycles, args.sample_every, args.tab_rounds,
+                                  log=lambda s: print(f"  cycle {s['cycle']}: heap {s['heap_bytes']} bytes, "
+                                                      f"{s['detached_nodes']} detached nodes"))
+        driver.execute_script("arguments[1] === null ? localStorage.removeItem(arguments[0])"
+                              " : localStorage.setItem(arguments[0], arguments[1])", AUTH_KEY, snapshot)
+    finally:
+        driver.quit()
+    print_report(report)
+    print(f"Report written to {write_report(report, args.output)}")
+    return 1 if any(trend["growing"] for trend in report["trends"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,301 @@
+"""Multi-tab consistency and throughput stress test for ``src/lib/storage.ts``.
+
+Opens many same-origin tabs in one browser context, so they share one
+localStorage, and has each of them fire its own interleaved sequence of
+add / update / dispatch / delete calls on ``window.__ecommerceStorage`` at
+the same moment. Every call is a read-modify-write with no coordination
+between tabs, so a tab can write back a catalog that misses another tab's
+change.
+
+The operations are planned so the correct final state is known whatever the
+interleaving:
+
+- dispatches go to a few shared "hot" products whose stock never runs out,
+  so each successful dispatch must take exactly one unit
+- every tab updates, deletes and adds only products of its own, so the last
+  value it wrote must be the one that stays
+
+Afterwards a fresh tab reads the catalog and every difference from the
+expected state is reported as a lost update. Throughput is all operations
+over the time from the common start to the last tab finishing.
+
+Needs the storage hook (the dev server, or a ``VITE_E2E_HOOKS=true`` build).
+
+Usage:
+    python stress_tabs.py --tabs 8 --ops 200
+    python stress_tabs.py --tabs 16 --ops 500 --backend keyed --output reports/stress_keyed.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+from actions import PRODUCTS_KEY
+from bench_storage import percentile
+from browser import base_url
+from cdp import Browser
+from seeding import PERSISTENT_BACKENDS, READ_CATALOG_SCRIPT
+from timing import REPORTS_DIR
+
+DEFAULT_TABS = 8
+DEFAULT_OPS = 200  # per tab
+DEFAULT_PRODUCTS = 200
+HOT_PRODUCTS = 5
+OPERATION_MIX = {"add": 0.2, "update": 0.3, "dispatch": 0.4, "delete": 0.1}
+START_DELAY_MS = 1000  # lets every tab receive its plan before the common start
+SETTLE_SECONDS = 0.5  # for the last writes to reach every renderer
+# Kinds of lost change that find_lost_updates reports as lists of product names (or ids)
+LISTED_KINDS = ("updates", "adds", "resurrected", "missing", "duplicates", "duplicate_ids")
+# Background tabs would otherwise get their timers throttled
+CHROME_ARGS = ("--disable-background-timer-throttling", "--disable-renderer-backgrounding",
+               "--disable-backgrounding-occluded-windows")
+
+_SEED_SCRIPT = """
+const [backend, products] = arguments;
+const storage = window.__ecommerceStorage;
+if (!storage) return "window.__ecommerceStorage is missing";
+if (!storage.setStorageBackend(backend)) return "could not switch to the " + backend + " backend";
+storage.saveProducts(products);
+return null;
+"""
+
+# Runs one tab's plan from the shared start time; yields to the event loop
+# between calls (through a MessageChannel, which is not throttled like timers)
+# so storage events from the other tabs are delivered in between
+_RUN_PLAN_SCRIPT = """
+const [operations, startAt] = arguments;
+const done = arguments[arguments.length - 1];
+const storage = window.__ecommerceStorage;
+const yieldToLoop = () => new Promise((resolve) => {
+  const channel = new MessageChannel();
+  channel.port1.onmessage = () => resolve();
+  channel.port2.postMessage(null);
+});
+const apply = (op) => {
+  switch (op.kind) {
+    case "add": return Boolean(storage.addProduct(op.product));
+    case "update": return storage.updateProduct(op.id, op.updates);
+    case "dispatch": return storage.dispatchProduct(op.id);
+    case "delete": return storage.deleteProduct(op.id);
+  }
+  throw new Error("unknown operation " + op.kind);
+};
+(async () => {
+  while (Date.now() < startAt) await new Promise((resolve) => setTimeout(resolve, startAt - Date.now()));
+  const started = Date.now();
+  const results = [];
+  const errors = [];
+  for (const op of operations) {
+    const t0 = performance.now();
+    let ok = false;
+    try {
+      ok = apply(op);
+    } catch (e) {
+      errors.push(op.kind + " " + (op.id || op.product.name) + ": " + e.message);
+    }
+    results.push([ok, performance.now() - t0]);
+    await yieldToLoop();
+  }
+  done({started, finished: Date.now(), results, errors});
+})();
+"""
+
+
+def stress_product(index, quantity):
+    return {
+        "id": f"stress-{index}",
+        "name": f"Stress Product {index}",
+        "description": "Seeded for the multi-tab stress test",
+        "price": 10,
+        "quantity": quantity,
+        "category": "Stress",
+        "dispatched": False,
+        "createdAt": "2024-01-01T00:00:00.000Z",
+    }
+
+
+def plan_operations(tabs, ops_per_tab, products=DEFAULT_PRODUCTS, hot=HOT_PRODUCTS, seed=0, mix=OPERATION_MIX):
+    """The seeded catalog and one operation list per tab
+
+    Products ``0..hot-1`` are shared dispatch targets with more stock than all
+    tabs can dispatch. The rest are dealt out round-robin, and each tab uses
+    half of its share as update targets and half as delete targets.
+    """
+    if products - hot < 2 * tabs:
+        raise ValueError(f"{products} products are too few for {tabs} tabs and {hot} hot products")
+    catalog = [stress_product(i, tabs * ops_per_tab + 1 if i < hot else 100) for i in range(products)]
+    kinds, weights = zip(*mix.items())
+    plans = []
+    for tab in range(tabs):
+        rng = random.Random(f"{seed}:{tab}")
+        owned = [p["id"] for p in catalog[hot + tab::tabs]]
+        updatable, deletable = owned[::2], owned[1::2]
+        rng.shuffle(deletable)
+        operations = []
+        for n in range(ops_per_tab):
+            kind = rng.choices(kinds, weights)[0]
+            if kind == "delete" and not deletable:
+                kind = "dispatch"
+            if kind == "add":
+                operations.append({"kind": "add", "product": {
+                    "name": f"Tab {tab} item {n}", "description": "Added during the stress test", "price": 5,
+                    "quantity": 1, "category": "Stress", "dispatched": False}})
+            elif kind == "update":
+                operations.append({"kind": "update", "id": rng.choice(updatable),
+                                   "updates": {"price": n + 1, "description": f"tab {tab} op {n}"}})
+            elif kind == "dispatch":
+                operations.append({"kind": "dispatch", "id": catalog[rng.randrange(hot)]["id"]})
+            else:
+                operations.append({"kind": "delete", "id": deletable.pop()})
+        plans.append(operations)
+    return catalog, plans
+
+
+def expected_state(catalog, plans, results):
+    """The catalog every tab's successful operations add up to, keyed by product name
+
+    ``results`` holds one list of booleans per tab, in plan order.
+    """
+    expected = {p["name"]: dict(p) for p in catalog}
+    names = {p["id"]: p["name"] for p in catalog}
+    for operations, outcomes in zip(plans, results):
+        for op, ok in zip(operations, outcomes):
+            if not ok:
+                continue
+            if op["kind"] == "add":
+                expected[op["product"]["name"]] = dict(op["product"])
+            elif op["kind"] == "update":
+                expected[names[op["id"]]].update(op["updates"])
+            elif op["kind"] == "dispatch":
+                product = expected[names[op["id"]]]
+                product["quantity"] -= 1
+                product["dispatched"] = True
+            else:
+                del expected[names[op["id"]]]
+    return expected
+
+
+def find_lost_updates(expected, actual):
+    """Differences between the expected state and the stored catalog, by kind"""
+    stored = {}
+    duplicates = []
+    ids = {}
+    for product in actual:
+        if product["name"] in stored:
+            duplicates.append(product["name"])
+        stored[product["name"]] = product
+        ids.setdefault(product["id"], []).append(product["name"])
+    lost = {"dispatches": {}, "updates": [], "adds": [], "resurrected": [], "missing": [], "duplicates": duplicates,
+            # ids come from Date.now() in each tab, so two tabs can hand out the same one
+            "duplicate_ids": sorted(id for id, names in ids.items() if len(names) > 1)}
+    for name, want in expected.items():
+        have = stored.get(name)
+        if have is None:
+            lost["adds" if name.startswith("Tab ") else "missing"].append(name)
+        elif have["quantity"] != want["quantity"] or have["dispatched"] != want["dispatched"]:
+            lost["dispatches"][name] = {"expected": want["quantity"], "stored": have["quantity"],
+                                        "lost": have["quantity"] - want["quantity"]}
+        elif (have["price"], have["description"]) != (want["price"], want["description"]):
+            lost["updates"].append(name)
+    lost["resurrected"] = sorted(set(stored) - set(expected))
+    return lost
+
+
+def lost_count(lost):
+    """Total number of lost or phantom changes in a ``find_lost_updates`` result"""
+    return (sum(abs(entry["lost"]) or 1 for entry in lost["dispatches"].values())
+            + sum(len(lost[kind]) for kind in LISTED_KINDS))
+
+
+async def run_stress(origin, tabs=DEFAULT_TABS, ops_per_tab=DEFAULT_OPS, backend="blob", products=DEFAULT_PRODUCTS,
+                     seed=0):
+    """Run the stress test in a new browser and return the report dict"""
+    if backend not in PERSISTENT_BACKENDS:
+        raise ValueError(f"Tabs only share the {' and '.join(PERSISTENT_BACKENDS)} backends, not {backend!r}")
+    catalog, plans = plan_operations(tabs, ops_per_tab, products, seed=seed)
+    async with await Browser.launch(args=CHROME_ARGS) as browser:
+        context = await browser.new_context()
+        pages = [await context.new_page() for _ in range(tabs)]
+        await pages[0].goto(f"{origin}/")
+        error = await pages[0].execute_script(_SEED_SCRIPT, backend, catalog)
+        if error:
+            raise RuntimeError(error)
+        await asyncio.gather(*(page.goto(f"{origin}/") for page in pages))
+
+        start_at = await pages[0].execute_script("return Date.now()") + START_DELAY_MS
+        timeout = 60 + ops_per_tab * tabs / 50
+        runs = await asyncio.gather(*(page.execute_async_script(_RUN_PLAN_SCRIPT, plan, start_at, timeout=timeout)
+                                      for page, plan in zip(pages, plans)))
+
+        await asyncio.sleep(SETTLE_SECONDS)
+        reader = await context.new_page()
+        await reader.goto(f"{origin}/")
+        stored = json.loads(await reader.execute_script(READ_CATALOG_SCRIPT, PRODUCTS_KEY) or "[]")
+
+    results = [[ok for ok, _ in run["results"]] for run in runs]
+    lost = find_lost_updates(expected_state(catalog, plans, results), stored)
+    operations = tabs * ops_per_tab
+    seconds = (max(run["finished"] for run in runs) - min(run["started"] for run in runs)) / 1000
+    latencies = sorted(ms for run in runs for _, ms in run["results"])
+    return {
+        "report": "stress_tabs",
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "url": origin,
+        "backend": backend,
+        "tabs": tabs,
+        "operations": operations,
+        "succeeded": sum(map(sum, results)),
+        "seconds": seconds,
+        "ops_per_second": operations / seconds if seconds else None,
+        "latency_ms": {"p50": percentile(latencies, 0.50), "p95": percentile(latencies, 0.95),
+                       "max": latencies[-1] if latencies else None},
+        "lost_updates": lost_count(lost),
+        "lost": lost,
+        "errors": [error for run in runs for error in run["errors"]],
+    }
+
+
+def print_report(report):
+    print(f"  {report['tabs']} tabs, {report['backend']} backend: {report['operations']} operations "
+          f"({report['succeeded']} succeeded) in {report['seconds']:.2f}s = {report['ops_per_second'] or 0:.0f} ops/s")
+    latency = report["latency_ms"]
+    if latency["max"] is not None:
+        print(f"    per call p50 {latency['p50']:.2f}ms  p95 {latency['p95']:.2f}ms  max {latency['max']:.2f}ms")
+    lost = report["lost"]
+    print(f"    lost updates: {report['lost_updates']}")
+    dispatches = sum(entry["lost"] for entry in lost["dispatches"].values())
+    if lost["dispatches"]:
+        print(f"      dispatches: {dispatches} units on {len(lost['dispatches'])} products")
+    for kind in LISTED_KINDS:
+        if lost[kind]:
+            print(f"      {kind}: {len(lost[kind])} (e.g. {lost[kind][0]})")
+    for error in report["errors"][:10]:
+        print(f"    {error}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tabs", type=int, default=DEFAULT_TABS)
+    parser.add_argument("--ops", type=int, default=DEFAULT_OPS, help="operations per tab")
+    parser.add_argument("--products", type=int, default=DEFAULT_PRODUCTS)
+    parser.add_argument("--backend", choices=PERSISTENT_BACKENDS, default="blob")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--url", default=base_url())
+    parser.add_argument("--output", default=os.path.join(REPORTS_DIR, "stress_tabs.json"))
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run_stress(args.url.rstrip("/"), args.tabs, args.ops, args.backend, args.products,
+                                    args.seed))
+    print_report(report)
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Report written to {args.output}")
+    return 1 if report["lost_updates"] or report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
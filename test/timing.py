@@ -0,0 +1,372 @@
+"""Timing spans for the admin test suite.
+
+Every test run through ``TimedTest`` gets a span, and every helper decorated
+with ``@timed_step`` (login, tab navigation, form fill, submit, waits) gets a
+nested step span. Within each span the elapsed time is split into:
+
+- ``sleep``: ``time.sleep`` calls
+- ``wait``: explicit waits (``WebDriverWait.until`` and in-page waits)
+- ``webdriver``: WebDriver commands issued outside a wait
+- ``other``: everything else, i.e. Python-side work
+
+Every WebDriver command is also counted per test, by command name (for
+example ``findElement``, ``clickElement``, ``executeAsyncScript``) with its
+total time, and a test can cap its command count with ``@command_budget``.
+
+Reports are written as JSON and JUnit XML to ``reports/`` (override with
+``ADMIN_TEST_TIMING_REPORT``), and every run appends one line to
+``reports/timing-history.jsonl`` so suite duration can be tracked over time.
+"""
+import contextlib
+import functools
+import json
+import os
+import platform
+import threading
+import time
+from xml.etree import ElementTree
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+CATEGORIES = ("sleep", "wait", "webdriver")
+REPORTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "reports")
+DEFAULT_REPORT = os.path.join(REPORTS_DIR, "timing.json")
+HISTORY_FILE = "timing-history.jsonl"
+SLOWEST_STEPS = 20
+
+_active = None
+
+
+class TimingSpans:
+    """Spans recorded while one test runs"""
+
+    def __init__(self, test_id):
+        self.test_id = test_id
+        self.thread = threading.get_ident()
+        self.started = time.perf_counter()
+        self.totals = dict.fromkeys(CATEGORIES, 0.0)
+        self.steps = []
+        self.commands = {}
+        self._open = []
+        self._in_category = False
+
+    def attribute(self, category, seconds):
+        """Charge ``seconds`` of ``category`` time to the test and every open step"""
+        self.totals[category] += seconds
+        for step in self._open:
+            step[category] += seconds
+
+    def command(self, name, seconds):
+        """Count one WebDriver command"""
+        entry = self.commands.setdefault(name, {"count": 0, "seconds": 0.0})
+        entry["count"] += 1
+        entry["seconds"] += seconds
+
+    def command_count(self, name=None):
+        """Commands issued so far, in total or of one type"""
+        if name is not None:
+            return self.commands.get(name, {}).get("count", 0)
+        return sum(entry["count"] for entry in self.commands.values())
+
+    @contextlib.contextmanager
+    def step(self, name):
+        step = {"name": name, "depth": len(self._open), "offset": time.perf_counter() - self.started}
+        step.update(dict.fromkeys(CATEGORIES, 0.0))
+        self._open.append(step)
+        started = time.perf_counter()
+        try:
+            yield step
+        finally:
+            self._open.pop()
+            step["duration"] = time.perf_counter() - started
+            step["other"] = max(0.0, step["duration"] - sum(step[c] for c in CATEGORIES))
+            self.steps.append(step)
+
+    @contextlib.contextmanager
+    def category(self, name):
+        # Only the outermost category counts: the commands a wait issues are wait time
+        if self._in_category:
+            yield
+            return
+        self._in_category = True
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._in_category = False
+            self.attribute(name, time.perf_counter() - started)
+
+    def finish(self, status):
+        duration = time.perf_counter() - self.started
+        record = {"test": self.test_id, "status": status, "duration": duration}
+        record.update(self.totals)
+        record["other"] = max(0.0, duration - sum(self.totals.values()))
+        record["commands"] = self.commands
+        record["steps"] = sorted(self.steps, key=lambda s: s["offset"])
+        return record
+
+
+@contextlib.contextmanager
+def step(name):
+    """Record a step span inside the running test (a no-op outside one)"""
+    if _active is None:
+        yield None
+        return
+    with _active.step(name) as span:
+        yield span
+
+
+@contextlib.contextmanager
+def category(name):
+    """Attribute the enclosed time to ``name`` (one of ``CATEGORIES``)"""
+    if _active is None:
+        yield
+        return
+    with _active.category(name):
+        yield
+
+
+def timed_step(name=None):
+    """Decorator that records every call of the wrapped helper as a step"""
+    def decorate(function):
+        label = name or function.__name__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with step(label):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class CommandBudgetExceeded(AssertionError):
+    """A test issued more WebDriver commands than its ``@command_budget`` allows"""
+
+
+def command_budget(total=None, **per_command):
+    """Fail the decorated test if its body issues more than ``total`` WebDriver commands
+
+    Keyword arguments cap single command types, e.g.
+    ``@command_budget(15, sendKeysToElement=0)``. Only the test method itself
+    is counted, not ``setUp``/``tearDown``; outside a ``TimedTest`` the budget
+    is not enforced.
+    """
+    def decorate(test):
+        @functools.wraps(test)
+        def wrapper(self, *args, **kwargs):
+            spans = _active
+            if spans is None:
+                return test(self, *args, **kwargs)
+            before = {name: entry["count"] for name, entry in spans.commands.items()}
+            result = test(self, *args, **kwargs)
+            used = {name: entry["count"] - before.get(name, 0) for name, entry in spans.commands.items()}
+            over = []
+            if total is not None and sum(used.values()) > total:
+                over.append(f"{sum(used.values())} commands (budget {total})")
+            over.extend(f"{used.get(name, 0)} {name} (budget {limit})"
+                        for name, limit in per_command.items() if used.get(name, 0) > limit)
+            if over:
+                breakdown = ", ".join(f"{name}={count}" for name, count in sorted(used.items()) if count)
+                raise CommandBudgetExceeded(f"Over the command budget: {'; '.join(over)} [{breakdown}]")
+            return result
+        wrapper.command_budget = dict(per_command, total=total)
+        return wrapper
+    return decorate
+
+
+def _timed(category_name, function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        # Other threads (the static server, say) sleep and wait too; only the test's own calls count
+        if _active is None or _active.thread != threading.get_ident():
+            return function(*args, **kwargs)
+        with category(category_name):
+            return function(*args, **kwargs)
+    wrapper.__timed__ = True
+    return wrapper
+
+
+def instrument_driver(driver):
+    """Time and count every WebDriver command ``driver`` sends"""
+    if getattr(driver.execute, "__timed__", False):
+        return driver
+    execute = driver.execute
+
+    @functools.wraps(execute)
+    def timed_execute(driver_command, params=None):
+        started = time.perf_counter()
+        try:
+            with category("webdriver"):
+                return execute(driver_command, params)
+        finally:
+            if _active is not None:
+                _active.command(driver_command, time.perf_counter() - started)
+    timed_execute.__timed__ = True
+    driver.execute = timed_execute
+    return driver
+
+
+@contextlib.contextmanager
+def _instrumented_globals():
+    """Time ``time.sleep`` and ``WebDriverWait`` waits while one test runs, then put the originals back"""
+    if getattr(time.sleep, "__timed__", False):
+        yield  # a test run inside another one (e.g. a suite in a test) is already covered
+        return
+    originals = {method: getattr(WebDriverWait, method) for method in ("until", "until_not")}
+    sleep = time.sleep
+    time.sleep = _timed("sleep", sleep)
+    for method, original in originals.items():
+        setattr(WebDriverWait, method, _timed("wait", original))
+    try:
+        yield
+    finally:
+        time.sleep = sleep
+        for method, original in originals.items():
+            setattr(WebDriverWait, method, original)
+
+
+class TimingReport:
+    """Collects the per-test records of one run"""
+
+    def __init__(self):
+        self.records = []
+
+    def add(self, record):
+        self.records.append(record)
+
+    def clear(self):
+        self.records = []
+
+
+REPORT = TimingReport()
+
+
+class TimedTest:
+    """Mixin for ``unittest.TestCase`` that records a span for every test"""
+
+    def run(self, result=None):
+        global _active
+        if result is None:
+            return super().run(result)
+        before = _outcome_counts(result)
+        _active = TimingSpans(self.id())
+        try:
+            with _instrumented_globals():
+                return super().run(result)
+        finally:
+            timing, _active = _active, None
+            REPORT.add(timing.finish(_status(before, _outcome_counts(result))))
+
+
+def _outcome_counts(result):
+    return len(result.failures), len(result.errors), len(result.skipped)
+
+
+def _status(before, after):
+    failures, errors, skipped = (a - b for a, b in zip(after, before))
+    if errors:
+        return "error"
+    if failures:
+        return "failure"
+    if skipped:
+        return "skipped"
+    return "passed"
+
+
+def slowest_steps(records, limit=SLOWEST_STEPS):
+    """Steps aggregated by name across ``records``, slowest total first"""
+    by_name = {}
+    for record in records:
+        for span in record["steps"]:
+            entry = by_name.setdefault(span["name"], {"name": span["name"], "count": 0, "total": 0.0, "max": 0.0})
+            entry["count"] += 1
+            entry["total"] += span["duration"]
+            entry["max"] = max(entry["max"], span["duration"])
+    for entry in by_name.values():
+        entry["mean"] = entry["total"] / entry["count"]
+    return sorted(by_name.values(), key=lambda e: e["total"], reverse=True)[:limit]
+
+
+def command_totals(records):
+    """WebDriver command counts and time by command name across ``records``"""
+    totals = {}
+    for record in records:
+        for name, entry in record.get("commands", {}).items():
+            total = totals.setdefault(name, {"count": 0, "seconds": 0.0})
+            total["count"] += entry["count"]
+            total["seconds"] += entry["seconds"]
+    return dict(sorted(totals.items(), key=lambda item: item[1]["count"], reverse=True))
+
+
+def build_report(records, elapsed=None):
+    """The JSON report for one run"""
+    totals = {key: sum(r[key] for r in records) for key in CATEGORIES + ("other", "duration")}
+    totals["commands"] = sum(entry["count"] for entry in command_totals(records).values())
+    return {
+        "report": "timing",
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "host": platform.node(),
+        "elapsed": elapsed if elapsed is not None else totals["duration"],
+        "totals": totals,
+        "slowest_steps": slowest_steps(records),
+        "commands": command_totals(records),
+        "tests": records,
+    }
+
+
+def junit_xml(records, name="EcommerceAdminTest"):
+    """JUnit XML for ``records``, with the time split kept as testcase properties"""
+    suite = ElementTree.Element("testsuite", {
+        "name": name,
+        "tests": str(len(records)),
+        "failures": str(sum(r["status"] == "failure" for r in records)),
+        "errors": str(sum(r["status"] == "error" for r in records)),
+        "skipped": str(sum(r["status"] == "skipped" for r in records)),
+        "time": f"{sum(r['duration'] for r in records):.3f}",
+    })
+    for record in records:
+        classname, _, test_name = record["test"].rpartition(".")
+        case = ElementTree.SubElement(suite, "testcase", {
+            "classname": classname, "name": test_name, "time": f"{record['duration']:.3f}",
+        })
+        properties = ElementTree.SubElement(case, "properties")
+        for key in CATEGORIES + ("other",):
+            ElementTree.SubElement(properties, "property", {"name": f"time.{key}", "value": f"{record[key]:.3f}"})
+        commands = sum(entry["count"] for entry in record.get("commands", {}).values())
+        ElementTree.SubElement(properties, "property", {"name": "webdriver.commands", "value": str(commands)})
+        if record["status"] in ("failure", "error", "skipped"):
+            ElementTree.SubElement(case, record["status"])
+    return ElementTree.tostring(suite, encoding="unicode")
+
+
+def write_reports(records, path=None, elapsed=None):
+    """Write the JSON and JUnit reports and append to the history; returns the JSON path"""
+    path = path or os.environ.get("ADMIN_TEST_TIMING_REPORT") or DEFAULT_REPORT
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    report = build_report(records, elapsed)
+    with open(path, "w") as handle:
+        json.dump(report, handle, indent=2)
+    with open(os.path.splitext(path)[0] + ".xml", "w") as handle:
+        handle.write(junit_xml(records))
+    with open(os.path.join(directory, HISTORY_FILE), "a") as handle:
+        handle.write(json.dumps({
+            "started_at": report["started_at"],
+            "host": report["host"],
+            "elapsed": report["elapsed"],
+            "tests": {r["test"]: round(r["duration"], 3) for r in records},
+            "commands": {r["test"]: sum(e["count"] for e in r.get("commands", {}).values()) for r in records},
+        }) + "\n")
+    return path
+
+
+def print_summary(records, limit=5):
+    """Print where the time went, slowest steps first"""
+    if not records:
+        return
+    report = build_report(records)
+    totals = report["totals"]
+    print(f"Timing: {totals['duration']:.1f}s in tests - " + ", ".join(
+        f"{key} {totals[key]:.1f}s" for key in CATEGORIES + ("other",)) + f"; {totals['commands']} WebDriver commands")
+    for entry in report["slowest_steps"][:limit]:
+        print(f"  {entry['name']:<24} {entry['count']:>4} calls  total {entry['total']:.2f}s  max {entry['max']:.2f}s")
@@ -0,0 +1,248 @@
+"""Web Vitals for the Login (``/``) and Dashboard (``/dashboard``) pages.
+
+Each page is loaded several times and every load is sampled for:
+
+- ``lcp_ms``: Largest Contentful Paint
+- ``cls``: Cumulative Layout Shift (largest session window, as web-vitals computes it)
+- ``inp_ms``: Interaction to Next Paint for one scripted interaction
+  (typing in the username field, or switching to the Add Product tab)
+- ``long_tasks`` / ``long_task_ms``: count and total duration of long tasks
+- ``fp_ms`` / ``fcp_ms``: first paint and first contentful paint
+- ``heap_mb``: ``performance.memory.usedJSHeapSize``
+
+and the report gives a distribution (min, p50, p75, p95, max, mean) per
+metric and page rather than a single sample. On Chrome the collector is
+installed with ``Page.addScriptToEvaluateOnNewDocument`` so it observes the
+load from the first byte; elsewhere it is injected after the load and relies
+on buffered PerformanceObserver entries.
+
+Usage:
+    python vitals.py
+    python vitals.py --runs 20 --cold --output reports/vitals-cold.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+import dom_wait as EC
+from bench_storage import percentile
+from browser import base_url, create_driver
+from dom_wait import DomWait
+from fixtures import AUTH_KEY
+from timing import REPORTS_DIR
+
+DEFAULT_RUNS = 5
+METRICS = ("lcp_ms", "cls", "inp_ms", "long_tasks", "long_task_ms", "fp_ms", "fcp_ms", "heap_mb")
+# Published web-vitals thresholds: [good, poor) boundaries
+RATINGS = {"lcp_ms": (2500, 4000), "cls": (0.1, 0.25), "inp_ms": (200, 500), "fcp_ms": (1800, 3000)}
+
+_COLLECTOR_SCRIPT = """
+(() => {
+  if (window.__adminVitals) return;
+  const vitals = window.__adminVitals = {lcp: null, shifts: [], longTasks: [], events: [], paints: {}};
+  const observe = (type, handle, options = {}) => {
+    try {
+      new PerformanceObserver((list) => list.getEntries().forEach(handle)).observe({type, buffered: true, ...options});
+    } catch (e) { /* entry type not supported by this browser */ }
+  };
+  observe("largest-contentful-paint", (e) => { vitals.lcp = e.startTime; });
+  observe("layout-shift", (e) => { if (!e.hadRecentInput) vitals.shifts.push([e.startTime, e.value]); });
+  observe("longtask", (e) => vitals.longTasks.push(e.duration));
+  observe("event", (e) => { if (e.interactionId) vitals.events.push([e.interactionId, e.duration]); },
+          {durationThreshold: 16});
+  observe("first-input", (e) => vitals.events.push([-1, e.duration]));
+  observe("paint", (e) => { vitals.paints[e.name] = e.startTime; });
+})();
+"""
+
+_READ_SCRIPT = """
+const done = arguments[arguments.length - 1];
+// Let pending entries reach the observers first
+requestAnimationFrame(() => requestAnimationFrame(() => setTimeout(() => {
+  const v = window.__adminVitals;
+  let cls = 0, session = 0, first = 0, last = 0;
+  for (const [time, value] of v.shifts) {
+    if (session && time - last < 1000 && time - first < 5000) { session += value; }
+    else { session = value; first = time; }
+    last = time;
+    cls = Math.max(cls, session);
+  }
+  const byInteraction = {};
+  for (const [id, duration] of v.events) byInteraction[id] = Math.max(byInteraction[id] || 0, duration);
+  const interactions = Object.values(byInteraction);
+  done({
+    lcp_ms: v.lcp,
+    cls,
+    inp_ms: interactions.length ? Math.max(...interactions) : null,
+    long_tasks: v.longTasks.length,
+    long_task_ms: v.longTasks.reduce((a, b) => a + b, 0),
+    fp_ms: v.paints["first-paint"] ?? null,
+    fcp_ms: v.paints["first-contentful-paint"] ?? null,
+    heap_mb: performance.memory ? performance.memory.usedJSHeapSize / 1048576 : null,
+  });
+}, 0)));
+"""
+
+
+def _interact_login(driver, wait):
+    field = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "input[type='text']")))
+    field.click()
+    field.send_keys("v")
+
+
+def _interact_dashboard(driver, wait):
+    wait.until(EC.element_to_be_clickable((By.XPATH, "//button[@role='tab'][normalize-space()='Add Product']"))).click()
+
+
+PAGES = {
+    "login": ("/", "#root > *", _interact_login),
+    "dashboard": ("/dashboard", "[role='tabpanel'] > *", _interact_dashboard),
+}
+
+
+def install_collector(driver, source=_COLLECTOR_SCRIPT):
+    """Run ``source`` (the collector) in every new document and return the script id, or None if unsupported"""
+    try:
+        return driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})["identifier"]
+    except (AttributeError, WebDriverException):  # not a Chromium driver
+        return None
+
+
+def uninstall_collector(driver, identifier):
+    if identifier is not None:
+        driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": identifier})
+
+
+def set_cache_disabled(driver, disabled):
+    """Bypass the HTTP cache for cold loads (Chromium only)"""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": disabled})
+        return True
+    except (AttributeError, WebDriverException):
+        return False
+
+
+def measure_page(driver, page, origin=None, preinstalled=True, timeout=30):
+    """Load ``page`` once, perform its interaction and return one sample of every metric"""
+    path, ready, interact = PAGES[page]
+    wait = DomWait(driver, timeout)
+    driver.get(f"{origin or base_url()}{path}")
+    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ready)))
+    if not preinstalled:
+        driver.execute_script(_COLLECTOR_SCRIPT)
+    interact(driver, wait)
+    return driver.execute_async_script(_READ_SCRIPT)
+
+
+def distribution(values):
+    """Summary statistics of one metric's samples (``None`` samples are ignored)"""
+    ordered = sorted(v for v in values if v is not None)
+    if not ordered:
+        return {"samples": 0}
+    return {
+        "samples": len(ordered),
+        "min": ordered[0],
+        "p50": percentile(ordered, 0.50),
+        "p75": percentile(ordered, 0.75),
+        "p95": percentile(ordered, 0.95),
+        "max": ordered[-1],
+        "mean": sum(ordered) / len(ordered),
+    }
+
+
+def rating(metric, value):
+    """Rate ``value`` good, needs-improvement or poor (only metrics with published thresholds)"""
+    if metric not in RATINGS or value is None:
+        return None
+    good, poor = RATINGS[metric]
+    return "good" if value <= good else "needs-improvement" if value <= poor else "poor"
+
+
+def summarize_samples(samples):
+    """Per-metric distributions plus the p75 rating, as web-vitals reports them"""
+    summary = {}
+    for metric in METRICS:
+        summary[metric] = distribution([sample.get(metric) for sample in samples])
+        if summary[metric]["samples"]:
+            summary[metric]["rating"] = rating(metric, summary[metric]["p75"])
+    return summary
+
+
+def collect_vitals(driver, runs=DEFAULT_RUNS, pages=tuple(PAGES), origin=None, cold=False):
+    """Load every page ``runs`` times and return the report dict
+
+    ``driver`` must already be on the app origin. The Dashboard is opened
+    with the ``isAuthenticated`` flag set, as ``Login.tsx`` leaves it; the
+    flag is left set afterwards.
+    """
+    collector = install_collector(driver)
+    cache_disabled = set_cache_disabled(driver, True) if cold else False
+    report = {
+        "report": "web_vitals",
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "user_agent": driver.execute_script("return navigator.userAgent"),
+        "runs": runs,
+        "cold": cold and cache_disabled,
+        "pages": {},
+    }
+    try:
+        for page in pages:
+            if page == "dashboard":
+                driver.execute_script("localStorage.setItem(arguments[0], 'true')", AUTH_KEY)
+            samples = [measure_page(driver, page, origin, collector is not None) for _ in range(runs)]
+            report["pages"][page] = {"path": PAGES[page][0], "summary": summarize_samples(samples),
+                                     "samples": samples}
+    finally:
+        uninstall_collector(driver, collector)
+        if cache_disabled:
+            set_cache_disabled(driver, False)
+    return report
+
+
+def print_report(report):
+    for page, data in report["pages"].items():
+        print(f"  {page} ({data['path']}), {report['runs']} runs:")
+        for metric, stats in data["summary"].items():
+            if stats["samples"]:
+                label = f" [{stats['rating']}]" if stats.get("rating") else ""
+                print(f"    {metric:<13} p50={stats['p50']:.3f} p75={stats['p75']:.3f} max={stats['max']:.3f}{label}")
+
+
+def write_report(report, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as handle:
+        json.dump(report, handle, indent=2)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--pages", default=",".join(PAGES))
+    parser.add_argument("--cold", action="store_true", help="disable the HTTP cache for every load")
+    parser.add_argument("--output", default=os.path.join(REPORTS_DIR, "vitals.json"))
+    args = parser.parse_args(argv)
+
+    driver = create_driver()
+    try:
+        driver.get(base_url())
+        snapshot = driver.execute_script("return localStorage.getItem(arguments[0])", AUTH_KEY)
+        driver.execute_script("localStorage.removeItem(arguments[0])", AUTH_KEY)
+        report = collect_vitals(driver, args.runs, args.pages.split(","), cold=args.cold)
+        driver.execute_script("arguments[1] === null ? localStorage.removeItem(arguments[0])"
+                              " : localStorage.setItem(arguments[0], arguments[1])", AUTH_KEY, snapshot)
+    finally:
+        driver.quit()
+    print_report(report)
+    print(f"Report written to {write_report(report, args.output)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())